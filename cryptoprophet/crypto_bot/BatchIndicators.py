@@ -0,0 +1,179 @@
+#@formatter:off
+"""
+Vectorized technical indicators over (time x symbol) blocks.
+
+Market scans used to loop over symbols and call pandas-ta on one DataFrame
+at a time. The functions here take 2-D arrays, e.g. DatasetCatalog.block(),
+and compute an indicator for every column in one pass, with the same
+definitions and defaults as pandas-ta (0.3.14b) and as the streaming
+versions in Indicators:
+
+    > sma, ema, rsi, macd, atr, bbands, vwap
+
+NaN warm-up: each column gets the result pandas-ta gives for that symbol's
+own series. Leading NaN (a symbol listed later than others) are not data,
+so an indicator's warm-up starts at the column's first value. NaN inside a
+column propagate the way they do in pandas-ta.
+
+*** NOTE: Inputs are float arrays of shape (time, symbol), oldest row first;
+          a 1-D array is treated as a single symbol.
+
+VERSION: 0.0.1
+    - ADDED     : SMA, EMA, RSI, MACD, ATR, BBands, VWAP over 2-D blocks
+
+KNOWN ISSUES:
+    - Non encountered
+
+
+AUTHOR                      :   Mohammad Odeh
+DATE                        :   Oct. 18th, 2026 Year of Our Lord
+LAST CONTRIBUTION DATE      :   Oct. 18th, 2026 Year of Our Lord
+"""
+
+from    typing                      import  Tuple                           # Additional type hints
+import  numpy                       as      np                              # Blocks
+import  pandas                      as      pd                              # Column-wise ewm kernels
+from    numpy.lib.stride_tricks     import  sliding_window_view             # Rolling windows without copies
+
+from    Indicators                  import  ANCHORS                         # VWAP anchor -> period
+from    CandlePyramid               import  bucket                          # ...
+
+
+def _block( x: np.ndarray ) -> np.ndarray:
+    x = np.asarray( x, dtype = float )
+    return x[ :, None ] if x.ndim == 1 else x
+
+
+def _frame( x: np.ndarray ) -> pd.DataFrame:
+    return pd.DataFrame( x, copy = False )
+
+
+def first_valid( x: np.ndarray ) -> np.ndarray:
+    """
+    :return: Row of the first non-NaN value of every column (len(x) if none)
+    """
+    valid = ~np.isnan( _block( x ) )
+    return np.where( valid.any( axis = 0 ), valid.argmax( axis = 0 ), len( valid ) )
+
+
+def _shift( x: np.ndarray ) -> np.ndarray:
+    out       = np.empty_like( x )
+    out[ 0 ]  = np.nan
+    out[ 1: ] = x[ :-1 ]
+    return out
+
+
+def _rolling( x: np.ndarray, length: int, fn ) -> np.ndarray:
+    """
+    :param fn: Reduces a (time - length + 1, symbol, length) window view over its last axis.
+    :return: fn of every full window, NaN for the first length - 1 rows
+    """
+    out = np.full( x.shape, np.nan )
+    if len( x ) >= length:
+        out[ length - 1: ] = fn( sliding_window_view( x, length, axis = 0 ) )
+    return out
+
+
+def _rma( x: np.ndarray, length: int ) -> np.ndarray:
+    return _frame( x ).ewm( alpha = 1.0 / length, min_periods = length ).mean().to_numpy()
+
+
+# ------------------------- ___START___: sma --------------------------
+def sma( close: np.ndarray, length: int = 10 ) -> np.ndarray:
+    """
+    :return: Simple moving average, SMA_<length>
+    """
+    return _rolling( _block( close ), length, lambda w: w.mean( axis = -1 ) )
+
+
+# ------------------------- ___START___: ema --------------------------
+def ema( close: np.ndarray, length: int = 10 ) -> np.ndarray:
+    """
+    :return: Exponential moving average seeded with the SMA of each column's
+             first length values, EMA_<length>
+    """
+    x      = _block( close ).copy()
+    t, n   = x.shape
+    first  = first_valid( x )
+    seed   = first + length - 1                                             # Row of the first EMA value
+    cols   = np.flatnonzero( seed < t )
+    rows   = first[ cols ][ None, : ] + np.arange( length )[ :, None ]
+    x[ np.arange( t )[ :, None ] < seed[ None, : ] ] = np.nan               # Warm-up
+    x[ seed[ cols ], cols ] = np.nanmean( _block( close )[ rows, cols ], axis = 0 )
+    return _frame( x ).ewm( span = length, adjust = False ).mean().to_numpy()
+
+
+# ------------------------- ___START___: rsi --------------------------
+def rsi( close: np.ndarray, length: int = 14 ) -> np.ndarray:
+    """
+    :return: Relative strength index [0, 100], RSI_<length>
+    """
+    change = np.diff( _block( close ), axis = 0, prepend = np.nan )
+    gain   = _rma( np.where( change < 0, 0.0, change ), length )            # NaN stay NaN
+    loss   = _rma( np.where( change > 0, 0.0, -change ), length )
+    with np.errstate( invalid = 'ignore', divide = 'ignore' ):
+        return 100.0 * gain / ( gain + loss )
+
+
+# ------------------------- ___START___: macd -------------------------
+def macd( close: np.ndarray, fast: int = 12, slow: int = 26, signal: int = 9 ) -> Tuple[np.ndarray, ...]:
+    """
+    :return: (MACD_f_s_g, MACDh_f_s_g, MACDs_f_s_g); the signal line starts
+             at each column's first MACD value
+    """
+    if slow < fast:
+        fast, slow = slow, fast
+    line    = ema( close, fast ) - ema( close, slow )
+    average = ema( line, signal )
+    return line, line - average, average
+
+
+# ------------------------- ___START___: atr --------------------------
+def atr( high: np.ndarray, low: np.ndarray, close: np.ndarray, length: int = 14 ) -> np.ndarray:
+    """
+    :return: Average true range (RMA), ATRr_<length>
+    """
+    high, low = _block( high ), _block( low )
+    prev      = _shift( _block( close ) )
+    true      = np.maximum( high - low, np.maximum( np.abs( high - prev ), np.abs( prev - low ) ) )
+    return _rma( true, length )                                             # NaN where there is no previous close
+
+
+# ------------------------ ___START___: bbands ------------------------
+def bbands( close: np.ndarray, length: int = 5, std: float = 2.0, ddof: int = 0 ) -> Tuple[np.ndarray, ...]:
+    """
+    :return: (BBL, BBM, BBU, BBB, BBP)_<length>_<std>: lower, mid, upper,
+             bandwidth [%] and %B
+    """
+    x       = _block( close )
+    ddof    = ddof if 0 <= ddof < length else 1
+    mid     = sma( x, length )
+    width   = std * np.sqrt( _rolling( x, length, lambda w: w.var( axis = -1, ddof = ddof ) ) )
+    lower, upper = mid - width, mid + width
+    with np.errstate( invalid = 'ignore', divide = 'ignore' ):
+        return lower, mid, upper, 100.0 * ( upper - lower ) / mid, ( x - lower ) / ( upper - lower )
+
+
+# ------------------------- ___START___: vwap -------------------------
+def vwap( times: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, volume: np.ndarray,
+          anchor: str = 'D' ) -> np.ndarray:
+    """
+    :param times: Bar times [epoch sec], one per row.
+    :param anchor: Reset period: "H", "D", "W" or "M" (UTC).
+    :return: Volume weighted typical price since the start of the period, VWAP_<anchor>
+    """
+    volume  = _block( volume )
+    price   = ( _block( high ) + _block( low ) + _block( close ) ) / 3.0 * volume
+    missing = np.isnan( price )
+    period  = bucket( np.asarray( times, dtype = float ), ANCHORS[ anchor ] )
+    starts  = np.flatnonzero( np.r_[ True, period[ 1: ] != period[ :-1 ] ] )
+
+    def running( x: np.ndarray ) -> np.ndarray:                             # Cumulative sum within each period
+        total = np.cumsum( np.where( missing, 0.0, x ), axis = 0 )
+        base  = np.vstack( [ np.zeros( ( 1, x.shape[ 1 ] ) ), total[ starts[ 1: ] - 1 ] ] )
+        return total - np.repeat( base, np.diff( np.r_[ starts, len( x ) ] ), axis = 0 )
+
+    with np.errstate( invalid = 'ignore', divide = 'ignore' ):
+        out = running( price ) / running( volume )
+    out[ missing ] = np.nan
+    return out
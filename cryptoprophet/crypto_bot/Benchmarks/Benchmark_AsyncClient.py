@@ -0,0 +1,69 @@
+#@formatter:off
+"""
+Watchlist fan-out benchmark: serial CoinbaseClient vs. AsyncCoinbaseClient.
+
+Fetches the spot price of n pairs from a local HTTPS stand-in server with an
+artificial per-request latency. First one blocking get_price() call after
+the other, then in a single get_prices() batch at several concurrency limits.
+
+Usage:
+    python Benchmark_AsyncClient.py [n_pairs] [latency_ms]
+
+AUTHOR                      :   Mohammad Odeh
+DATE                        :   Oct. 18th, 2026 Year of Our Lord
+LAST CONTRIBUTION DATE      :   Oct. 18th, 2026 Year of Our Lord
+"""
+
+from    os                          import  path, environ                   # Path manipulation, CA bundle
+from    time                        import  perf_counter                    # Get time
+import  asyncio                                                             # Asynchronous routines
+import  sys                                                                 # Command line arguments
+
+sys.path.insert( 0, path.dirname( path.dirname( path.abspath(__file__) ) ) )# Make crypto_bot importable
+from    CoinbaseClient              import  CoinbaseClient
+from    CoinbaseAsync               import  AsyncCoinbaseClient
+from    CoinbaseRateLimit           import  RateLimiter
+from    LocalRestServer             import  LocalRestServer
+
+KEY, SECRET = 'a' * 16, 'b' * 32                                            # Pass v2 validation
+UNLIMITED   = RateLimiter( rate = None )                                    # Measure the client, not the limiter
+
+
+async def fan_out( url: str, pairs: list, concurrency: int ) -> float:
+    """
+    :return: Time to fetch every price in one batch [sec].
+    """
+    async with AsyncCoinbaseClient( KEY, SECRET, url = url, concurrency = concurrency,
+                                    limiter = UNLIMITED ) as client:
+        await client.get_price( pairs[0] )                                  # Warm up a connection
+        t0     = perf_counter()
+        prices = await client.get_prices( pairs )
+        dt     = perf_counter() - t0
+    assert not any( isinstance( p, Exception ) for p in prices.values() ), prices
+    return dt
+
+
+#%% ----------------- ___START___: Setup script and run -----------------
+
+if __name__ == '__main__':
+    n_pairs = int( sys.argv[1] )   if len( sys.argv ) > 1 else 100
+    latency = float( sys.argv[2] ) if len( sys.argv ) > 2 else 20.0
+    pairs   = [ f'C{i:03d}-USD' for i in range( n_pairs ) ]
+
+    with LocalRestServer( latency = latency * 1e-3 ) as server:
+        environ[ 'REQUESTS_CA_BUNDLE' ] = server.cafile                     # Trust the stub's certificate
+
+        client = CoinbaseClient( KEY, SECRET, url = server.url, limiter = UNLIMITED )
+        client.get_price( pairs[0] )                                        # Warm up a connection
+        t0 = perf_counter()
+        for pair in pairs:
+            client.get_price( pair )
+        serial = perf_counter() - t0
+        print( f'{n_pairs} pairs, {latency:.0f} ms server latency' )
+        print( f'serial get_price        : {serial * 1e3:8.1f} ms' )
+
+        for concurrency in ( 4, 16, 32 ):
+            dt = asyncio.run( fan_out( server.url, pairs, concurrency ) )
+            print( f'get_prices (limit {concurrency:>2})   : {dt * 1e3:8.1f} ms  ({serial / dt:.1f}x)' )
+
+#   ----------------- ___ END ___: Setup script and run -----------------
@@ -0,0 +1,60 @@
+#@formatter:off
+"""
+Overflow policy benchmark of the websocket consumer loop.
+
+A local stand-in server streams ticker frames faster than a deliberately
+slow handler can process them. For each overflow policy the benchmark
+prints the FeedMetrics report: frames handled and dropped, queue depth
+high-water mark, exchange-to-receive lag and handler times.
+
+Usage:
+    python Benchmark_Backpressure.py [n_messages] [rate|0] [handler_ms]
+
+AUTHOR                      :   Mohammad Odeh
+DATE                        :   Oct. 18th, 2026 Year of Our Lord
+LAST CONTRIBUTION DATE      :   Oct. 18th, 2026 Year of Our Lord
+"""
+
+from    os                          import  path                            # Path manipulation
+from    time                        import  perf_counter                    # Get time
+import  asyncio                                                             # Asynchronous routines
+import  sys                                                                 # Command line arguments
+import  orjson                                                              # Fast, efficient JSON parser
+
+sys.path.insert( 0, path.dirname( path.dirname( path.abspath(__file__) ) ) )# Make crypto_bot importable
+from    CoinbaseAPI                 import  Websocket
+from    LocalFeedServer             import  LocalFeedServer
+
+
+async def run( url: str, overflow: str, handler_ms: float ) -> Websocket:
+    """
+    Consume the feed with a slow ticker handler until the server is done.
+    """
+    ws = Websocket( url, queue_size = 1_000, reconnect = False, overflow = overflow )
+
+    async def on_ticker( msg ):
+        await asyncio.sleep( handler_ms * 1e-3 )                            # Slow, e.g. waiting on a database write
+
+    ws.register_handler( 'ticker', on_ticker )
+    req = { 'type': 'subscribe', 'product_ids': ['BTC-USD', 'ETH-USD', 'SOL-USD'], 'channels': ['ticker'] }
+    await ws.connect( orjson.dumps( req ) )
+    return ws
+
+
+#%% ----------------- ___START___: Setup script and run -----------------
+
+if __name__ == '__main__':
+    n_messages = int( sys.argv[1] )   if len( sys.argv ) > 1 else 20_000
+    rate       = float( sys.argv[2] ) if len( sys.argv ) > 2 else 0         # 0: as fast as possible
+    handler_ms = float( sys.argv[3] ) if len( sys.argv ) > 3 else 1.0
+
+    for overflow in Websocket.OVERFLOW:
+        with LocalFeedServer( n_messages = n_messages, rate = rate or None ) as server:
+            t0 = perf_counter()
+            ws = asyncio.run( run( server.url, overflow, handler_ms ) )
+            elapsed = perf_counter() - t0
+        print( f'--- {overflow} ({elapsed:.1f} s) ---' )
+        print( ws.metrics.report( ws.feed_metrics() ) )
+        print( f'handled           : {ws.metrics.counts["ticker"]:,} / {n_messages:,}\n' )
+
+#   ----------------- ___ END ___: Setup script and run -----------------
@@ -0,0 +1,124 @@
+#@formatter:off
+"""
+Market scan indicators: per-symbol loop vs. one pass over a 2-D block.
+
+Derives synthetic symbols from data/sample.csv (rescaled prices with their
+own noise, listed at different dates, i.e. leading NaN in the block) and
+computes the default indicator set for all of them:
+
+    > per-symbol loop with pandas-ta on one DataFrame at a time (if installed)
+    > per-symbol loop over the columns with BatchIndicators
+    > BatchIndicators once over the whole (time x symbol) block
+
+Results of a sample of symbols are checked against the streaming
+Indicators fed that symbol's own bars, which follow pandas-ta, including
+the NaN warm-up.
+
+Usage:
+    python Benchmark_BatchIndicators.py [n_symbols]
+
+AUTHOR                      :   Mohammad Odeh
+DATE                        :   Oct. 18th, 2026 Year of Our Lord
+LAST CONTRIBUTION DATE      :   Oct. 18th, 2026 Year of Our Lord
+"""
+
+from    os                          import  path                            # Path manipulation
+from    time                        import  perf_counter                    # Get time
+import  sys                                                                 # Command line arguments
+import  numpy                       as      np                              # Blocks
+import  pandas                      as      pd                              # sample.csv
+
+try:
+    import  pandas_ta               as      ta                              # Per-symbol baseline
+except ImportError:
+    ta = None
+
+sys.path.insert( 0, path.dirname( path.dirname( path.abspath(__file__) ) ) )# Make crypto_bot importable
+import  BatchIndicators             as      bi
+from    Indicators                  import  IndicatorEngine
+
+SAMPLE  = path.join( path.dirname( path.abspath(__file__) ), '..', '..', '..', 'data', 'sample.csv' )
+
+
+def synthetic( df: pd.DataFrame, n: int, rng: np.random.Generator ) -> dict:
+    """
+    :return: Column -> (time x n) block derived from sample.csv
+    """
+    t      = len( df )
+    scale  = 10.0 ** rng.uniform( -3, 1, n )
+    noise  = np.exp( np.cumsum( rng.normal( 0, 0.01, ( t, n ) ), axis = 0 ) )
+    factor = scale * noise
+    listed = np.arange( t )[ :, None ] < rng.integers( 0, t // 2, n )[ None, : ]
+    block  = { c: df[ c ].to_numpy()[ :, None ] * factor for c in ( 'High', 'Low', 'Open', 'Close' ) }
+    block[ 'Volume' ] = df[ 'Volume' ].to_numpy()[ :, None ] * rng.uniform( 0.01, 1, n )
+    for values in block.values():
+        values[ listed ] = np.nan
+    block[ 'High' ] = np.maximum( block[ 'High' ], np.maximum( block[ 'Open' ], block[ 'Close' ] ) )
+    block[ 'Low'  ] = np.minimum( block[ 'Low'  ], np.minimum( block[ 'Open' ], block[ 'Close' ] ) )
+    return block
+
+
+def batch( times: np.ndarray, b: dict ) -> dict:
+    """
+    :return: pandas-ta column -> (time x symbol) block
+    """
+    out = { 'SMA_10': bi.sma( b[ 'Close' ] ), 'EMA_10': bi.ema( b[ 'Close' ] ), 'RSI_14': bi.rsi( b[ 'Close' ] ),
+            'ATRr_14': bi.atr( b[ 'High' ], b[ 'Low' ], b[ 'Close' ] ),
+            'VWAP_D': bi.vwap( times, b[ 'High' ], b[ 'Low' ], b[ 'Close' ], b[ 'Volume' ] ) }
+    out.update( zip( ( 'MACD_12_26_9', 'MACDh_12_26_9', 'MACDs_12_26_9' ), bi.macd( b[ 'Close' ] ) ) )
+    out.update( zip( ( f'BB{c}_5_2.0' for c in 'LMUBP' ), bi.bbands( b[ 'Close' ] ) ) )
+    return out
+
+
+def per_symbol_ta( index: pd.DatetimeIndex, b: dict ) -> None:
+    for j in range( b[ 'Close' ].shape[ 1 ] ):
+        df = pd.DataFrame( { c: v[ :, j ] for c, v in b.items() }, index = index ).dropna()
+        c, h, l, v = df[ 'Close' ], df[ 'High' ], df[ 'Low' ], df[ 'Volume' ]
+        pd.concat( [ ta.sma( c ), ta.ema( c ), ta.rsi( c ), ta.macd( c ), ta.atr( h, l, c ),
+                     ta.bbands( c ), ta.vwap( h, l, c, v ) ], axis = 1 )
+
+
+def best( fn, repeat: int = 3 ) -> float:
+    """
+    :return: Fastest of several runs [ms]
+    """
+    times = []
+    for _ in range( repeat ):
+        t0 = perf_counter()
+        fn()
+        times.append( perf_counter() - t0 )
+    return min( times ) * 1e3
+
+
+#%% ----------------- ___START___: Setup script and run -----------------
+
+if __name__ == '__main__':
+    n_symbols = int( sys.argv[1] ) if len( sys.argv ) > 1 else 500
+    rng       = np.random.default_rng( 0 )
+
+    df    = pd.read_csv( SAMPLE, parse_dates = [ 'Date' ], index_col = 'Date' )
+    times = df.index.values.astype( 'datetime64[s]' ).astype( np.int64 ).astype( float )
+    block = synthetic( df, n_symbols, rng )
+    print( f'{n_symbols} symbols x {len(df):,} daily bars derived from sample.csv' )
+
+    result = batch( times, block )
+    for j in rng.choice( n_symbols, 10, replace = False ):                  # Check against the streaming engine
+        rows   = ~np.isnan( block[ 'Close' ][ :, j ] )
+        bars   = np.column_stack( [ times ] + [ block[ c ][ :, j ] for c in ( 'High', 'Low', 'Open', 'Close', 'Volume' ) ] )
+        engine = IndicatorEngine()
+        ref    = pd.DataFrame( [ engine.on_bar( 'S', '1d', bar ) for bar in bars[ rows ].tolist() ] )
+        for name, values in result.items():
+            got = values[ rows, j ]
+            assert np.array_equal( np.isnan( got ), ref[ name ].isna() ), name
+            assert np.allclose( got, ref[ name ], rtol = 1e-8, equal_nan = True ), name
+    print( f'  {len(result)} columns match the streaming indicators (warm-up and values, 10 symbols)' )
+
+    if ta is not None:
+        print( f'  per-symbol pandas-ta     : {best( lambda: per_symbol_ta( df.index, block ), 1 ):8.0f} ms' )
+    single = lambda: [ batch( times, { c: v[ :, j:j + 1 ] for c, v in block.items() } ) for j in range( n_symbols ) ]
+    loop   = best( single, 1 )
+    vector = best( lambda: batch( times, block ) )
+    print( f'  per-symbol loop          : {loop:8.0f} ms' )
+    print( f'  one block                : {vector:8.0f} ms  ({loop / vector:.0f}x)' )
+
+#   ----------------- ___ END ___: Setup script and run -----------------
@@ -0,0 +1,99 @@
+#@formatter:off
+"""
+Response cache: a polling loop with and without it, and stale-while-revalidate.
+
+A bot loop asks for currencies, products, fees, the user, the accounts and
+a ticker on every iteration, against a local HTTPS stand-in server with an
+artificial per-request latency. Run once without a cache and once with the
+default ResponseCache (accounts and ticker are not cached), reporting loop
+time and the requests that reached the server.
+
+Then polls fees with a short TTL, once with a stale window (refreshed in
+the background) and once without (every expiry blocks a caller), and
+reports the caller's latency.
+
+Usage:
+    python Benchmark_Cache.py [n_loops] [latency_ms]
+
+AUTHOR                      :   Mohammad Odeh
+DATE                        :   Oct. 18th, 2026 Year of Our Lord
+LAST CONTRIBUTION DATE      :   Oct. 18th, 2026 Year of Our Lord
+"""
+
+from    os                          import  path, environ                   # Path manipulation, CA bundle
+from    time                        import  perf_counter, sleep             # Get time
+import  sys                                                                 # Command line arguments
+import  numpy                       as      np                              # Percentiles
+
+sys.path.insert( 0, path.dirname( path.dirname( path.abspath(__file__) ) ) )# Make crypto_bot importable
+from    CoinbaseAuth                import  CoinbaseAuthClient
+from    CoinbaseCache               import  ResponseCache
+from    CoinbaseRateLimit           import  RateLimiter
+from    LocalRestServer             import  LocalRestServer
+
+ENDPOINTS = ( 'currencies', 'products', 'fees', 'user', 'accounts', 'products/BTC-USD/ticker' )
+
+
+def client_for( url: str, cache: ResponseCache = None ) -> CoinbaseAuthClient:
+    client     = CoinbaseAuthClient( 'a' * 16, 'b' * 32, limiter = RateLimiter( rate = None ), cache = cache )
+    client.url = url
+    return client
+
+
+def server_requests( client: CoinbaseAuthClient ) -> int:
+    return client.api_call( 'GET', '_stats', result = 'raw' )[ 'requests' ]
+
+
+def poll( client: CoinbaseAuthClient, n: int ) -> tuple:
+    """
+    :return: (loop time [ms] per iteration, requests that reached the server)
+    """
+    before  = server_requests( client )
+    latency = np.empty( n )
+    for i in range( n ):
+        t0 = perf_counter()
+        for uri in ENDPOINTS:
+            client.api_call( 'GET', uri, result = 'raw' )
+        latency[ i ] = perf_counter() - t0
+    return latency * 1e3, server_requests( client ) - before - 1
+
+
+def poll_fees( client: CoinbaseAuthClient, duration: float ) -> np.ndarray:
+    """
+    :return: Latency of each fees call [ms], polled every 5 ms
+    """
+    latency, t_end = [], perf_counter() + duration
+    while perf_counter() < t_end:
+        t0 = perf_counter()
+        client.api_call( 'GET', 'fees', result = 'raw' )
+        latency.append( perf_counter() - t0 )
+        sleep( 0.005 )
+    return np.array( latency ) * 1e3
+
+
+#%% ----------------- ___START___: Setup script and run -----------------
+
+if __name__ == '__main__':
+    n       = int( sys.argv[1] )   if len( sys.argv ) > 1 else 200
+    latency = float( sys.argv[2] ) if len( sys.argv ) > 2 else 10.0
+
+    with LocalRestServer( latency = latency * 1e-3 ) as server:
+        environ[ 'REQUESTS_CA_BUNDLE' ] = server.cafile                     # Trust the stub's certificate
+
+        print( f'{n} loops over {len(ENDPOINTS)} endpoints, {latency:.0f} ms server latency' )
+        for name, cache in ( ( 'no cache', None ), ( 'cache', ResponseCache() ) ):
+            client      = client_for( server.url, cache )
+            lat, served = poll( client, n )
+            print( f'  {name:<9}: loop p50={np.median(lat):6.1f} ms  p99={np.percentile(lat, 99):6.1f} ms  '
+                   f'server requests={served:,}' )
+        print( f'  cache stats: {cache.stats()}' )
+
+        print( 'fees polled for 2 s, TTL 50 ms (ms)' )
+        for name, stale in ( ( 'stale window 60 s', 60.0 ), ( 'no stale window', 0.0 ) ):
+            cache = ResponseCache( ttls = { 'fees': ( 0.05, stale ) } )
+            lat   = poll_fees( client_for( server.url, cache ), 2.0 )
+            print( f'  {name:<17}: p50={np.median(lat):6.2f}  p99={np.percentile(lat, 99):6.2f}  '
+                   f'max={lat.max():6.2f}  blocking misses={cache.counts["misses"]}  '
+                   f'background refreshes={cache.counts["refreshes"]}' )
+
+#   ----------------- ___ END ___: Setup script and run -----------------
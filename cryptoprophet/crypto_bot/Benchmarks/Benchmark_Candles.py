@@ -0,0 +1,83 @@
+#@formatter:off
+"""
+Historical candle download: one chunk at a time vs. concurrent, and resume.
+
+Downloads days of 1 minute candles of several products from a local HTTPS
+stand-in server (300 bars per request, artificial per-request latency) into
+a temporary OHLCVStore, first with one request in flight, then with several.
+Finally interrupts a fresh download part way through and resumes it,
+counting the chunks the second run still had to fetch.
+
+Usage:
+    python Benchmark_Candles.py [n_products] [days] [latency_ms]
+
+AUTHOR                      :   Mohammad Odeh
+DATE                        :   Oct. 18th, 2026 Year of Our Lord
+LAST CONTRIBUTION DATE      :   Oct. 18th, 2026 Year of Our Lord
+"""
+
+from    os                          import  path, environ                   # Path manipulation, CA bundle
+from    time                        import  perf_counter                    # Get time
+import  tempfile                                                            # Throwaway stores
+import  asyncio                                                             # Asynchronous routines
+import  sys                                                                 # Command line arguments
+import  numpy                       as      np                              # Check the store
+
+sys.path.insert( 0, path.dirname( path.dirname( path.abspath(__file__) ) ) )# Make crypto_bot importable
+from    CandleDownloader            import  CandleDownloader
+from    CoinbaseAsync               import  AsyncCoinbaseClient
+from    CoinbaseRateLimit           import  RateLimiter
+from    OHLCVStore                  import  OHLCVStore
+from    LocalRestServer             import  LocalRestServer
+
+KEY, SECRET = 'a' * 16, 'b' * 32                                            # Pass v2 validation
+START       = 1_659_312_000                                                 # 2022-08-01T00:00:00Z
+
+
+async def download( url: str, directory: str, products: list, end: int, concurrency: int,
+                    interrupt: float = None ) -> tuple:
+    """
+    :return: (time [sec], product -> summary), summaries are None if interrupted
+    """
+    async with AsyncCoinbaseClient( KEY, SECRET, concurrency = concurrency,
+                                    limiter = RateLimiter( rate = None ) ) as client:
+        downloader = CandleDownloader( client, OHLCVStore( directory ), url = url )
+        t0 = perf_counter()
+        try:
+            result = await asyncio.wait_for( downloader.download_many( products, 60, START, end ), interrupt )
+        except asyncio.TimeoutError:                                        # Simulated Ctrl+C
+            result = None
+        return perf_counter() - t0, result
+
+
+#%% ----------------- ___START___: Setup script and run -----------------
+
+if __name__ == '__main__':
+    n_products = int( sys.argv[1] )   if len( sys.argv ) > 1 else 4
+    days       = float( sys.argv[2] ) if len( sys.argv ) > 2 else 7.0
+    latency    = float( sys.argv[3] ) if len( sys.argv ) > 3 else 20.0
+    products   = [ f'C{i:02d}-USD' for i in range( n_products ) ]
+    end        = START + int( days * 86400 )
+
+    with LocalRestServer( latency = latency * 1e-3 ) as server:
+        environ[ 'REQUESTS_CA_BUNDLE' ] = server.cafile                     # Trust the stub's certificate
+        print( f'{n_products} products, {days:g} days of 1m candles, {latency:.0f} ms server latency' )
+
+        for concurrency in ( 1, 4, 16 ):
+            with tempfile.TemporaryDirectory() as directory:
+                dt, result = asyncio.run( download( server.url, directory, products, end, concurrency ) )
+                summary    = result[ products[0] ]
+                candles    = OHLCVStore( directory ).load( products[0], 60 )
+                assert np.all( np.diff( candles[ 'Date' ] ) > 0 ) and summary[ 'failed' ] == 0
+                print( f'  {concurrency:>2} in flight : {dt * 1e3:7.0f} ms  '
+                       f'{summary["chunks"] * n_products} requests, {summary["candles"]:,} candles/product' )
+
+        with tempfile.TemporaryDirectory() as directory:
+            dt, _      = asyncio.run( download( server.url, directory, products, end, 4, interrupt = 0.5 ) )
+            _, result  = asyncio.run( download( server.url, directory, products, end, 4 ) )
+            fetched    = sum( r[ 'fetched' ] for r in result.values() )
+            skipped    = sum( r[ 'skipped' ] for r in result.values() )
+            print( f'  interrupted after {dt * 1e3:.0f} ms, resumed: {skipped} chunks skipped, '
+                   f'{fetched} fetched, {result[products[0]]["candles"]:,} candles/product' )
+
+#   ----------------- ___ END ___: Setup script and run -----------------
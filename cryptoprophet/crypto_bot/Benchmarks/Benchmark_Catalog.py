@@ -0,0 +1,105 @@
+#@formatter:off
+"""
+Aligned multi-symbol queries: pandas outer join vs. DatasetCatalog.
+
+Fills a temporary OHLCVStore with 1 minute bars of many symbols, listed at
+different times and each missing a share of its bars. Close and Volume of
+all symbols over a window are then aligned on a common time axis, once by
+joining per-symbol DataFrames already in memory (what cross-asset
+strategies did) and once by a DatasetCatalog block query. Also reports the
+cost of building the union index and of refreshing it after an append.
+
+Usage:
+    python Benchmark_Catalog.py [n_symbols] [days] [window_days]
+
+AUTHOR                      :   Mohammad Odeh
+DATE                        :   Oct. 18th, 2026 Year of Our Lord
+LAST CONTRIBUTION DATE      :   Oct. 18th, 2026 Year of Our Lord
+"""
+
+from    os                          import  path                            # Path manipulation
+from    time                        import  perf_counter                    # Get time
+import  tempfile                                                            # Throwaway stores
+import  sys                                                                 # Command line arguments
+import  numpy                       as      np                              # Synthetic bars
+import  pandas                      as      pd                              # Join baseline
+
+sys.path.insert( 0, path.dirname( path.dirname( path.abspath(__file__) ) ) )# Make crypto_bot importable
+from    OHLCVStore                  import  OHLCVStore
+from    DatasetCatalog              import  DatasetCatalog
+
+START   = 1_659_312_000                                                     # 2022-08-01T00:00:00Z
+COLUMNS = ( 'Date', 'Close', 'Volume' )
+
+
+def bars( t0: float, t1: float, rng: np.random.Generator, listed: float = 0.0, missing: float = 0.05 ) -> dict:
+    """
+    :return: 1 minute bars of [t0, t1), starting after a share `listed` of it, some missing
+    """
+    t = np.arange( t0 + ( t1 - t0 ) * listed // 60 * 60, t1, 60.0 )
+    t = t[ rng.random( len( t ) ) > missing ]
+    return { 'Date': t, 'Close': 100 + np.cumsum( rng.normal( 0, 0.1, len( t ) ) ), 'Volume': rng.random( len( t ) ) }
+
+
+def joined( frames: dict, start: float, end: float ) -> tuple:
+    """
+    :return: (times, Close block, Volume block) by outer join
+    """
+    df = pd.concat( { s: f.loc[ start:end - 1 ] for s, f in frames.items() }, axis = 1, sort = True )
+    return df.index.values, df.xs( 'Close', axis = 1, level = 1 ).values, df.xs( 'Volume', axis = 1, level = 1 ).values
+
+
+def best( fn, repeat: int = 5 ) -> float:
+    """
+    :return: Fastest of several runs [ms]
+    """
+    times = []
+    for _ in range( repeat ):
+        t0 = perf_counter()
+        fn()
+        times.append( perf_counter() - t0 )
+    return min( times ) * 1e3
+
+
+#%% ----------------- ___START___: Setup script and run -----------------
+
+if __name__ == '__main__':
+    n_symbols   = int( sys.argv[1] )   if len( sys.argv ) > 1 else 50
+    days        = float( sys.argv[2] ) if len( sys.argv ) > 2 else 30.0
+    window_days = float( sys.argv[3] ) if len( sys.argv ) > 3 else 7.0
+    rng         = np.random.default_rng( 0 )
+    symbols     = [ f'C{i:02d}-USD' for i in range( n_symbols ) ]
+    end         = START + days * 86400
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = OHLCVStore( directory )
+        for i, symbol in enumerate( symbols ):
+            store.series( symbol, 60, COLUMNS ).append( bars( START, end, rng, listed = i / n_symbols / 2 ) )
+        frames  = { s: pd.DataFrame( { c: np.array( store.series( s, 60 )[ c ] ) for c in COLUMNS } ).set_index( 'Date' )
+                    for s in symbols }
+        print( f'{n_symbols} symbols, {days:g} days of 1m bars ({sum(map(len, frames.values())):,} bars), '
+               f'{window_days:g} day window' )
+
+        catalog = DatasetCatalog( store )
+        t0      = perf_counter()
+        catalog.refresh( 60 )
+        print( f'  build union index       : {( perf_counter() - t0 ) * 1e3:8.1f} ms  '
+               f'({catalog.index(60).rows:,} times)' )
+
+        t0, t1          = end - window_days * 86400, end
+        times, block    = catalog.block( symbols, 60, t0, t1 )
+        times_j, close, volume = joined( frames, t0, t1 )
+        assert np.array_equal( times, times_j ) and np.allclose( block[ 'Close' ], close, equal_nan = True )
+        print( f'  pandas outer join       : {best( lambda: joined( frames, t0, t1 ) ):8.2f} ms' )
+        print( f'  catalog block           : {best( lambda: catalog.block( symbols, 60, t0, t1 ) ):8.2f} ms  '
+               f'{block["Close"].shape} x 2' )
+        print( f'  catalog block, ffill    : '
+               f'{best( lambda: catalog.block( symbols, 60, t0, t1, ffill = True ) ):8.2f} ms' )
+
+        for symbol in symbols:                                              # Another hour of bars
+            store.series( symbol, 60 ).append( bars( end, end + 3600, rng ) )
+        t0 = perf_counter()
+        catalog.refresh( 60 )
+        print( f'  refresh after an hour   : {( perf_counter() - t0 ) * 1e3:8.1f} ms  {catalog.counts}' )
+
+#   ----------------- ___ END ___: Setup script and run -----------------
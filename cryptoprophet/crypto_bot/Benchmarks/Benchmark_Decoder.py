@@ -0,0 +1,112 @@
+#@formatter:off
+"""
+Decoding benchmark: generic dict path vs. typed records.
+
+Decodes a mixed frame stream (tickers, matches, level2 updates, heartbeats)
+with orjson.loads into dictionaries and with CoinbaseMessages.MessageDecoder,
+which drops unwanted frames unparsed and turns the rest into __slots__
+records. Reports CPU time and retained allocations (blocks and bytes, via
+tracemalloc) per message.
+
+Usage:
+    python Benchmark_Decoder.py [n_frames]
+
+AUTHOR                      :   Mohammad Odeh
+DATE                        :   Oct. 18th, 2026 Year of Our Lord
+LAST CONTRIBUTION DATE      :   Oct. 18th, 2026 Year of Our Lord
+"""
+
+from    os                          import  path                            # Path manipulation
+from    time                        import  perf_counter                    # Timer
+import  tracemalloc                                                         # Allocation counts
+import  random                                                              # Synthetic stream
+import  sys                                                                 # Command line arguments
+import  orjson                                                              # Fast, efficient JSON parser
+
+sys.path.insert( 0, path.dirname( path.dirname( path.abspath(__file__) ) ) )# Make crypto_bot importable
+from    CoinbaseMessages            import  MessageDecoder
+
+TIME = '2022-08-01T00:00:00.123456Z'
+
+
+def synthetic_frames( n: int ) -> list:
+    """
+    Mixed stream: 30% ticker, 10% match, 40% l2update, 20% heartbeat.
+    """
+    rng, frames = random.Random( 7 ), []
+    for i in range( n ):
+        r, price = rng.random(), f'{30_000 + rng.uniform(-50, 50):.2f}'
+        if r < 0.3:
+            msg = { 'type': 'ticker', 'sequence': i, 'product_id': 'BTC-USD', 'price': price,
+                    'open_24h': '29000.00', 'volume_24h': '12345.6789', 'low_24h': '28000.00',
+                    'high_24h': '31000.00', 'volume_30d': '456789.12', 'best_bid': price,
+                    'best_ask': price, 'side': 'buy', 'time': TIME, 'trade_id': i, 'last_size': '0.0123' }
+        elif r < 0.4:
+            msg = { 'type': 'match', 'trade_id': i, 'sequence': i, 'maker_order_id': 'a' * 36,
+                    'taker_order_id': 'b' * 36, 'time': TIME, 'product_id': 'BTC-USD',
+                    'size': '0.0123', 'price': price, 'side': 'sell' }
+        elif r < 0.8:
+            msg = { 'type': 'l2update', 'product_id': 'BTC-USD', 'time': TIME,
+                    'changes': [ ['buy', price, '0.5'], ['sell', price, '0.0'] ] }
+        else:
+            msg = { 'type': 'heartbeat', 'last_trade_id': i, 'product_id': 'BTC-USD',
+                    'sequence': i, 'time': TIME }
+        frames.append( orjson.dumps( msg ).decode() )                       # websockets yields str
+    return frames
+
+
+def loads_and_convert( frame: str ) -> dict:
+    """
+    Dict path plus the float conversions a handler would do itself.
+    """
+    msg = orjson.loads( frame )
+    if 'price' in msg:
+        msg[ 'price' ] = float( msg['price'] )
+        for key in ( 'best_bid', 'best_ask', 'last_size', 'size' ):
+            if key in msg:
+                msg[ key ] = float( msg[key] )
+    elif 'changes' in msg:
+        msg[ 'changes' ] = [ (side, float(price), float(size)) for side, price, size in msg['changes'] ]
+    return msg
+
+
+def measure( decode, frames: list ) -> tuple:
+    """
+    :return: (us per frame, retained blocks per frame, retained bytes per frame)
+    """
+    t0 = perf_counter()
+    for frame in frames:
+        decode( frame )
+    cpu = perf_counter() - t0
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    kept   = [ decode( frame ) for frame in frames ]                        # Keep what a handler would see
+    after  = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats  = after.compare_to( before, 'filename' )
+    blocks = sum( s.count_diff for s in stats )
+    size   = sum( s.size_diff  for s in stats )
+    n      = len( frames )
+    del kept
+    return 1e6 * cpu / n, blocks / n, size / n
+
+
+#%% ----------------- ___START___: Setup script and run -----------------
+
+if __name__ == '__main__':
+    n      = int( sys.argv[1] ) if len( sys.argv ) > 1 else 200_000
+    frames = synthetic_frames( n )
+
+    rows = { 'dict (orjson.loads)'          : orjson.loads,
+             'dict + float conversion'      : loads_and_convert,
+             'typed, all types wanted'      : MessageDecoder().decode,
+             'typed, ticker + match wanted' : MessageDecoder( ('ticker', 'match', 'last_match') ).decode }
+
+    print( f'{n:,} frames (30% ticker, 10% match, 40% l2update, 20% heartbeat)' )
+    print( f'{"path":<30}{"us/msg":>10}{"blocks/msg":>12}{"bytes/msg":>12}' )
+    for name, decode in rows.items():
+        cpu, blocks, size = measure( decode, frames )
+        print( f'{name:<30}{cpu:>10.3f}{blocks:>12.2f}{size:>12.1f}' )
+
+#   ----------------- ___ END ___: Setup script and run -----------------
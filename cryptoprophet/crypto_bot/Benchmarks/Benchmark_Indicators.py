@@ -0,0 +1,98 @@
+#@formatter:off
+"""
+Streaming indicators: pandas-ta recompute per bar vs. O(1) updates.
+
+Accuracy: every indicator of Indicators.DEFAULT is fed data/sample.csv one
+bar at a time and compared with pandas-ta over the whole file (max relative
+error and NaN warm-up).
+
+Per bar: cost of bringing all indicators up to date after one more bar,
+recomputing with pandas-ta over the history vs. one IndicatorEngine update.
+
+Throughput: many products with the default indicator set follow a
+CandleAggregator; reports the time to process one closed bar per product.
+
+The pandas-ta parts are skipped if it is not installed.
+
+Usage:
+    python Benchmark_Indicators.py [n_products]
+
+AUTHOR                      :   Mohammad Odeh
+DATE                        :   Oct. 18th, 2026 Year of Our Lord
+LAST CONTRIBUTION DATE      :   Oct. 18th, 2026 Year of Our Lord
+"""
+
+from    os                          import  path                            # Path manipulation
+from    time                        import  perf_counter                    # Get time
+import  sys                                                                 # Command line arguments
+import  numpy                       as      np                              # Bars
+import  pandas                      as      pd                              # sample.csv
+
+try:
+    import  pandas_ta               as      ta                              # Reference implementation
+except ImportError:
+    ta = None
+
+sys.path.insert( 0, path.dirname( path.dirname( path.abspath(__file__) ) ) )# Make crypto_bot importable
+from    Indicators                  import  IndicatorEngine
+from    CandleAggregator            import  CandleAggregator
+
+SAMPLE  = path.join( path.dirname( path.abspath(__file__) ), '..', '..', '..', 'data', 'sample.csv' )
+
+
+def reference( df: pd.DataFrame ) -> pd.DataFrame:
+    """
+    :return: pandas-ta columns of the default indicator set
+    """
+    c, h, l, v = df[ 'Close' ], df[ 'High' ], df[ 'Low' ], df[ 'Volume' ]
+    return pd.concat( [ ta.sma( c ), ta.ema( c ), ta.rsi( c ), ta.macd( c ), ta.atr( h, l, c ),
+                        ta.bbands( c ), ta.vwap( h, l, c, v ) ], axis = 1 )
+
+
+#%% ----------------- ___START___: Setup script and run -----------------
+
+if __name__ == '__main__':
+    n_products = int( sys.argv[1] ) if len( sys.argv ) > 1 else 1000
+
+    df   = pd.read_csv( SAMPLE, parse_dates = [ 'Date' ], index_col = 'Date' )
+    bars = np.column_stack( [ df.index.values.astype( 'datetime64[s]' ).astype( np.int64 ),
+                              df[ 'High' ], df[ 'Low' ], df[ 'Open' ], df[ 'Close' ], df[ 'Volume' ] ] ).astype( float )
+
+    engine = IndicatorEngine()
+    t0     = perf_counter()
+    rows   = [ engine.on_bar( 'BTC-USD', '1d', bar ) for bar in bars.tolist() ]
+    dt     = ( perf_counter() - t0 ) / len( bars )
+    got    = pd.DataFrame( rows, index = df.index )
+    print( f'sample.csv ({len(df):,} bars), {got.shape[1]} columns' )
+    print( f'  engine update           : {dt * 1e6:8.1f} us per bar' )
+
+    if ta is None:
+        print( '  pandas-ta not installed, skipping the comparison' )
+    else:
+        ref = reference( df )
+        for name in got.columns:
+            g, r = got[ name ], ref[ name ]
+            err  = np.nanmax( np.abs( g - r ) / np.abs( r ).clip( lower = 1e-12 ) )
+            print( f'  {name:<16}: warm-up {int(r.isna().sum()):3} bars '
+                   f'({"same" if ( g.isna() == r.isna() ).all() else "DIFFERENT"}), max rel. error {err:.1e}' )
+        t0 = perf_counter()
+        for _ in range( 10 ):
+            reference( df )
+        print( f'  pandas-ta recompute     : {( perf_counter() - t0 ) / 10 * 1e6:8.1f} us per bar '
+               f'({len(df):,} bars of history)' )
+
+    aggregator = CandleAggregator( { '1m': 60 }, max_bars = 500 )
+    engine     = IndicatorEngine()
+    engine.attach( aggregator )
+    products   = [ f'C{i:04d}-USD' for i in range( n_products ) ]
+    for minute in range( 100 ):                                             # Warm up and seed every pair
+        for product in products:
+            aggregator.update( product, minute * 60.0, 100 + np.sin( minute ), 1.0 )
+    t0 = perf_counter()
+    for product in products:                                                # Close one bar each
+        aggregator.update( product, 100 * 60.0, 100.0, 1.0 )
+    dt = perf_counter() - t0
+    print( f'{n_products:,} products x {len(engine.factories)} indicators following a CandleAggregator' )
+    print( f'  one closed bar each     : {dt * 1e3:8.1f} ms  ({dt / n_products * 1e6:.1f} us per product)' )
+
+#   ----------------- ___ END ___: Setup script and run -----------------
@@ -0,0 +1,97 @@
+#@formatter:off
+"""
+Replay benchmark of the level2 order book.
+
+Replays an l2update stream through CoinbaseOrderBook.OrderBooks and reports
+the sustained update rate, both including and excluding JSON decoding.
+
+The stream is either a FeedRecorder directory, a file with one raw frame per
+line, or a synthetic BTC-USD-like stream: a deep snapshot followed by batched changes
+clustered around the top of the book, a third of which remove a level.
+
+Usage:
+    python Benchmark_OrderBook.py [recording_directory | frames.jsonl]
+
+AUTHOR                      :   Mohammad Odeh
+DATE                        :   Oct. 18th, 2026 Year of Our Lord
+LAST CONTRIBUTION DATE      :   Oct. 18th, 2026 Year of Our Lord
+"""
+
+from    os                          import  path                            # Path manipulation
+from    time                        import  perf_counter                    # Timer
+import  random                                                              # Synthetic stream
+import  sys                                                                 # Command line arguments
+import  orjson                                                              # Fast, efficient JSON parser
+
+sys.path.insert( 0, path.dirname( path.dirname( path.abspath(__file__) ) ) )# Make crypto_bot importable
+from    CoinbaseOrderBook           import  OrderBooks
+from    FeedRecorder                import  FeedReplayer
+
+
+def synthetic_stream( n_updates: int = 200_000, n_levels: int = 20_000,
+                      batch: int = 8, mid: float = 30_000.0 ) -> list:
+    """
+    Build a synthetic level2_batch stream for BTC-USD.
+
+    :return: Raw frames (bytes), snapshot first.
+    """
+    rng  = random.Random( 42 )
+    bids = [ [f'{mid - 0.01 * i:.2f}', f'{rng.uniform(0.001, 2):.8f}'] for i in range( 1, n_levels + 1 ) ]
+    asks = [ [f'{mid + 0.01 * i:.2f}', f'{rng.uniform(0.001, 2):.8f}'] for i in range( 1, n_levels + 1 ) ]
+    frames = [ orjson.dumps( { 'type': 'snapshot', 'product_id': 'BTC-USD', 'bids': bids, 'asks': asks } ) ]
+
+    for _ in range( n_updates // batch ):
+        changes = []
+        for _ in range( batch ):
+            side   = 'buy' if rng.random() < 0.5 else 'sell'
+            ticks  = int( rng.expovariate( 1 / 50 ) ) + 1                   # Mostly close to the top
+            price  = mid - 0.01 * ticks if side == 'buy' else mid + 0.01 * ticks
+            size   = '0.00000000' if rng.random() < 0.33 else f'{rng.uniform(0.001, 2):.8f}'
+            changes.append( [side, f'{price:.2f}', size] )
+        frames.append( orjson.dumps( { 'type'       : 'l2update',
+                                       'product_id' : 'BTC-USD',
+                                       'changes'    : changes,
+                                       'time'       : '2022-08-01T00:00:00.000000Z' } ) )
+    return frames
+
+
+#%% ----------------- ___START___: Setup script and run -----------------
+
+if __name__ == '__main__':
+    if len( sys.argv ) > 1 and path.isdir( sys.argv[1] ):
+        frames = [ frame for _, frame in FeedReplayer( sys.argv[1] )
+                   if b'"snapshot"' in frame or b'"l2update"' in frame ]
+    elif len( sys.argv ) > 1:
+        with open( sys.argv[1], 'rb' ) as f:
+            frames = [ line for line in f if b'"snapshot"' in line or b'"l2update"' in line ]
+    else:
+        frames = synthetic_stream()
+
+    msgs      = [ orjson.loads( frame ) for frame in frames ]
+    n_changes = sum( len( m['changes'] ) for m in msgs if m['type'] == 'l2update' )
+
+    books = OrderBooks()
+    t0 = perf_counter()
+    for frame in frames:
+        books.apply( orjson.loads( frame ) )
+    t_decode = perf_counter() - t0
+
+    books = OrderBooks()
+    t0 = perf_counter()
+    for msg in msgs:
+        books.apply( msg )
+    t_apply = perf_counter() - t0
+
+    book = next( iter( books.books.values() ) )
+    t0 = perf_counter()
+    for _ in range( 100_000 ):
+        book.best_bid(); book.best_ask(); book.spread(); book.cumulative_size( 10 )
+    t_query = perf_counter() - t0
+
+    print( f'Frames / changes  : {len(frames):,} / {n_changes:,}' )
+    print( f'Apply only        : {n_changes / t_apply:,.0f} changes/s  ({1e6 * t_apply / n_changes:.2f} us/change)' )
+    print( f'Decode + apply    : {n_changes / t_decode:,.0f} changes/s  ({1e6 * t_decode / n_changes:.2f} us/change)' )
+    print( f'Top of book query : {1e6 * t_query / 100_000:.2f} us (best bid/ask, spread, depth-10 size)' )
+    print( f'Final book        : {len(book.bids):,} bids / {len(book.asks):,} asks, spread={book.spread():.2f}' )
+
+#   ----------------- ___ END ___: Setup script and run -----------------
@@ -0,0 +1,108 @@
+#@formatter:off
+"""
+Walking a paginated endpoint: everything up front vs. lazily page by page.
+
+Pulls every fill behind a local HTTPS stand-in server (CB-AFTER cursors,
+artificial per-request latency) while a consumer spends some time on each
+page. Compares collecting all pages before processing them, the lazy
+paginator, and the lazy paginator with prefetch, on time to the first row,
+total time and peak Python memory. Finally stops after the first few rows
+and counts the pages actually requested.
+
+Usage:
+    python Benchmark_Pagination.py [n_rows] [latency_ms] [work_ms]
+
+AUTHOR                      :   Mohammad Odeh
+DATE                        :   Oct. 18th, 2026 Year of Our Lord
+LAST CONTRIBUTION DATE      :   Oct. 18th, 2026 Year of Our Lord
+"""
+
+from    os                          import  path, environ                   # Path manipulation, CA bundle
+from    time                        import  perf_counter, sleep             # Get time, consumer work
+import  tracemalloc                                                         # Peak memory
+import  sys                                                                 # Command line arguments
+import  pandas                      as      pd                              # Eager path
+
+sys.path.insert( 0, path.dirname( path.dirname( path.abspath(__file__) ) ) )# Make crypto_bot importable
+from    CoinbaseAuth                import  CoinbaseAuthClient
+from    CoinbasePagination          import  next_url, with_query
+from    CoinbaseRateLimit           import  RateLimiter
+from    LocalRestServer             import  LocalRestServer
+
+
+def eager( client: CoinbaseAuthClient, work: float ):
+    """
+    Every page first, one DataFrame, then processing.
+
+    :return: Generator of row chunks, one per page
+    """
+    url, rows = with_query( client.url + 'fills', limit = 100 ), []
+    while url:
+        resp, data = client.fetch_page( url )
+        if not data:
+            break
+        rows.extend( data )
+        url = next_url( url, resp, data )
+    frame = pd.DataFrame.from_dict( rows )
+    for start in range( 0, len( frame ), 100 ):
+        sleep( work )
+        yield frame.iloc[ start:start + 100 ]
+
+
+def lazy( client: CoinbaseAuthClient, work: float, prefetch: bool ):
+    """
+    :return: Generator of pages, processed as they arrive
+    """
+    for page in client.paginate( 'fills', result = 'numpy', prefetch = prefetch ):
+        sleep( work )
+        yield page
+
+
+def run( pages ) -> tuple:
+    """
+    :return: (time to first page [sec], total time [sec], rows, peak memory [bytes])
+    """
+    tracemalloc.start()
+    t0, first, n = perf_counter(), None, 0
+    for page in pages:
+        if first is None:
+            first = perf_counter() - t0
+        n += len( page )
+    total = perf_counter() - t0
+    peak  = tracemalloc.get_traced_memory()[ 1 ]
+    tracemalloc.stop()
+    return first, total, n, peak
+
+
+#%% ----------------- ___START___: Setup script and run -----------------
+
+if __name__ == '__main__':
+    n_rows  = int( sys.argv[1] )   if len( sys.argv ) > 1 else 20_000
+    latency = float( sys.argv[2] ) if len( sys.argv ) > 2 else 5.0
+    work    = float( sys.argv[3] ) if len( sys.argv ) > 3 else 5.0
+
+    with LocalRestServer( latency = latency * 1e-3, n_rows = n_rows ) as server:
+        environ[ 'REQUESTS_CA_BUNDLE' ] = server.cafile                     # Trust the stub's certificate
+        client     = CoinbaseAuthClient( 'a' * 16, 'b' * 32, limiter = RateLimiter( rate = None ) )
+        client.url = server.url
+        client.api_call( 'GET', 'fees', result = 'raw' )                    # Warm up a connection
+
+        print( f'{n_rows:,} fills, {latency:.0f} ms per request, {work:.0f} ms of work per page' )
+        for name, walk in ( ( 'all pages first', lambda: eager( client, work * 1e-3 ) ),
+                            ( 'lazy'           , lambda: lazy( client, work * 1e-3, False ) ),
+                            ( 'lazy + prefetch', lambda: lazy( client, work * 1e-3, True ) ) ):
+            first, total, n, peak = run( walk() )
+            assert n == n_rows, ( name, n )
+            print( f'  {name:<16}: first rows {first * 1e3:7.1f} ms  total {total * 1e3:7.0f} ms  '
+                   f'peak memory {peak / 2**20:6.1f} MiB' )
+
+        for prefetch in ( False, True ):
+            before = client.api_call( 'GET', '_stats', result = 'raw' )[ 'requests' ]
+            for i, row in enumerate( client.iter_rows( 'fills', prefetch = prefetch ) ):
+                if i == 249:                                                # First 250 rows only
+                    break
+            sleep( 2 * latency * 1e-3 )                                     # Let a prefetch land
+            after = client.api_call( 'GET', '_stats', result = 'raw' )[ 'requests' ]
+            print( f'  stop after 250 rows (prefetch={prefetch!s:<5}): {after - before - 1} pages requested' )
+
+#   ----------------- ___ END ___: Setup script and run -----------------
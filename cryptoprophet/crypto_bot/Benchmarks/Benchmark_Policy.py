@@ -0,0 +1,126 @@
+#@formatter:off
+"""
+REST calls against a flaky and then a failing exchange, with and without policies.
+
+Flaky: a share of the requests of a local HTTPS stand-in server fail with
+503 and a few hang for seconds. Ticker polls go once through a bare
+session (no timeout, no retries, the previous behaviour) and once through
+CoinbaseAuthClient.api_call with a PolicyEngine (timeouts, retries);
+reports success rate and latency.
+
+Outage: every request fails with 503 while several threads keep polling
+(a ticker each, so nothing is coalesced). Once with retries only (breaker
+never opens) and once with the circuit breaker; reports the requests that
+still reached the server and the time threads spent blocked per call.
+
+Usage:
+    python Benchmark_Policy.py [n_calls] [error_rate] [hang_rate]
+
+AUTHOR                      :   Mohammad Odeh
+DATE                        :   Oct. 18th, 2026 Year of Our Lord
+LAST CONTRIBUTION DATE      :   Oct. 18th, 2026 Year of Our Lord
+"""
+
+from    contextlib                  import  redirect_stdout                 # api_call prints errors
+from    os                          import  path, environ, devnull          # Path manipulation, CA bundle
+from    time                        import  perf_counter                    # Get time
+import  threading                                                           # Pollers
+import  sys                                                                 # Command line arguments
+import  numpy                       as      np                              # Percentiles
+import  requests                                                            # Bare session
+
+sys.path.insert( 0, path.dirname( path.dirname( path.abspath(__file__) ) ) )# Make crypto_bot importable
+from    CoinbaseAuth                import  CoinbaseAuthClient
+from    CoinbasePolicy              import  PolicyEngine, Rule
+from    CoinbaseRateLimit           import  RateLimiter
+from    LocalRestServer             import  LocalRestServer
+
+TICKER  = 'products/BTC-USD/ticker'
+
+
+def client_for( url: str, policy: PolicyEngine ) -> CoinbaseAuthClient:
+    client     = CoinbaseAuthClient( 'a' * 16, 'b' * 32, limiter = RateLimiter( rate = None ), policy = policy )
+    client.url = url
+    return client
+
+
+def timed( fn, n: int ) -> tuple:
+    """
+    :return: (latency of each call [ms], calls that succeeded)
+    """
+    latency, ok = np.empty( n ), 0
+    for i in range( n ):
+        t0 = perf_counter()
+        try:
+            ok += fn()
+        except requests.RequestException:
+            pass
+        latency[ i ] = perf_counter() - t0
+    return latency * 1e3, ok
+
+
+def outage( client: CoinbaseAuthClient, n_threads: int, duration: float ) -> tuple:
+    """
+    :return: (calls made, mean time per call [ms])
+    """
+    calls, blocked, lock = [ 0 ], [ 0.0 ], threading.Lock()
+
+    def poll( i: int ) -> None:
+        t_end = perf_counter() + duration
+        while perf_counter() < t_end:
+            t0 = perf_counter()
+            try:
+                client.api_call( 'GET', f'products/C{i:02d}-USD/ticker', result = 'raw' )
+            except requests.RequestException:
+                pass
+            with lock:
+                calls[ 0 ]   += 1
+                blocked[ 0 ] += perf_counter() - t0
+
+    threads = [ threading.Thread( target = poll, args = (i,) ) for i in range( n_threads ) ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return calls[ 0 ], blocked[ 0 ] / calls[ 0 ] * 1e3
+
+
+#%% ----------------- ___START___: Setup script and run -----------------
+
+if __name__ == '__main__':
+    n          = int( sys.argv[1] )   if len( sys.argv ) > 1 else 300
+    error_rate = float( sys.argv[2] ) if len( sys.argv ) > 2 else 0.2
+    hang_rate  = float( sys.argv[3] ) if len( sys.argv ) > 3 else 0.02
+    quick      = Rule( connect = 1.0, read = 0.5, retries = 3, backoff = 0.05, cap = 0.4, deadline = 2.0 )
+
+    with LocalRestServer( latency = 0.005 ) as server:
+        environ[ 'REQUESTS_CA_BUNDLE' ] = server.cafile                     # Trust the stub's certificate
+        bare   = requests.Session()
+        client = client_for( server.url, PolicyEngine( rules = { '': quick } ) )
+        bare.get( server.url + TICKER, auth = client ), client.api_call( 'GET', TICKER, result = 'raw' )
+
+        server.set_chaos( error_rate = error_rate, status = 503, hang_rate = hang_rate, hang = 3.0 )
+        print( f'flaky: {error_rate:.0%} 503s, {hang_rate:.0%} hang 3 s, {n} ticker polls' )
+        with open( devnull, 'w' ) as null, redirect_stdout( null ):
+            rows = [ ( 'bare session', timed( lambda: bare.get( server.url + TICKER, auth = client ).ok, n ) ),
+                     ( 'policy'      , timed( lambda: client.api_call( 'GET', TICKER, result = 'raw' ) is not None, n ) ) ]
+        for name, ( lat, ok ) in rows:
+            print( f'  {name:<12}: success {ok / n:6.1%}  p50={np.median(lat):7.1f}  '
+                   f'p99={np.percentile(lat, 99):7.1f}  max={lat.max():7.1f} ms' )
+        print( f'  policy stats: {client.policy.stats()}' )
+
+        server.set_chaos( error_rate = 1.0, status = 503 )
+        print( 'outage: every request 503, 16 threads polling for 3 s' )
+        slow = Rule( read = 2.0, retries = 3, backoff = 0.2, cap = 2.0, deadline = 5.0 )
+        for name, policy in ( ( 'retries only', PolicyEngine( rules = { '': slow }, failures = 10**9 ) ),
+                              ( 'breaker'     , PolicyEngine( rules = { '': slow }, failures = 5, reset = 1.0 ) ) ):
+            client = client_for( server.url, policy )
+            before = client_for( server.url, PolicyEngine() ).fetch_page( server.url + '_stats' )[ 1 ][ 'requests' ]
+            with open( devnull, 'w' ) as null, redirect_stdout( null ):
+                calls, blocked = outage( client, 16, 3.0 )
+            after  = client_for( server.url, PolicyEngine() ).fetch_page( server.url + '_stats' )[ 1 ][ 'requests' ]
+            print( f'  {name:<12}: {calls:6,} calls, {after - before - 1:5,} reached the server, '
+                   f'{blocked:7.1f} ms blocked per call, failed fast {policy.counts["failed_fast"]:,}' )
+        server.set_chaos()
+
+#   ----------------- ___ END ___: Setup script and run -----------------
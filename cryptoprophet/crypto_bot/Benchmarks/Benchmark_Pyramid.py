@@ -0,0 +1,101 @@
+#@formatter:off
+"""
+Coarse candles: pandas resampling per query vs. a CandlePyramid.
+
+Fills a temporary OHLCVStore with years of synthetic 1 minute bars. Daily,
+weekly and monthly candles are then produced once by resampling the base
+bars with pandas (what callers did for every chart or strategy) and once by
+reading the pyramid levels. Also reports the one-off build and the cost of
+keeping the pyramid current as a day of new bars is appended an hour at a
+time.
+
+Usage:
+    python Benchmark_Pyramid.py [years]
+
+AUTHOR                      :   Mohammad Odeh
+DATE                        :   Oct. 18th, 2026 Year of Our Lord
+LAST CONTRIBUTION DATE      :   Oct. 18th, 2026 Year of Our Lord
+"""
+
+from    os                          import  path                            # Path manipulation
+from    time                        import  perf_counter                    # Get time
+import  tempfile                                                            # Throwaway stores
+import  sys                                                                 # Command line arguments
+import  numpy                       as      np                              # Synthetic bars
+import  pandas                      as      pd                              # Resampling baseline
+
+sys.path.insert( 0, path.dirname( path.dirname( path.abspath(__file__) ) ) )# Make crypto_bot importable
+from    OHLCVStore                  import  OHLCVStore
+from    CandlePyramid               import  CandlePyramid
+from    CandleAggregator            import  COLUMNS
+
+START   = 1_577_836_800                                                     # 2020-01-01T00:00:00Z
+RULES   = { '1d': '1D', '1w': 'W-MON', '1M': 'MS' }                         # Pyramid level -> pandas rule
+AGG     = { 'High': 'max', 'Low': 'min', 'Open': 'first', 'Close': 'last', 'Volume': 'sum' }
+
+
+def bars( t0: float, n: int, rng: np.random.Generator ) -> dict:
+    """
+    :return: n random-walk 1 minute bars from t0, COLUMNS layout
+    """
+    close = 20_000 * np.exp( np.cumsum( rng.normal( 0, 1e-3, n ) ) )
+    high  = close * ( 1 + rng.random( n ) * 1e-3 )
+    low   = close * ( 1 - rng.random( n ) * 1e-3 )
+    return dict( zip( COLUMNS, ( t0 + 60.0 * np.arange( n ), high, low, close, close, rng.random( n ) * 10 ) ) )
+
+
+def resample( store: OHLCVStore, rule: str ) -> pd.DataFrame:
+    df = store.series( 'BTC-USD', 60 ).to_frame().set_index( 'Date' )
+    return df.resample( rule, label = 'left', closed = 'left' ).agg( AGG ).dropna()
+
+
+def best( fn, repeat: int = 3 ) -> float:
+    """
+    :return: Fastest of several runs [ms]
+    """
+    times = []
+    for _ in range( repeat ):
+        t0 = perf_counter()
+        fn()
+        times.append( perf_counter() - t0 )
+    return min( times ) * 1e3
+
+
+#%% ----------------- ___START___: Setup script and run -----------------
+
+if __name__ == '__main__':
+    years = float( sys.argv[1] ) if len( sys.argv ) > 1 else 2.0
+    rng   = np.random.default_rng( 0 )
+    n     = int( years * 365 * 1440 )
+
+    with tempfile.TemporaryDirectory() as directory:
+        store   = OHLCVStore( directory )
+        store.series( 'BTC-USD', 60, COLUMNS ).append( bars( START, n, rng ) )
+        pyramid = CandlePyramid( store, base = 60 )
+        print( f'{years:g} years of 1m bars ({n:,} bars), levels {pyramid.names()}' )
+
+        t0 = perf_counter()
+        pyramid.refresh( 'BTC-USD' )
+        print( f'  build pyramid           : {( perf_counter() - t0 ) * 1e3:8.0f} ms' )
+
+        for level, rule in RULES.items():
+            ref  = resample( store, rule )
+            got  = pyramid.to_frame( 'BTC-USD', level ).set_index( 'Date' )
+            assert np.array_equal( got.index, ref.index ) and np.allclose( got[ list(AGG) ], ref[ list(AGG) ] )
+            print( f'  {level}: pandas resample   : {best( lambda: resample( store, rule ) ):8.1f} ms   '
+                   f'pyramid : {best( lambda: pyramid.bars( "BTC-USD", level ) ):6.2f} ms  ({len(ref):,} bars)' )
+
+        t1 = START + n * 60.0
+        dt = []
+        for h in range( 24 ):                                               # A day, an hour at a time
+            hour = bars( t1 + h * 3600, 60, rng )
+            t0   = perf_counter()
+            pyramid.append( 'BTC-USD', hour )
+            dt.append( perf_counter() - t0 )
+        print( f'  append + refresh 1 hour : {np.median( dt ) * 1e3:8.2f} ms (median of 24)' )
+        for level, rule in RULES.items():
+            ref = resample( store, rule )
+            got = pyramid.to_frame( 'BTC-USD', level ).set_index( 'Date' )
+            assert np.array_equal( got.index, ref.index ) and np.allclose( got[ list(AGG) ], ref[ list(AGG) ] )
+
+#   ----------------- ___ END ___: Setup script and run -----------------
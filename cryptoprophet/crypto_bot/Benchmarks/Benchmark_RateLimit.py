@@ -0,0 +1,81 @@
+#@formatter:off
+"""
+Order latency under a market-data burst, with and without priority lanes.
+
+Several threads poll tickers through CoinbaseAuthClient.api_call as fast as
+the shared rate limiter lets them, while another thread places orders at a
+steady pace. Orders either use their own lane (default) or are forced into
+the market data lane, i.e. plain FIFO. Reports order latency percentiles
+and the limiter's wait time metrics.
+
+Usage:
+    python Benchmark_RateLimit.py [rate] [n_pollers] [n_orders]
+
+AUTHOR                      :   Mohammad Odeh
+DATE                        :   Oct. 18th, 2026 Year of Our Lord
+LAST CONTRIBUTION DATE      :   Oct. 18th, 2026 Year of Our Lord
+"""
+
+from    contextlib                  import  redirect_stdout                 # api_call prints GET responses
+from    os                          import  path, environ, devnull          # Path manipulation, CA bundle
+from    time                        import  perf_counter, sleep             # Get time
+import  threading                                                           # Pollers and order thread
+import  sys                                                                 # Command line arguments
+import  numpy                       as      np                              # Percentiles
+
+sys.path.insert( 0, path.dirname( path.dirname( path.abspath(__file__) ) ) )# Make crypto_bot importable
+from    CoinbaseAuth                import  CoinbaseAuthClient
+from    CoinbaseRateLimit           import  RateLimiter
+from    LocalRestServer             import  LocalRestServer
+
+
+def run( url: str, rate: float, n_pollers: int, n_orders: int, order_lane: str ) -> tuple:
+    """
+    :return: (order latencies [sec], limiter)
+    """
+    limiter = RateLimiter( rate, burst = 5 )
+    client  = CoinbaseAuthClient( 'a' * 16, 'b' * 32, limiter = limiter )   # One client shared by all threads
+    client.url = url
+    done    = threading.Event()
+
+    def poll():
+        while not done.is_set():
+            client.api_call( 'GET', 'products/BTC-USD/ticker' )
+
+    pollers = [ threading.Thread( target = poll, daemon = True ) for _ in range( n_pollers ) ]
+    for thread in pollers:
+        thread.start()
+    sleep( 0.5 )                                                            # Let the burst build a queue
+
+    latency = np.empty( n_orders )
+    for i in range( n_orders ):
+        t0 = perf_counter()
+        client.api_call( 'POST', 'orders', { 'product_id': 'BTC-USD', 'side': 'buy', 'size': '0.01',
+                                             'price': '30000.00' }, lane = order_lane )
+        latency[ i ] = perf_counter() - t0
+        sleep( 0.1 )
+
+    done.set()
+    for thread in pollers:
+        thread.join()
+    return latency, limiter
+
+
+#%% ----------------- ___START___: Setup script and run -----------------
+
+if __name__ == '__main__':
+    rate      = float( sys.argv[1] ) if len( sys.argv ) > 1 else 50.0
+    n_pollers = int( sys.argv[2] )   if len( sys.argv ) > 2 else 8
+    n_orders  = int( sys.argv[3] )   if len( sys.argv ) > 3 else 50
+
+    with LocalRestServer( latency = 0.005 ) as server:
+        environ[ 'REQUESTS_CA_BUNDLE' ] = server.cafile                     # Trust the stub's certificate
+        for name, lane in ( ('priority lanes', 'order'), ('FIFO', 'market') ):
+            with open( devnull, 'w' ) as null, redirect_stdout( null ):
+                latency, limiter = run( server.url, rate, n_pollers, n_orders, lane )
+            p50, p90, p99 = np.percentile( latency * 1e3, [50, 90, 99] )
+            market = limiter.stats()[ 'market' ]
+            print( f'{name:<15}: order latency p50={p50:6.1f}  p90={p90:6.1f}  p99={p99:6.1f} ms  | '
+                   f'market polls={market["n"]:,}  wait p50={market["p50"]*1e3:.0f} ms' )
+
+#   ----------------- ___ END ___: Setup script and run -----------------
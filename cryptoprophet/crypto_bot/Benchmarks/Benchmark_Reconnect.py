@@ -0,0 +1,62 @@
+#@formatter:off
+"""
+Recovery time benchmark of the websocket reconnect supervisor.
+
+A local stand-in server kills every connection after a fixed number of
+frames and refuses new ones for a configurable outage. The benchmark reports
+how long it takes from the drop until fresh frames flow again, together with
+the number of reconnect attempts and sequence gaps detected.
+
+Usage:
+    python Benchmark_Reconnect.py [downtime_sec] [n_kills]
+
+AUTHOR                      :   Mohammad Odeh
+DATE                        :   Oct. 18th, 2026 Year of Our Lord
+LAST CONTRIBUTION DATE      :   Oct. 18th, 2026 Year of Our Lord
+"""
+
+from    os                          import  path                            # Path manipulation
+import  asyncio                                                             # Asynchronous routines
+import  sys                                                                 # Command line arguments
+import  numpy                       as      np                              # Statistics
+import  orjson                                                              # Fast, efficient JSON parser
+
+sys.path.insert( 0, path.dirname( path.dirname( path.abspath(__file__) ) ) )# Make crypto_bot importable
+from    CoinbaseAPI                 import  Websocket
+from    LocalFeedServer             import  LocalFeedServer
+
+
+async def run( url: str, n_kills: int ) -> Websocket:
+    """
+    Consume the feed until it recovered from n_kills outages.
+    """
+    ws = Websocket( url, gap_types = ('ticker',) )                          # Synthetic tickers are contiguous
+
+    async def on_ticker( msg ):
+        if len( ws.stats['recovery'] ) >= n_kills:
+            ws.stop()
+
+    ws.register_handler( 'ticker', on_ticker )
+    req = { 'type': 'subscribe', 'product_ids': ['BTC-USD', 'ETH-USD'], 'channels': ['ticker'] }
+    await ws.connect( orjson.dumps( req ) )
+    return ws
+
+
+#%% ----------------- ___START___: Setup script and run -----------------
+
+if __name__ == '__main__':
+    downtime = float( sys.argv[1] ) if len( sys.argv ) > 1 else 2.0
+    n_kills  = int( sys.argv[2] )   if len( sys.argv ) > 2 else 5
+
+    with LocalFeedServer( n_messages = 1_000_000, rate = 1_000,
+                          kill_after = 500, downtime = downtime ) as server:
+        ws = asyncio.run( run( server.url, n_kills ) )
+
+    recovery = np.array( ws.stats['recovery'] )
+    print( f'Outage            : {downtime:.1f} s x {n_kills}' )
+    print( f'Reconnect attempts: {ws.stats["reconnects"]}' )
+    print( f'Gaps / resyncs    : {ws.stats["gaps"]} / {ws.stats["resyncs"]}' )
+    print( f'Recovery [s]      : mean={recovery.mean():.3f}  max={recovery.max():.3f}  '
+           f'(excess over outage: {recovery.mean() - downtime:.3f})' )
+
+#   ----------------- ___ END ___: Setup script and run -----------------
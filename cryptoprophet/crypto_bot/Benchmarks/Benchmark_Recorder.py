@@ -0,0 +1,86 @@
+#@formatter:off
+"""
+Overhead and replay benchmark of the raw market-data recorder.
+
+Streams synthetic ticker frames from a local stand-in server through
+CoinbaseAPI.Websocket with and without a FeedRecorder attached, then replays
+the recording through the same handler pipeline as fast as possible.
+
+Usage:
+    python Benchmark_Recorder.py [n_messages]
+
+AUTHOR                      :   Mohammad Odeh
+DATE                        :   Oct. 18th, 2026 Year of Our Lord
+LAST CONTRIBUTION DATE      :   Oct. 18th, 2026 Year of Our Lord
+"""
+
+from    os                          import  path                            # Path manipulation
+from    time                        import  perf_counter                    # Timer
+import  tempfile                                                            # Scratch directory
+import  asyncio                                                             # Asynchronous routines
+import  sys                                                                 # Command line arguments
+import  orjson                                                              # Fast, efficient JSON parser
+
+sys.path.insert( 0, path.dirname( path.dirname( path.abspath(__file__) ) ) )# Make crypto_bot importable
+from    CoinbaseAPI                 import  Websocket
+from    FeedRecorder                import  FeedRecorder, FeedReplayer
+from    LocalFeedServer             import  LocalFeedServer
+
+REQ = orjson.dumps( { 'type': 'subscribe', 'product_ids': ['BTC-USD', 'ETH-USD'], 'channels': ['ticker'] } )
+
+
+async def ingest( url: str, recorder: FeedRecorder = None ) -> float:
+    """
+    :return: Frames per second handled while (optionally) recording.
+    """
+    state = { 'n': 0 }
+
+    async def on_ticker( msg ):
+        state[ 'n' ] += 1
+
+    ws = Websocket( url, reconnect = False, recorder = recorder )
+    ws.register_handler( 'ticker', on_ticker )
+    t0 = perf_counter()
+    await ws.connect( REQ )
+    return state[ 'n' ] / ( perf_counter() - t0 )
+
+
+async def replay( directory: str ) -> float:
+    """
+    :return: Frames per second replayed through the handler pipeline.
+    """
+    state = { 'n': 0 }
+
+    async def on_ticker( msg ):
+        state[ 'n' ] += 1
+
+    ws = Websocket()
+    ws.register_handler( 'ticker', on_ticker )
+    t0 = perf_counter()
+    await ws.replay( FeedReplayer( directory ) )
+    return state[ 'n' ] / ( perf_counter() - t0 )
+
+
+#%% ----------------- ___START___: Setup script and run -----------------
+
+if __name__ == '__main__':
+    n_messages = int( sys.argv[1] ) if len( sys.argv ) > 1 else 100_000
+
+    with tempfile.TemporaryDirectory() as directory:
+        with LocalFeedServer( n_messages = n_messages ) as server:
+            rate_plain = asyncio.run( ingest( server.url ) )
+        with LocalFeedServer( n_messages = n_messages ) as server:
+            with FeedRecorder( directory ) as recorder:
+                rate_rec = asyncio.run( ingest( server.url, recorder ) )
+
+        raw_bytes  = sum( len( frame ) for _, frame in FeedReplayer( directory ) )
+        disk_bytes = sum( path.getsize( s ) for s in FeedReplayer( directory ).segments )
+        rate_play  = asyncio.run( replay( directory ) )
+
+    print( f'Ingest, no recorder : {rate_plain:>10,.0f} msg/s' )
+    print( f'Ingest, recording   : {rate_rec:>10,.0f} msg/s  ({100 * (1 - rate_rec / rate_plain):+.1f}% overhead)' )
+    print( f'Recorded            : {recorder.n_records:,} frames, {disk_bytes / recorder.n_records:.1f} B/frame on disk '
+           f'(compression {raw_bytes / disk_bytes:.1f}x)' )
+    print( f'Replay, max speed   : {rate_play:>10,.0f} msg/s' )
+
+#   ----------------- ___ END ___: Setup script and run -----------------
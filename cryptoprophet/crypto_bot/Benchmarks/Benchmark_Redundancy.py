@@ -0,0 +1,69 @@
+#@formatter:off
+"""
+Tail latency benchmark of redundant websocket connections.
+
+A local stand-in server fans one synthetic ticker stream out to every
+client, delaying each connection by a base latency plus random jitter. The
+benchmark compares end-to-end latency (frame generated -> handler invoked)
+of a single connection against N redundant ones merged by first arrival,
+and prints how often each connection won and by what margin.
+
+Usage:
+    python Benchmark_Redundancy.py [n_connections] [n_messages] [jitter_ms]
+
+AUTHOR                      :   Mohammad Odeh
+DATE                        :   Oct. 18th, 2026 Year of Our Lord
+LAST CONTRIBUTION DATE      :   Oct. 18th, 2026 Year of Our Lord
+"""
+
+from    os                          import  path                            # Path manipulation
+from    time                        import  time                            # Get time
+import  asyncio                                                             # Asynchronous routines
+import  sys                                                                 # Command line arguments
+import  numpy                       as      np                              # Percentiles
+import  orjson                                                              # Fast, efficient JSON parser
+
+sys.path.insert( 0, path.dirname( path.dirname( path.abspath(__file__) ) ) )# Make crypto_bot importable
+from    CoinbaseAPI                 import  Websocket
+from    LocalFeedServer             import  LocalFeedServer
+
+
+async def run( url: str, redundancy: int ) -> tuple:
+    """
+    Consume the whole stream and collect latency samples.
+    """
+    latency = []
+
+    async def on_ticker( msg ):
+        latency.append( time() - msg['ts_sent'] )
+
+    ws  = Websocket( url, reconnect = False, redundancy = redundancy )
+    ws.register_handler( 'ticker', on_ticker )
+    req = { 'type': 'subscribe', 'product_ids': ['BTC-USD', 'ETH-USD'], 'channels': ['ticker'] }
+    await ws.connect( orjson.dumps( req ) )
+    return ws, np.array( latency )
+
+
+#%% ----------------- ___START___: Setup script and run -----------------
+
+if __name__ == '__main__':
+    n_conn     = int( sys.argv[1] )   if len( sys.argv ) > 1 else 2
+    n_messages = int( sys.argv[2] )   if len( sys.argv ) > 2 else 5_000
+    jitter     = float( sys.argv[3] ) if len( sys.argv ) > 3 else 5.0
+
+    for redundancy in ( 1, n_conn ):
+        delays = [ ( 0.002 + 0.001 * i, jitter * 1e-3 ) for i in range( redundancy ) ]
+        with LocalFeedServer( n_messages = n_messages, rate = 1_000, delays = delays ) as server:
+            ws, latency = asyncio.run( run( server.url, redundancy ) )
+
+        p50, p90, p99, p999 = np.percentile( latency * 1e3, [50, 90, 99, 99.9] )
+        print( f'--- {redundancy} connection(s) ---' )
+        print( f'Messages handled  : {len(latency):,} / {n_messages:,}  (duplicates dropped: {ws.stats["duplicates"]:,})' )
+        print( f'Latency [ms]      : p50={p50:.2f}  p90={p90:.2f}  p99={p99:.2f}  p99.9={p999:.2f}' )
+        if redundancy > 1:
+            for row in ws.redundancy_report():
+                m = row[ 'margin' ]
+                print( f'  connection {row["connection"]}  wins={row["wins"]:>6,} ({row["share"]:.0%})  '
+                       f'margin ms: p50={1e3*m["p50"]:.2f} p99={1e3*m["p99"]:.2f}' )
+
+#   ----------------- ___ END ___: Setup script and run -----------------
@@ -0,0 +1,93 @@
+#@formatter:off
+"""
+Latency of each api_call result format.
+
+End to end: ticker polling through api_call against a local HTTPS stand-in
+server, once per result format, next to the previous response handling
+(whole response printed, resp.json() parsed repeatedly, DataFrame built).
+Conversion only: the same formats on an in-memory 300 row response.
+
+Usage:
+    python Benchmark_Results.py [n_calls]
+
+AUTHOR                      :   Mohammad Odeh
+DATE                        :   Oct. 18th, 2026 Year of Our Lord
+LAST CONTRIBUTION DATE      :   Oct. 18th, 2026 Year of Our Lord
+"""
+
+from    contextlib                  import  redirect_stdout                 # Legacy path prints
+from    os                          import  path, environ, devnull          # Path manipulation, CA bundle
+from    time                        import  perf_counter                    # Get time
+import  sys                                                                 # Command line arguments
+import  numpy                       as      np                              # Percentiles
+import  pandas                      as      pd                              # Legacy path
+import  orjson                                                              # Fast, efficient JSON parser
+
+sys.path.insert( 0, path.dirname( path.dirname( path.abspath(__file__) ) ) )# Make crypto_bot importable
+from    CoinbaseAuth                import  CoinbaseAuthClient
+from    CoinbaseRateLimit           import  RateLimiter
+from    CoinbaseResults             import  RESULTS, convert
+from    LocalRestServer             import  LocalRestServer
+
+
+def legacy( client: CoinbaseAuthClient, uri: str ) -> pd.DataFrame:
+    """
+    Previous api_call response handling of a GET.
+    """
+    resp = client.session.get( client.url + uri, auth = client )
+    print( orjson.loads( resp.content ) )
+    resp.raise_for_status()
+    if isinstance( resp.json(), list ):
+        return pd.DataFrame.from_dict( resp.json() )
+    return pd.DataFrame( resp.json(), index = [0] )
+
+
+def timed( fn, n: int ) -> np.ndarray:
+    """
+    :return: Latency of each call [ms].
+    """
+    latency = np.empty( n )
+    for i in range( n ):
+        t0 = perf_counter()
+        fn()
+        latency[ i ] = perf_counter() - t0
+    return latency * 1e3
+
+
+#%% ----------------- ___START___: Setup script and run -----------------
+
+if __name__ == '__main__':
+    n = int( sys.argv[1] ) if len( sys.argv ) > 1 else 1_000
+
+    with LocalRestServer() as server:
+        environ[ 'REQUESTS_CA_BUNDLE' ] = server.cafile                     # Trust the stub's certificate
+        client     = CoinbaseAuthClient( 'a' * 16, 'b' * 32, limiter = RateLimiter( rate = None ) )
+        client.url = server.url
+        uri        = 'products/BTC-USD/ticker'
+
+        for result in RESULTS:                                              # Warm up connection and caches
+            timed( lambda: client.api_call( 'GET', uri, result = result ), 50 )
+
+        print( f'api_call GET {uri} (end to end, ms)' )
+        with open( devnull, 'w' ) as null, redirect_stdout( null ):
+            rows = [ ( 'legacy', timed( lambda: legacy( client, uri ), n ) ) ]
+        for result in RESULTS:
+            rows.append( ( result, timed( lambda: client.api_call( 'GET', uri, result = result ), n ) ) )
+        for name, lat in rows:
+            print( f'  {name:<8}: p50={np.median(lat):.3f}  p99={np.percentile(lat, 99):.3f}' )
+
+    ticker = orjson.dumps( { 'trade_id': 1, 'price': '30000.01', 'size': '0.01', 'bid': '30000.00',
+                             'ask': '30000.02', 'volume': '1234.5', 'time': '2022-08-01T00:00:00.000000Z' } )
+    print( 'parse + convert, 1 ticker (ms)' )
+    for result in RESULTS:
+        lat = timed( lambda: convert( orjson.loads( ticker ), result ), n )
+        print( f'  {result:<8}: p50={np.median(lat):.4f}' )
+
+    body = orjson.dumps( [ { 'trade_id': i, 'price': f'{30000 + i * 0.01:.2f}', 'size': '0.01',
+                             'side': 'buy', 'time': '2022-08-01T00:00:00.000000Z' } for i in range( 300 ) ] )
+    print( 'parse + convert, 300 rows (ms)' )
+    for result in RESULTS:
+        lat = timed( lambda: convert( orjson.loads( body ), result ), n )
+        print( f'  {result:<8}: p50={np.median(lat):.3f}' )
+
+#   ----------------- ___ END ___: Setup script and run -----------------
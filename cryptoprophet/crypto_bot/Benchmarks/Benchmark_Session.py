@@ -0,0 +1,64 @@
+#@formatter:off
+"""
+Per-request latency of bare requests calls vs. the pooled keep-alive session.
+
+Sends bursts of signed GETs to a local HTTPS stand-in server, once with a
+fresh requests.get() per call (new TCP connection and TLS handshake every
+time) and once through CoinbaseSession's pooled session, as api_call and
+CoinbaseClient now do. Reports latency percentiles and the number of
+connections the server accepted.
+
+Usage:
+    python Benchmark_Session.py [n_calls] [latency_ms]
+
+AUTHOR                      :   Mohammad Odeh
+DATE                        :   Oct. 18th, 2026 Year of Our Lord
+LAST CONTRIBUTION DATE      :   Oct. 18th, 2026 Year of Our Lord
+"""
+
+from    os                          import  path, environ                   # Path manipulation, CA bundle
+from    time                        import  perf_counter                    # Get time
+import  sys                                                                 # Command line arguments
+import  numpy                       as      np                              # Percentiles
+import  requests                                                            # Baseline
+
+sys.path.insert( 0, path.dirname( path.dirname( path.abspath(__file__) ) ) )# Make crypto_bot importable
+from    CoinbaseAuth                import  CoinbaseAuthClient
+from    CoinbaseSession             import  PooledSession
+from    LocalRestServer             import  LocalRestServer
+
+
+def burst( get, url: str, auth, n_calls: int ) -> np.ndarray:
+    """
+    :return: Latency of each call [sec].
+    """
+    latency = np.empty( n_calls )
+    for i in range( n_calls ):
+        t0 = perf_counter()
+        get( url, auth = auth ).raise_for_status()
+        latency[ i ] = perf_counter() - t0
+    return latency
+
+
+#%% ----------------- ___START___: Setup script and run -----------------
+
+if __name__ == '__main__':
+    n_calls = int( sys.argv[1] )   if len( sys.argv ) > 1 else 500
+    latency = float( sys.argv[2] ) if len( sys.argv ) > 2 else 0.0
+
+    with LocalRestServer( latency = latency * 1e-3 ) as server:
+        environ[ 'REQUESTS_CA_BUNDLE' ] = server.cafile                     # Trust the stub's certificate
+        session = PooledSession()
+        client  = CoinbaseAuthClient( 'a' * 16, 'b' * 32, session = session )
+        url     = server.url + 'prices/BTC-USD/spot'
+
+        for name, get in ( ('requests.get (fresh)', requests.get), ('pooled session', session.get) ):
+            before = session.get( server.url + '_stats' ).json()
+            lat    = burst( get, url, client, n_calls ) * 1e3
+            after  = session.get( server.url + '_stats' ).json()
+            p50, p90, p99 = np.percentile( lat, [50, 90, 99] )
+            print( f'{name:<22}: p50={p50:.3f}  p90={p90:.3f}  p99={p99:.3f} ms  '
+                   f'({n_calls / lat.sum() * 1e3:,.0f} calls/s, '
+                   f'{after["connections"] - before["connections"]} new connections)' )
+
+#   ----------------- ___ END ___: Setup script and run -----------------
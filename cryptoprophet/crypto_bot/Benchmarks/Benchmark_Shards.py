@@ -0,0 +1,63 @@
+#@formatter:off
+"""
+Scaling benchmark of the sharded multi-product ingestion.
+
+A local synthetic feed serves 160 products over 8 connections. The same
+load is ingested with 1, 2, 4 and 8 worker processes and the parent process
+measures how fast normalized ticks come out of the shared-memory channels.
+
+Usage:
+    python Benchmark_Shards.py [messages_per_connection]
+
+AUTHOR                      :   Mohammad Odeh
+DATE                        :   Oct. 18th, 2026 Year of Our Lord
+LAST CONTRIBUTION DATE      :   Oct. 18th, 2026 Year of Our Lord
+"""
+
+from    os                          import  path, cpu_count                 # Path manipulation
+from    time                        import  perf_counter, sleep             # Timer
+import  sys                                                                 # Command line arguments
+
+sys.path.insert( 0, path.dirname( path.dirname( path.abspath(__file__) ) ) )# Make crypto_bot importable
+from    CoinbaseShards              import  ShardedFeed
+from    LocalFeedServer             import  LocalFeedServer
+
+N_PRODUCTS      = 160
+N_CONNECTIONS   = 8
+
+
+def run( url: str, n_workers: int, n_expected: int, timeout: float = 120.0 ) -> float:
+    """
+    Ingest the feed with n_workers processes.
+
+    :return: Ticks per second seen by the parent process.
+    """
+    products = [ f'P{i:03d}-USD' for i in range( N_PRODUCTS ) ]
+    n, t0    = 0, None
+    with ShardedFeed( products, n_workers = n_workers, n_connections = N_CONNECTIONS, url = url ) as feed:
+        t_end = perf_counter() + timeout
+        while n < n_expected and perf_counter() < t_end:
+            ticks = feed.read()
+            if len( ticks ):
+                if t0 is None:
+                    t0 = perf_counter()
+                n += len( ticks )
+            else:
+                sleep( 0.0005 )
+        elapsed = perf_counter() - t0
+    return n / elapsed
+
+
+#%% ----------------- ___START___: Setup script and run -----------------
+
+if __name__ == '__main__':
+    n_per_conn = int( sys.argv[1] ) if len( sys.argv ) > 1 else 50_000
+    n_expected = n_per_conn * N_CONNECTIONS
+
+    print( f'{N_PRODUCTS} products, {N_CONNECTIONS} connections, {n_expected:,} ticks, {cpu_count()} CPUs' )
+    for n_workers in ( 1, 2, 4, 8 ):
+        with LocalFeedServer( n_messages = n_per_conn, n_procs = min( 4, cpu_count() ) ) as server:
+            rate = run( server.url, n_workers, n_expected )
+        print( f'  workers={n_workers}  {rate:>12,.0f} ticks/s' )
+
+#   ----------------- ___ END ___: Setup script and run -----------------
@@ -0,0 +1,96 @@
+#@formatter:off
+"""
+Signatures per second of CoinbaseAuthClient, v2 and pro paths.
+
+Compares the previous per-request signing (secret decoded/encoded and HMAC
+keyed from scratch every time, fresh header dict) with the precomputed
+signer (HMAC keyed once and copied per request), both on the bare
+signature and on a full __call__ over a prepared order request. The
+signatures of both are checked to match.
+
+Usage:
+    python Benchmark_Signing.py [n_signatures]
+
+AUTHOR                      :   Mohammad Odeh
+DATE                        :   Oct. 18th, 2026 Year of Our Lord
+LAST CONTRIBUTION DATE      :   Oct. 18th, 2026 Year of Our Lord
+"""
+
+from    os                          import  path                            # Path manipulation
+from    time                        import  time, perf_counter              # Get time
+import  sys                                                                 # Command line arguments
+import  base64                                                              # Pro secret
+import  hashlib                                                             # Secure hash and message digest algorithms
+import  hmac                                                                # Keyed-Hashing for Message Authentication
+import  requests                                                            # Prepared requests
+
+sys.path.insert( 0, path.dirname( path.dirname( path.abspath(__file__) ) ) )# Make crypto_bot importable
+from    CoinbaseAuth                import  CoinbaseAuthClient
+from    CoinbaseRateLimit           import  RateLimiter
+
+V2_KEY, V2_SECRET                   = 'a' * 16, 'b' * 32
+PRO_KEY, PRO_SECRET, PRO_PASSPHRASE = 'c' * 32, base64.b64encode( b's' * 64 ).decode(), 'passphrase'
+
+
+def legacy_sign( client: CoinbaseAuthClient, timestamp: str, method: str, path_url: str, body ) -> str:
+    """
+    Signature as computed before, from scratch on every request.
+    """
+    if client.pro:
+        message   = f'{timestamp}{method}{path_url}{(body or b"").decode()}'
+        signature = hmac.new( base64.b64decode( client._CB_SECRET ), message.encode(), hashlib.sha256 )
+        return base64.b64encode( signature.digest() ).decode()
+    message = timestamp + method + path_url + ( body or '' )
+    return hmac.new( client._CB_SECRET.encode( 'UTF-8' ), message.encode( 'UTF-8' ), hashlib.sha256 ).hexdigest()
+
+
+def legacy_call( client: CoinbaseAuthClient, request ):
+    """
+    __call__ as it was before: signature from scratch plus a new header dict.
+    """
+    timestamp = str( time() ) if client.pro else str( int(time()) )
+    header    = { 'CB-ACCESS-SIGN'      : legacy_sign( client, timestamp, request.method,
+                                                       request.path_url, request.body ),
+                  'CB-ACCESS-TIMESTAMP' : timestamp,
+                  'CB-ACCESS-KEY'       : client._CB_KEY,
+                  'Content-Type'        : 'application/json' }
+    if client.pro:
+        header[ 'CB-ACCESS-PASSPHRASE' ] = client._CB_PASSPHRASE
+    request.headers.update( header )
+    return request
+
+
+def rate( fn, n: int ) -> float:
+    """
+    :return: Calls per second.
+    """
+    t0 = perf_counter()
+    for _ in range( n ):
+        fn()
+    return n / ( perf_counter() - t0 )
+
+
+#%% ----------------- ___START___: Setup script and run -----------------
+
+if __name__ == '__main__':
+    n       = int( sys.argv[1] ) if len( sys.argv ) > 1 else 200_000
+    limiter = RateLimiter( rate = None )
+    clients = { 'v2' : CoinbaseAuthClient( V2_KEY, V2_SECRET, limiter = limiter ),
+                'pro': CoinbaseAuthClient( PRO_KEY, PRO_SECRET, limiter = limiter,
+                                           pro = True, api_passphrase = PRO_PASSPHRASE ) }
+
+    for name, client in clients.items():
+        order = requests.Request( 'POST', client.url + 'orders',
+                                  json = { 'product_id': 'BTC-USD', 'side': 'buy', 'type': 'limit',
+                                           'size': '0.01', 'price': '30000.00' } ).prepare()
+        if not client.pro:                                                  # Old v2 path only handled str bodies
+            order.body = order.body.decode()
+        args  = ( '1660000000.123', order.method, order.path_url, order.body )
+        assert client.sign( *args ) == legacy_sign( client, *args ), name
+
+        old, new = rate( lambda: legacy_sign( client, *args ), n ), rate( lambda: client.sign( *args ), n )
+        print( f'{name:<3} sign()     : {old:>10,.0f} -> {new:>10,.0f} signatures/s  ({new / old:.2f}x)' )
+        old, new = rate( lambda: legacy_call( client, order ), n // 4 ), rate( lambda: client( order ), n // 4 )
+        print( f'{name:<3} __call__() : {old:>10,.0f} -> {new:>10,.0f} requests/s    ({new / old:.2f}x)' )
+
+#   ----------------- ___ END ___: Setup script and run -----------------
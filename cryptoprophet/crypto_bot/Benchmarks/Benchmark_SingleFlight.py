@@ -0,0 +1,115 @@
+#@formatter:off
+"""
+Identical concurrent GETs with and without single-flight coalescing.
+
+Several components (scanner, Telegram bot, strategy, ...) each have their
+own client and ask for the BTC-USD spot price at the same moment, round
+after round, against a local HTTPS stand-in server with an artificial
+latency. Each client either has a private SingleFlight (nothing is
+shared, i.e. the previous behaviour) or all share one. Done with threads
+and CoinbaseClient, then with coroutines and AsyncCoinbaseClient; reports
+the requests that reached the server, caller latency and coalesced calls.
+
+Usage:
+    python Benchmark_SingleFlight.py [n_components] [n_rounds] [latency_ms]
+
+AUTHOR                      :   Mohammad Odeh
+DATE                        :   Oct. 18th, 2026 Year of Our Lord
+LAST CONTRIBUTION DATE      :   Oct. 18th, 2026 Year of Our Lord
+"""
+
+from    os                          import  path, environ                   # Path manipulation, CA bundle
+from    time                        import  perf_counter                    # Get time
+import  threading                                                           # Components
+import  asyncio                                                             # Asynchronous routines
+import  sys                                                                 # Command line arguments
+import  numpy                       as      np                              # Percentiles
+
+sys.path.insert( 0, path.dirname( path.dirname( path.abspath(__file__) ) ) )# Make crypto_bot importable
+from    CoinbaseClient              import  CoinbaseClient
+from    CoinbaseAsync               import  AsyncCoinbaseClient
+from    CoinbaseRateLimit           import  RateLimiter
+from    CoinbaseSingleFlight        import  SingleFlight
+from    LocalRestServer             import  LocalRestServer
+
+KEY, SECRET = 'a' * 16, 'b' * 32                                            # Pass v2 validation
+UNLIMITED   = RateLimiter( rate = None )                                    # Measure the calls, not the limiter
+
+
+def threaded( url: str, flights: list, n_rounds: int ) -> np.ndarray:
+    """
+    :return: Latency of every call [ms]
+    """
+    clients = [ CoinbaseClient( KEY, SECRET, url = url, limiter = UNLIMITED ) for _ in flights ]
+    for client, flight in zip( clients, flights ):
+        client.auth_client.flight = flight
+    barrier = threading.Barrier( len( clients ) )
+    latency = np.empty( ( len(clients), n_rounds ) )
+
+    def component( i: int ) -> None:
+        for r in range( n_rounds ):
+            barrier.wait()                                                  # Same moment
+            t0 = perf_counter()
+            clients[ i ].get_price( 'BTC-USD' ).raise_for_status()
+            latency[ i, r ] = perf_counter() - t0
+
+    threads = [ threading.Thread( target = component, args = (i,) ) for i in range( len(clients) ) ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latency.ravel() * 1e3
+
+
+async def coroutines( url: str, flights: list, n_rounds: int ) -> np.ndarray:
+    """
+    :return: Latency of every call [ms]
+    """
+    clients = [ AsyncCoinbaseClient( KEY, SECRET, url = url, limiter = UNLIMITED, flight = flight )
+                for flight in flights ]
+
+    async def timed( client: AsyncCoinbaseClient ) -> float:
+        t0 = perf_counter()
+        await client.get_price( 'BTC-USD' )
+        return perf_counter() - t0
+
+    latency = []
+    for _ in range( n_rounds ):
+        latency += await asyncio.gather( *( timed( c ) for c in clients ) )
+    for client in clients:
+        client.close()
+    return np.array( latency ) * 1e3
+
+
+def server_requests( url: str ) -> int:
+    client = CoinbaseClient( KEY, SECRET, url = url, limiter = UNLIMITED )
+    client.auth_client.flight = SingleFlight()
+    return client._get( '_stats' ).json()[ 'requests' ]
+
+
+#%% ----------------- ___START___: Setup script and run -----------------
+
+if __name__ == '__main__':
+    n_components = int( sys.argv[1] )   if len( sys.argv ) > 1 else 8
+    n_rounds     = int( sys.argv[2] )   if len( sys.argv ) > 2 else 50
+    latency      = float( sys.argv[3] ) if len( sys.argv ) > 3 else 20.0
+
+    with LocalRestServer( latency = latency * 1e-3 ) as server:
+        environ[ 'REQUESTS_CA_BUNDLE' ] = server.cafile                     # Trust the stub's certificate
+        print( f'{n_components} components x {n_rounds} rounds of prices/BTC-USD/spot, '
+               f'{latency:.0f} ms server latency' )
+
+        for kind in ( 'threads', 'asyncio' ):
+            for name, flights in ( ( 'private', [ SingleFlight() for _ in range( n_components ) ] ),
+                                   ( 'shared' , [ SingleFlight() ] * n_components ) ):
+                before = server_requests( server.url )
+                if kind == 'threads':
+                    lat = threaded( server.url, flights, n_rounds )
+                else:
+                    lat = asyncio.run( coroutines( server.url, flights, n_rounds ) )
+                sent = server_requests( server.url ) - before - 1
+                coalesced = sum( f.counts[ 'coalesced' ] for f in set( flights ) )
+                print( f'  {kind:<7} {name:<7}: server requests={sent:5,}  coalesced={coalesced:5,}  '
+                       f'latency p50={np.median(lat):6.1f}  p99={np.percentile(lat, 99):6.1f} ms' )
+
+#   ----------------- ___ END ___: Setup script and run -----------------
@@ -0,0 +1,131 @@
+#@formatter:off
+"""
+Loading bars from CSV vs. the memory-mapped OHLCVStore.
+
+sample.csv: data/sample.csv is parsed with pandas (the previous way of
+getting history in) and compared with opening the converted series and
+taking a month of it.
+
+Years of 1 minute bars: synthetic bars are appended to a store one year at
+a time, and written once as CSV for a single year. Reports the time to
+parse the CSV, to open the whole store, to slice one day out of it, and the
+resident memory of the process after each step.
+
+Usage:
+    python Benchmark_Store.py [years] [csv_years]
+
+AUTHOR                      :   Mohammad Odeh
+DATE                        :   Oct. 18th, 2026 Year of Our Lord
+LAST CONTRIBUTION DATE      :   Oct. 18th, 2026 Year of Our Lord
+"""
+
+from    os                          import  path, sysconf                   # Path manipulation, page size
+from    time                        import  perf_counter                    # Get time
+import  tempfile                                                            # Throwaway stores
+import  sys                                                                 # Command line arguments
+import  numpy                       as      np                              # Synthetic bars
+import  pandas                      as      pd                              # CSV loading
+
+sys.path.insert( 0, path.dirname( path.dirname( path.abspath(__file__) ) ) )# Make crypto_bot importable
+from    OHLCVStore                  import  OHLCVStore
+from    CandleAggregator            import  COLUMNS
+
+SAMPLE  = path.join( path.dirname( path.abspath(__file__) ), '..', '..', '..', 'data', 'sample.csv' )
+YEAR    = 365 * 86400
+START   = 1_262_304_000                                                     # 2010-01-01T00:00:00Z
+
+
+def rss() -> float:
+    """
+    :return: Resident memory of this process [MiB] (Linux)
+    """
+    with open( '/proc/self/statm' ) as f:
+        return int( f.read().split()[ 1 ] ) * sysconf( 'SC_PAGE_SIZE' ) / 2**20
+
+
+def best( fn, repeat: int = 5 ) -> float:
+    """
+    :return: Fastest of several runs [ms]
+    """
+    times = []
+    for _ in range( repeat ):
+        t0 = perf_counter()
+        fn()
+        times.append( perf_counter() - t0 )
+    return min( times ) * 1e3
+
+
+def bars( t0: int, n: int, rng: np.random.Generator ) -> dict:
+    """
+    :return: n random-walk 1 minute bars from t0, COLUMNS layout
+    """
+    close = 20_000 * np.exp( np.cumsum( rng.normal( 0, 1e-3, n ) ) )
+    high  = close * ( 1 + rng.random( n ) * 1e-3 )
+    low   = close * ( 1 - rng.random( n ) * 1e-3 )
+    return dict( zip( COLUMNS, ( t0 + 60.0 * np.arange( n ), high, low, close, close, rng.random( n ) * 10 ) ) )
+
+
+def read_csv( file: str ) -> pd.DataFrame:
+    df = pd.read_csv( file )
+    df[ 'Date' ] = pd.to_datetime( df[ 'Date' ] )
+    return df
+
+
+#%% ----------------- ___START___: Setup script and run -----------------
+
+if __name__ == '__main__':
+    years     = int( sys.argv[1] ) if len( sys.argv ) > 1 else 10
+    csv_years = int( sys.argv[2] ) if len( sys.argv ) > 2 else 1
+    rng       = np.random.default_rng( 0 )
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = OHLCVStore( directory )
+        store.import_csv( SAMPLE, 'BTC-USD', 86400 )
+        month = ( 1_514_764_800, 1_517_443_200 )                            # January 2018
+        csv   = best( lambda: read_csv( SAMPLE ) )
+        full  = best( lambda: store.series( 'BTC-USD', 86400 ) )
+        part  = best( lambda: store.load( 'BTC-USD', 86400, *month )[ 'Close' ].sum() )
+        print( f'sample.csv ({len(read_csv(SAMPLE)):,} daily bars)' )
+        print( f'  pandas read_csv         : {csv:8.2f} ms' )
+        print( f'  store open              : {full:8.2f} ms' )
+        print( f'  store January 2018      : {part:8.2f} ms' )
+
+        n = YEAR // 60
+        print( f'{years} years of 1m bars ({years * n:,} bars, {years * n * 6 * 8 / 2**20:,.0f} MiB)' )
+        t0 = perf_counter()
+        for y in range( years ):                                            # Append-only, a year at a time
+            store.series( 'SYN-USD', 60, COLUMNS ).append( bars( START + y * YEAR, n, rng ) )
+        print( f'  append                  : {( perf_counter() - t0 ) * 1e3:8.0f} ms' )
+
+        file = path.join( directory, 'bars.csv' )
+        df   = pd.DataFrame( bars( START, csv_years * n, rng ) )
+        df[ 'Date' ] = pd.to_datetime( df[ 'Date' ], unit = 's' )
+        df.to_csv( file, index = False )
+        del df
+
+        base = rss()
+        t0   = perf_counter()
+        df   = read_csv( file )
+        print( f'  pandas read_csv {csv_years:>2} year : {( perf_counter() - t0 ) * 1e3:8.0f} ms  '
+               f'+{rss() - base:6.1f} MiB resident' )
+        del df
+
+        np.zeros( 8 ).mean()                                                # Warm up before measuring
+        base   = rss()
+        t0     = perf_counter()
+        series = store.series( 'SYN-USD', 60 )
+        print( f'  store open {years:>2} years     : {( perf_counter() - t0 ) * 1e3:8.2f} ms  '
+               f'+{rss() - base:6.1f} MiB resident' )
+        day    = START + years * YEAR // 2
+        t0     = perf_counter()
+        window = series.window( day, day + 86400 )
+        close  = window[ 'Close' ].mean()
+        print( f'  store one day           : {( perf_counter() - t0 ) * 1e3:8.2f} ms  '
+               f'+{rss() - base:6.1f} MiB resident  ({len(window["Close"]):,} bars)' )
+        t0     = perf_counter()
+        close  = series[ 'Close' ].mean()
+        print( f'  store scan all Close    : {( perf_counter() - t0 ) * 1e3:8.0f} ms  '
+               f'+{rss() - base:6.1f} MiB resident' )
+        del series, window
+
+#   ----------------- ___ END ___: Setup script and run -----------------
@@ -0,0 +1,69 @@
+#@formatter:off
+"""
+Throughput benchmark of the websocket consumer loop.
+
+Streams synthetic ticker frames from a local stand-in server through
+CoinbaseAPI.Websocket and reports messages/sec as well as the end-to-end
+latency percentiles (server send -> handler invocation).
+
+Usage:
+    python Benchmark_Websocket.py [n_messages]
+
+AUTHOR                      :   Mohammad Odeh
+DATE                        :   Oct. 18th, 2026 Year of Our Lord
+LAST CONTRIBUTION DATE      :   Oct. 18th, 2026 Year of Our Lord
+"""
+
+from    os                          import  path                            # Path manipulation
+from    time                        import  time, perf_counter              # Get time
+import  asyncio                                                             # Asynchronous routines
+import  sys                                                                 # Command line arguments
+import  numpy                       as      np                              # Percentiles
+import  orjson                                                              # Fast, efficient JSON parser
+
+sys.path.insert( 0, path.dirname( path.dirname( path.abspath(__file__) ) ) )# Make crypto_bot importable
+from    CoinbaseAPI                 import  Websocket
+from    LocalFeedServer             import  LocalFeedServer
+
+
+async def run( url: str, n_messages: int ) -> dict:
+    """
+    Consume n_messages ticker frames and collect latency samples.
+    """
+    latency = np.empty( n_messages )
+    state   = { 'n': 0, 't0': None, 't1': None }
+
+    async def on_ticker( msg ):
+        now = time()
+        if state[ 'n' ] == 0:
+            state[ 't0' ] = perf_counter()
+        latency[ state['n'] ] = now - msg[ 'ts_sent' ]
+        state[ 'n' ] += 1
+        state[ 't1' ] = perf_counter()
+
+    ws  = Websocket( url, reconnect = False )
+    ws.register_handler( 'ticker', on_ticker )
+    req = { 'type': 'subscribe', 'product_ids': ['BTC-USD', 'ETH-USD'], 'channels': ['ticker'] }
+    await ws.connect( orjson.dumps( req ) )
+
+    n = state[ 'n' ]
+    return { 'n'        : n,
+             'elapsed'  : state[ 't1' ] - state[ 't0' ],
+             'latency'  : latency[ :n ] }
+
+
+#%% ----------------- ___START___: Setup script and run -----------------
+
+if __name__ == '__main__':
+    n_messages = int( sys.argv[1] ) if len( sys.argv ) > 1 else 100_000
+
+    with LocalFeedServer( n_messages = n_messages ) as server:
+        res = asyncio.run( run( server.url, n_messages ) )
+
+    p50, p90, p99, p999 = np.percentile( res['latency'] * 1e3, [50, 90, 99, 99.9] )
+    print( f'Messages received : {res["n"]:,} / {n_messages:,}' )
+    print( f'Throughput        : {res["n"] / res["elapsed"]:,.0f} msg/s' )
+    print( f'Latency [ms]      : p50={p50:.3f}  p90={p90:.3f}  p99={p99:.3f}  '
+           f'p99.9={p999:.3f}  max={res["latency"].max() * 1e3:.3f}' )
+
+#   ----------------- ___ END ___: Setup script and run -----------------
@@ -0,0 +1,230 @@
+#@formatter:off
+"""
+Local stand-in for the Coinbase websocket feed.
+
+Runs a `websockets` server in a separate process that waits for a subscribe
+request and then streams synthetic ticker frames for the requested products
+as fast as possible (or at a fixed rate). Each frame carries the wall-clock
+time it was sent in "ts_sent" so that clients can measure end-to-end latency.
+
+Connections can be killed on purpose after a number of frames, optionally
+followed by an outage during which new connections are refused. Sequence
+numbers keep advancing during the outage, as they would on the exchange.
+
+With per-connection delays, a single stream is generated and fanned out to
+every client, each one delayed by its own base latency plus exponentially
+distributed jitter. This stands in for redundant connections taking
+different network paths.
+
+*** NOTE: Only meant to be used by the benchmarks in this directory
+
+VERSION: 0.0.4
+    - ADDED     : Synthetic ticker feed
+    - ADDED     : Connection kills and outages
+    - ADDED     : Serve from several processes sharing the port
+    - ADDED     : Shared stream with per-connection delays
+
+KNOWN ISSUES:
+    - Non encountered
+
+
+AUTHOR                      :   Mohammad Odeh
+DATE                        :   Oct. 18th, 2026 Year of Our Lord
+LAST CONTRIBUTION DATE      :   Oct. 18th, 2026 Year of Our Lord
+"""
+
+from    datetime                    import  datetime, timezone              # ISO timestamps
+from    time                        import  time, sleep                     # Get time
+import  multiprocessing                                                     # Run server in its own process
+import  asyncio                                                             # Asynchronous routines
+import  random                                                              # Delay jitter
+import  socket                                                              # Find a free port
+import  websockets                                                          # Websocket server
+import  orjson                                                              # Fast, efficient JSON parser
+
+
+def free_port( host: str = '127.0.0.1' ) -> int:
+    """
+    Ask the OS for a free TCP port.
+    """
+    with socket.socket( socket.AF_INET, socket.SOCK_STREAM ) as s:
+        s.bind( (host, 0) )
+        return s.getsockname()[ 1 ]
+
+
+class LocalFeedServer( object ):
+    """
+    Synthetic ticker feed served from a child process.
+    """
+    def __init__( self, n_messages: int = 100_000, rate: float = None,
+                  host: str = '127.0.0.1', port: int = None,
+                  kill_after: int = None, downtime: float = 0.0,
+                  n_procs: int = 1, delays: list = None ) -> None:
+        """
+        :param n_messages: Number of ticker frames sent per connection.
+        :param rate: Frames per second (default: as fast as possible).
+        :param host: Interface to bind to.
+        :param port: Port to bind to (default: any free port).
+        :param kill_after: Abort each connection after this many frames.
+        :param downtime: Refuse connections for this long after a kill [sec].
+        :param n_procs: Number of server processes sharing the port (SO_REUSEPORT).
+        :param delays: (base, mean jitter) per connection [sec]. The stream
+                       starts once len(delays) clients subscribed and all of
+                       them receive the same frames.
+        """
+        self.n_messages = n_messages
+        self.rate       = rate
+        self.kill_after = kill_after
+        self.downtime   = downtime
+        self.down_until = 0.0                                               # End of current outage
+        self.sequence   = {}                                                # Product -> last sequence
+        self.host       = host
+        self.port       = port or free_port( host )
+        self.url        = f'ws://{self.host}:{self.port}'
+        self.n_procs    = n_procs
+        self.processes  : list = []
+        self.delays     = delays
+        self.clients    : list = []                                         # Per client frame queues
+
+    # ------------------------ ___START___: frames ------------------------
+    def frames( self, product_ids: list ):
+        """
+        Generate synthetic ticker frames, cycling over the subscribed products.
+        """
+        sequence = self.sequence
+        for i in range( self.n_messages ):
+            product_id = product_ids[ i % len(product_ids) ]
+            sequence[ product_id ] = sequence.get( product_id, 0 ) + 1
+            price      = 1000.0 + (i % 500) * 0.01
+            yield orjson.dumps( { 'type'        : 'ticker',
+                                  'sequence'    : sequence[ product_id ],
+                                  'product_id'  : product_id,
+                                  'price'       : f'{price:.2f}',
+                                  'best_bid'    : f'{price - 0.01:.2f}',
+                                  'best_ask'    : f'{price + 0.01:.2f}',
+                                  'side'        : 'buy' if i % 2 else 'sell',
+                                  'last_size'   : '0.01000000',
+                                  'trade_id'    : i,
+                                  'time'        : datetime.now( timezone.utc ).isoformat().replace( '+00:00', 'Z' ),
+                                  'ts_sent'     : time() } )
+
+    # ----------------------- ___START___: handler ------------------------
+    async def handler( self, ws, path: str = None ) -> None:
+        """
+        Serve one client: wait for the subscription then stream frames.
+        """
+        if time() < self.down_until:                                        # Outage, refuse client
+            ws.transport.abort()
+            return
+
+        req = orjson.loads( await ws.recv() )                               # Wait for subscription
+        product_ids = req.get( 'product_ids', ['ETH-USD'] )
+        await ws.send( orjson.dumps( { 'type'    : 'subscriptions',
+                                       'channels': [ { 'name'       : c,
+                                                       'product_ids': product_ids }
+                                                     for c in req.get( 'channels', [] ) ] } ) )
+
+        if self.delays:
+            await self.fan_out( ws, product_ids )
+            return
+
+        interval = 1.0 / self.rate if self.rate else 0.0
+        for n, frame in enumerate( self.frames( product_ids ), 1 ):
+            await ws.send( frame )
+            if n == self.kill_after:                                        # Kill connection on purpose
+                self.down_until = time() + self.downtime
+                missed = int( self.downtime * (self.rate or 1000) )         # Frames "published" during the outage
+                for product_id in product_ids:
+                    self.sequence[ product_id ] += missed // len( product_ids ) + 1
+                ws.transport.abort()
+                return
+            if interval:
+                await asyncio.sleep( interval )
+
+    # ----------------------- ___START___: fan_out ------------------------
+    async def fan_out( self, ws, product_ids: list ) -> None:
+        """
+        Serve one client of the shared, delayed stream.
+        """
+        base, jitter = self.delays[ len(self.clients) % len(self.delays) ]
+        queue        = asyncio.Queue()
+        self.clients.append( queue )
+        if len( self.clients ) == len( self.delays ):                       # Everyone is here, start streaming
+            asyncio.ensure_future( self.broadcast( product_ids ) )
+
+        due = 0.0
+        while True:
+            item = await queue.get()
+            if item is None:                                                # Stream is over
+                break
+            t, frame = item
+            delay    = base + ( random.expovariate( 1.0 / jitter ) if jitter else 0.0 )
+            due      = max( due, t + delay )                                # A connection delivers in order
+            wait     = due - time()
+            if wait > 0:
+                await asyncio.sleep( wait )
+            await ws.send( frame )
+
+    # ---------------------- ___START___: broadcast ------------------------
+    async def broadcast( self, product_ids: list ) -> None:
+        """
+        Generate the shared stream and hand every frame to all clients.
+        """
+        interval = 1.0 / self.rate if self.rate else 0.0
+        for frame in self.frames( product_ids ):
+            t = time()
+            for queue in self.clients:
+                queue.put_nowait( (t, frame) )
+            await asyncio.sleep( interval )
+        for queue in self.clients:
+            queue.put_nowait( None )
+
+    # ------------------------- ___START___: serve ------------------------
+    def serve( self ) -> None:
+        """
+        Run the server forever (child process entry point).
+        """
+        async def main():
+            async with websockets.serve( self.handler, self.host, self.port,
+                                         reuse_port = self.n_procs > 1 ):
+                await asyncio.Future()                                      # Run forever
+
+        asyncio.run( main() )
+
+    # ------------------------- ___START___: start ------------------------
+    def start( self ) -> str:
+        """
+        Start the server in child processes.
+
+        :return: Server URL
+        """
+        for _ in range( self.n_procs ):
+            process = multiprocessing.Process( target = self.serve, daemon = True )
+            process.start()
+            self.processes.append( process )
+
+        for _ in range( 100 ):                                              # Wait until it accepts connections
+            try:
+                socket.create_connection( (self.host, self.port), timeout = 0.1 ).close()
+                break
+            except OSError:
+                sleep( 0.05 )
+
+        return self.url
+
+    # ------------------------- ___START___: stop -------------------------
+    def stop( self ) -> None:
+        """
+        Terminate the server processes.
+        """
+        for process in self.processes:
+            process.terminate()
+            process.join()
+        self.processes.clear()
+
+    def __enter__( self ):
+        self.start()
+        return self
+
+    def __exit__( self, type, value, tb ):
+        self.stop()
@@ -0,0 +1,289 @@
+#@formatter:off
+"""
+Local stand-in for the Coinbase REST API.
+
+Runs a threaded HTTP/1.1 (keep-alive) server over TLS in a separate process,
+using a throwaway self-signed certificate. It answers a handful of endpoints
+with canned, Coinbase-shaped JSON after an optional artificial latency:
+
+    > GET prices/{pair}/spot        (v2)
+    > GET products/{pair}/ticker    (pro)
+    > GET accounts, user, currencies, products, fees
+    > POST orders, DELETE orders/{id}
+    > GET fills                     (pro, paginated by CB-AFTER)
+    > GET products/{pair}/candles   (exchange, at most 300 bars)
+    > GET transactions              (v2, paginated by pagination.next_uri)
+
+The server counts requests and TCP connections; GET _stats returns them.
+POST _chaos {"error_rate", "status", "hang_rate", "hang"} makes that share of
+later requests fail with `status`, or hang for `hang` seconds before being
+answered (POST _chaos {} turns it off again).
+Clients must trust `cafile`, e.g. through the REQUESTS_CA_BUNDLE variable.
+
+*** NOTE: Only meant to be used by the benchmarks in this directory
+
+VERSION: 0.0.3
+    - ADDED     : TLS keep-alive stub with request/connection counters
+    - ADDED     : Order placement and cancel
+    - ADDED     : Cursor paginated fills/transactions
+    - ADDED     : Synthetic candles
+    - ADDED     : Fault injection (errors, hangs)
+
+KNOWN ISSUES:
+    - Non encountered
+
+
+AUTHOR                      :   Mohammad Odeh
+DATE                        :   Oct. 18th, 2026 Year of Our Lord
+LAST CONTRIBUTION DATE      :   Oct. 18th, 2026 Year of Our Lord
+"""
+
+from    http.server                 import  BaseHTTPRequestHandler          # Request handling
+from    http.server                 import  ThreadingHTTPServer             # One thread per connection
+from    urllib.parse                import  urlsplit, parse_qs              # Request target parsing
+from    datetime                    import  datetime                        # Candle ranges
+from    os                          import  path                            # Path manipulation
+from    time                        import  sleep                           # Artificial latency
+import  multiprocessing                                                     # Run server in its own process
+import  random                                                              # Fault injection
+import  subprocess                                                          # Certificate generation
+import  tempfile                                                            # Certificate directory
+import  threading                                                           # Counter lock
+import  socket                                                              # Wait for the server
+import  ssl                                                                 # TLS
+import  requests                                                            # Configure the running server
+import  orjson                                                              # Fast, efficient JSON parser
+
+from    LocalFeedServer             import  free_port
+
+
+def make_certificate( directory: str ) -> tuple:
+    """
+    Create a self-signed certificate for 127.0.0.1/localhost.
+
+    :return: (certificate file, key file)
+    """
+    cert, key = path.join( directory, 'cert.pem' ), path.join( directory, 'key.pem' )
+    subprocess.run( [ 'openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-days', '1',
+                      '-subj', '/CN=localhost', '-addext', 'subjectAltName=IP:127.0.0.1,DNS:localhost',
+                      '-keyout', key, '-out', cert ],
+                    check = True, capture_output = True )
+    return cert, key
+
+
+class LocalRestServer( object ):
+    """
+    Coinbase-shaped REST stub served from a child process.
+    """
+    def __init__( self, latency: float = 0.0, host: str = '127.0.0.1', port: int = None,
+                  n_rows: int = 1_000 ) -> None:
+        """
+        :param latency: Artificial processing time per request [sec].
+        :param host: Interface to bind to.
+        :param port: Port to bind to (default: any free port).
+        :param n_rows: Rows behind each paginated endpoint.
+        """
+        self.latency    = latency
+        self.n_rows     = n_rows
+        self.host       = host
+        self.port       = port or free_port( host )
+        self.url        = f'https://{self.host}:{self.port}/'
+        self._tmp       = tempfile.TemporaryDirectory()
+        self.cafile, self.keyfile = make_certificate( self._tmp.name )
+        self.process    : multiprocessing.Process = None
+        self.counts     = { 'requests': 0, 'connections': 0 }               # Child process side
+        self.chaos      = {}                                                # ...
+        self._lock      = threading.Lock()
+
+    # ----------------------- ___START___: respond ------------------------
+    def respond( self, method: str, route: str, query: dict, body: bytes ) -> tuple:
+        """
+        Build the answer to a request.
+
+        :param method: HTTP method.
+        :param route: Path without leading slash or query string.
+        :param query: Parsed query string.
+        :param body: Request body.
+        :return: (status, JSON serializable payload, extra headers)
+        """
+        parts = route.split( '/' )
+        if route == '_stats':
+            return 200, self.counts, {}
+        if route == '_chaos' and method == 'POST':
+            self.chaos = orjson.loads( body or b'{}' )
+            return 200, self.chaos, {}
+        if parts[ 0 ] == 'prices' and len( parts ) == 3:                    # v2 spot price
+            base, currency = parts[ 1 ].split( '-' )
+            return 200, { 'data': { 'base': base, 'currency': currency, 'amount': '30000.01' } }, {}
+        if parts[ 0 ] == 'products' and len( parts ) == 3 and parts[ 2 ] == 'ticker':
+            return 200, { 'trade_id': 1, 'price': '30000.01', 'size': '0.01', 'bid': '30000.00',
+                          'ask': '30000.02', 'volume': '1234.5', 'time': '2022-08-01T00:00:00.000000Z' }, {}
+        if route == 'accounts':
+            return 200, [ { 'id': f'{i:08d}', 'currency': c, 'balance': '1.0', 'available': '1.0',
+                            'hold': '0.0', 'profile_id': 'p' } for i, c in enumerate( ('BTC', 'ETH', 'USD') ) ], {}
+        if route == 'user':
+            return 200, { 'data': { 'id': 'u', 'name': 'Satoshi' } }, {}
+        if route == 'currencies':
+            return 200, [ { 'id': c, 'name': c } for c in ( 'BTC', 'ETH', 'USD' ) ], {}
+        if route == 'products':
+            return 200, [ { 'id': p } for p in ( 'BTC-USD', 'ETH-USD' ) ], {}
+        if route == 'orders' and method == 'POST':
+            order = orjson.loads( body or b'{}' )
+            return 200, dict( order, id = f'{self.counts["requests"]:08d}', status = 'pending' ), {}
+        if parts[ 0 ] == 'orders' and method == 'DELETE' and len( parts ) == 2:
+            return 200, [ parts[1] ], {}
+        if parts[ 0 ] == 'products' and len( parts ) == 3 and parts[ 2 ] == 'candles':
+            return self.candles( query )
+        if route in ( 'fills', 'transactions' ):
+            return self.page( route, query )
+        if route == 'fees':
+            return 200, { 'maker_fee_rate': '0.004', 'taker_fee_rate': '0.006', 'usd_volume': '0' }, {}
+        return 404, { 'message': 'NotFound' }, {}
+
+    # ------------------------ ___START___: page -------------------------
+    def page( self, route: str, query: dict ) -> tuple:
+        """
+        One page of a paginated endpoint, newest row (id n_rows) first.
+
+        :return: (status, payload, extra headers), like respond()
+        """
+        limit  = min( int( query.get( 'limit', ['100'] )[0] ), 100 )
+        cursor = 'after' if route == 'fills' else 'starting_after'
+        start  = int( query.get( cursor, [self.n_rows + 1] )[0] ) - 1      # Rows older than the cursor
+        ids    = range( start, max( start - limit, 0 ), -1 )
+        rows   = [ { 'trade_id': i, 'product_id': 'BTC-USD', 'order_id': f'{i:08d}', 'side': 'buy',
+                     'price': f'{30000 + i * 0.01:.2f}', 'size': '0.01', 'fee': '0.12',
+                     'liquidity': 'T', 'settled': True, 'created_at': '2022-08-01T00:00:00.000000Z' }
+                   for i in ids ]
+        if route == 'fills':                                                # pro: cursor in a header
+            return 200, rows, ( { 'CB-AFTER': str( ids[-1] ) } if rows else {} )
+        next_uri = f'/transactions?limit={limit}&starting_after={ids[-1]}' if len( ids ) and ids[-1] > 1 else None
+        return 200, { 'pagination': { 'next_uri': next_uri, 'limit': limit }, 'data': rows }, {}
+
+    # ----------------------- ___START___: candles ------------------------
+    def candles( self, query: dict ) -> tuple:
+        """
+        Synthetic candles of [start, end] (both inclusive), newest first,
+        as [time, low, high, open, close, volume]. Every 97th interval has
+        no trades and no candle, like quiet markets on the exchange.
+
+        :return: (status, payload, extra headers), like respond()
+        """
+        granularity = int( query[ 'granularity' ][0] )
+        start, end  = ( int( datetime.fromisoformat( query[ key ][0] ).timestamp() ) for key in ( 'start', 'end' ) )
+        start      += -start % granularity
+        if ( end - start ) // granularity + 1 > 300:
+            return 400, { 'message': 'granularity too small for the requested time range' }, {}
+        rows = [ [ t, 100.0 + t % 7, 101.0 + t % 11, 100.5, 100.7, 1.5 ]
+                 for t in range( end - end % granularity, start - 1, -granularity )
+                 if ( t // granularity ) % 97 ]
+        return 200, rows, {}
+
+    # ----------------------- ___START___: handler ------------------------
+    def handler( self ) -> type:
+        """
+        :return: Request handler class bound to this server.
+        """
+        server = self
+
+        class Handler( BaseHTTPRequestHandler ):
+            protocol_version = 'HTTP/1.1'                                   # Keep connections alive
+            disable_nagle_algorithm = True                                  # Headers and body are separate writes
+
+            def setup( self ):
+                self.request.do_handshake()                                 # TLS handshake in this thread
+                with server._lock:
+                    server.counts[ 'connections' ] += 1
+                super().setup()
+
+            def _serve( self ):
+                with server._lock:
+                    server.counts[ 'requests' ] += 1
+                target = urlsplit( self.path )
+                length = int( self.headers.get( 'Content-Length', 0 ) )
+                body   = self.rfile.read( length ) if length else b''
+                if server.latency:
+                    sleep( server.latency )
+                route, chaos, r = target.path.strip( '/' ), server.chaos, random.random()
+                if not route.startswith( '_' ) and r < chaos.get( 'hang_rate', 0.0 ):
+                    sleep( chaos.get( 'hang', 30.0 ) )                      # Hung upstream
+                if not route.startswith( '_' ) and r >= 1.0 - chaos.get( 'error_rate', 0.0 ):
+                    status, payload, headers = chaos.get( 'status', 503 ), { 'message': 'Injected' }, {}
+                else:
+                    status, payload, headers = server.respond( self.command, route,
+                                                               parse_qs( target.query ), body )
+                data = orjson.dumps( payload )
+                self.send_response( status )
+                self.send_header( 'Content-Type'  , 'application/json' )
+                self.send_header( 'Content-Length', str( len(data) ) )
+                for key, value in headers.items():
+                    self.send_header( key, value )
+                self.end_headers()
+                self.wfile.write( data )
+
+            do_GET = do_POST = do_DELETE = _serve
+
+            def log_message( self, *args ):                                 # Quiet
+                pass
+
+        return Handler
+
+    # ------------------------- ___START___: serve ------------------------
+    def serve( self ) -> None:
+        """
+        Run the server forever (child process entry point).
+        """
+        context = ssl.SSLContext( ssl.PROTOCOL_TLS_SERVER )
+        context.load_cert_chain( self.cafile, self.keyfile )
+        class Server( ThreadingHTTPServer ):
+            daemon_threads = True
+
+            def handle_error( self, request, client_address ):          # Clients hanging up are expected
+                pass
+
+        httpd   = Server( (self.host, self.port), self.handler() )
+        httpd.socket = context.wrap_socket( httpd.socket, server_side = True,
+                                            do_handshake_on_connect = False )
+        httpd.serve_forever()
+
+    # ------------------------- ___START___: start ------------------------
+    def start( self ) -> str:
+        """
+        Start the server in a child process.
+
+        :return: Server URL
+        """
+        self.process = multiprocessing.Process( target = self.serve, daemon = True )
+        self.process.start()
+        for _ in range( 100 ):                                              # Wait until it accepts connections
+            try:
+                socket.create_connection( (self.host, self.port), timeout = 0.1 ).close()
+                break
+            except OSError:
+                sleep( 0.05 )
+        return self.url
+
+    # ------------------------- ___START___: stop -------------------------
+    def stop( self ) -> None:
+        """
+        Terminate the server process and remove the certificate.
+        """
+        if self.process is not None:
+            self.process.terminate()
+            self.process.join()
+            self.process = None
+        self._tmp.cleanup()
+
+    # ---------------------- ___START___: set_chaos ------------------------
+    def set_chaos( self, **chaos: float ) -> None:
+        """
+        Inject faults into later requests, see POST _chaos (no arguments: off).
+        """
+        requests.post( self.url + '_chaos', json = chaos, verify = self.cafile ).raise_for_status()
+
+    def __enter__( self ):
+        self.start()
+        return self
+
+    def __exit__( self, type, value, tb ):
+        self.stop()
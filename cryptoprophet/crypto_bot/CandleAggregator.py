@@ -0,0 +1,235 @@
+#@formatter:off
+"""
+Incremental tick-to-candle aggregator.
+
+Builds live OHLCV bars at several granularities from the websocket
+"ticker"/"matches" stream. Every trade updates the open bar of each
+granularity in O(1); when a trade falls into a new interval the previous
+bar is closed, appended to a NumPy history and emitted to subscribers.
+
+Bars use the same column layout as data/sample.csv so that live and
+historical data can go through the same downstream code:
+
+    > Date, High, Low, Open, Close, Volume
+
+*** NOTE: Like the exchange candles endpoint, intervals without trades
+          produce no bar.
+
+*** NOTE: A trade older than the open bar of a granularity (or, after
+          flush, than its last closed bar) arrived too late for that
+          granularity: it is dropped there and counted in `late`
+          (granularity -> trades dropped), so closed bars are never
+          changed or emitted twice.
+
+VERSION: 0.0.1
+    - ADDED     : Multi-granularity aggregation, closed bar subscribers
+
+KNOWN ISSUES:
+    - Non encountered
+
+
+AUTHOR                      :   Mohammad Odeh
+DATE                        :   Oct. 18th, 2026 Year of Our Lord
+LAST CONTRIBUTION DATE      :   Oct. 18th, 2026 Year of Our Lord
+"""
+
+from    typing                      import  Callable, Dict, List, Tuple     # Additional type hints
+import  numpy                       as      np                              # Bar storage
+import  pandas                      as      pd                              # Dataframes to facilitate analysis
+
+from    CoinbaseMessages            import  parse_time                      # ISO timestamp -> epoch
+
+COLUMNS         : Tuple[str, ...] = ( 'Date', 'High', 'Low', 'Open', 'Close', 'Volume' )
+GRANULARITIES   : Dict[str, int]  = { '1s': 1, '1m': 60, '5m': 300, '1h': 3600 }
+
+Bar         = Tuple[ float, float, float, float, float, float ]             # Same order as COLUMNS
+Subscriber  = Callable[ [str, str, Bar], None ]                             # (product_id, granularity, bar)
+
+DATE, HIGH, LOW, OPEN, CLOSE, VOLUME = range( 6 )                           # Column indices
+
+
+class BarHistory( object ):
+    """
+    Closed bars of one product at one granularity, oldest first.
+
+    Storage is a (2 * max_bars, 6) array; once it fills up the newest
+    max_bars rows are moved to the front, so appends are amortized O(1) and
+    memory stays bounded.
+    """
+    __slots__ = ( 'data', 'n', 'max_bars' )
+
+    def __init__( self, max_bars: int ) -> None:
+        self.max_bars = max_bars
+        self.data     = np.empty( (2 * max_bars, len(COLUMNS)) )
+        self.n        = 0
+
+    def __len__( self ) -> int:
+        return min( self.n, self.max_bars )
+
+    def append( self, bar: Bar ) -> None:
+        if self.n == len( self.data ):                                      # Full, drop the oldest half
+            self.data[ :self.max_bars ] = self.data[ self.n - self.max_bars:self.n ]
+            self.n = self.max_bars
+        self.data[ self.n ] = bar
+        self.n += 1
+
+    @property
+    def bars( self ) -> np.ndarray:
+        """
+        :return: View of the last max_bars bars.
+        """
+        return self.data[ max(0, self.n - self.max_bars):self.n ]
+
+
+class CandleAggregator( object ):
+    """
+    Aggregate trades into OHLCV bars at several granularities.
+    """
+    def __init__( self, granularities: Dict[str, int] = None, max_bars: int = 10_000 ) -> None:
+        """
+        :param granularities: Name -> bar length in seconds (default: 1s, 1m, 5m, 1h).
+        :param max_bars: Closed bars kept per product and granularity.
+        """
+        self.granularities  = dict( granularities or GRANULARITIES )
+        self.names          = list( self.granularities )
+        self.seconds        = [ self.granularities[g] for g in self.names ]
+        self.max_bars       = max_bars
+        self.open_bars      : Dict[str, List[list]]        = {}             # Product -> open bar per granularity
+        self.history        : Dict[str, List[BarHistory]]  = {}             # Product -> closed bars per granularity
+        self.closed         : Dict[str, List[float]]       = {}             # Product -> last closed bar start per granularity
+        self.late           : Dict[str, int]               = dict.fromkeys( self.names, 0 )
+        self.subscribers    : List[Subscriber] = []
+
+    # ---------------------- ___START___: subscribe -----------------------
+    def subscribe( self, callback: Subscriber ) -> None:
+        """
+        Call callback( product_id, granularity, bar ) whenever a bar closes.
+        """
+        self.subscribers.append( callback )
+
+    # ------------------------ ___START___: _close ------------------------
+    def _close( self, product_id: str, i: int, bar: list ) -> None:
+        bar = tuple( bar )
+        self.history[ product_id ][ i ].append( bar )
+        self.closed [ product_id ][ i ] = bar[ DATE ]
+        for callback in self.subscribers:
+            callback( product_id, self.names[i], bar )
+
+    # ------------------------ ___START___: update ------------------------
+    def update( self, product_id: str, t: float, price: float, size: float ) -> None:
+        """
+        Add a trade.
+
+        :param product_id: Product such as "BTC-USD".
+        :param t: Trade time [epoch sec].
+        :param price: Trade price.
+        :param size: Trade size.
+        """
+        bars = self.open_bars.get( product_id )
+        if bars is None:                                                    # First trade of the product
+            self.open_bars[ product_id ] = bars = [ None ] * len( self.seconds )
+            self.history[ product_id ]   = [ BarHistory( self.max_bars ) for _ in self.seconds ]
+            self.closed[ product_id ]    = [ float( '-inf' ) ] * len( self.seconds )
+
+        for i, seconds in enumerate( self.seconds ):
+            start = t - t % seconds                                         # Start of the interval
+            bar   = bars[ i ]
+            if bar is None or start > bar[ DATE ]:                          # New interval
+                if bar is not None:                                         #   Close previous bar
+                    self._close( product_id, i, bar )
+                elif start <= self.closed[ product_id ][ i ]:               #   Bar already flushed
+                    self.late[ self.names[i] ] += 1
+                    continue
+                bars[ i ] = [ start, price, price, price, price, size ]
+            elif start < bar[ DATE ]:                                       # Late, its bar is closed
+                self.late[ self.names[i] ] += 1
+            else:                                                           # Same interval
+                if price > bar[ HIGH ]: bar[ HIGH ] = price
+                if price < bar[ LOW  ]: bar[ LOW  ] = price
+                bar[ CLOSE  ]  = price
+                bar[ VOLUME ] += size
+
+    # ----------------------- ___START___: flush --------------------------
+    def flush( self, now: float ) -> None:
+        """
+        Close every open bar whose interval ended before now, even if no
+        trade arrived since. Call periodically on quiet markets.
+
+        :param now: Current time [epoch sec].
+        """
+        for product_id, bars in self.open_bars.items():
+            for i, seconds in enumerate( self.seconds ):
+                bar = bars[ i ]
+                if bar is not None and bar[ DATE ] + seconds <= now:
+                    self._close( product_id, i, bar )
+                    bars[ i ] = None
+
+    # ----------------------- ___START___: handle -------------------------
+    async def handle( self, msg: dict ) -> None:
+        """
+        Websocket handler for "ticker" and "match" messages.
+        """
+        size = msg.get( 'last_size' ) or msg.get( 'size' )
+        if size is None or 'time' not in msg:                               # Ticker without trade information
+            return
+        self.update( msg['product_id'], parse_time( msg['time'] ), float( msg['price'] ), float( size ) )
+
+    # ----------------------- ___START___: attach -------------------------
+    def attach( self, ws, channel: str = 'matches' ) -> None:
+        """
+        Consume trades from a CoinbaseAPI.Websocket.
+
+        :param channel: "matches" or "ticker" (subscribe to one, not both).
+        """
+        if channel == 'matches':                                            # Not last_match: replayed on (re)subscribe
+            channel = 'match'
+        ws.register_handler( channel, self.handle )
+
+    # ----------------------- ___START___: consume ------------------------
+    def consume( self, ticks: np.ndarray, product_ids: List[str] ) -> None:
+        """
+        Add a batch of normalized ticks from CoinbaseShards.ShardedFeed.
+
+        :param ticks: Structured array with TickChannel.DTYPE fields.
+        :param product_ids: Product index -> product id.
+        """
+        for product, t, price, size in zip( ticks['product'].tolist(), ticks['time'].tolist(),
+                                            ticks['price'].tolist(), ticks['size'].tolist() ):
+            self.update( product_ids[ product ], t, price, size )
+
+    # ------------------------ ___START___: bars --------------------------
+    def bars( self, product_id: str, granularity: str ) -> np.ndarray:
+        """
+        :return: Closed bars as a (n, 6) array with COLUMNS layout.
+        """
+        return self.history[ product_id ][ self.names.index( granularity ) ].bars
+
+    # ---------------------- ___START___: to_frame ------------------------
+    def to_frame( self, product_id: str, granularity: str ) -> pd.DataFrame:
+        """
+        :return: Closed bars as a DataFrame laid out like data/sample.csv.
+        """
+        df = pd.DataFrame( self.bars( product_id, granularity ), columns = COLUMNS )
+        df[ 'Date' ] = pd.to_datetime( df['Date'], unit = 's' )
+        return df
+
+
+#%% ----------------- ___START___: Setup script and run -----------------
+
+if __name__ == '__main__':
+    import  asyncio
+    import  orjson
+    from    CoinbaseAPI             import  Websocket
+
+    ws      = Websocket()
+    candles = CandleAggregator()
+    candles.attach( ws, 'matches' )
+    candles.subscribe( lambda product_id, granularity, bar: print( product_id, granularity, bar ) )
+
+    req     = { "type": "subscribe", "product_ids": ["BTC-USD", "ETH-USD"], "channels": ["matches"] }
+    try:
+        asyncio.run( ws.connect( orjson.dumps(req) ) )
+    except KeyboardInterrupt:
+        print( "Interrupt detected" )
+
+#   ----------------- ___ END ___: Setup script and run -----------------
@@ -0,0 +1,280 @@
+#@formatter:off
+"""
+Parallel, resumable historical candle downloader.
+
+The exchange candles endpoint returns at most 300 bars per request, so a
+date range is split into 300-bar chunks that are fetched concurrently
+through an AsyncCoinbaseClient (i.e. under the shared rate limiter). Bars
+end up in an OHLCVStore series (CandleAggregator.COLUMNS), chunks are staged
+until they can be appended:
+
+    <store>/<product_id>/<granularity>/                 OHLCVStore series
+    <store>/_downloads/<product_id>/<granularity>/
+        > done.json             : checkpoint, time ranges already downloaded
+        > parts/<start>-<end>.npy : fetched chunks not in the series yet
+
+Every fetched chunk is saved and checkpointed right away, so an interrupted
+run (crash, Ctrl+C, failed requests) loses at most the chunks in flight; the
+next run skips everything in done.json. The series is append-only, so at
+the end of a run (or of the next one) only the chunks that run without a
+gap from the first wanted one are appended; chunks past a failed one, or
+all of them if the first one failed, wait for it. Where
+chunks overlap, the bars fetched last win. Files are replaced atomically.
+
+*** NOTE: Intervals without trades have no candle, so a finished range can
+          hold fewer than 300 bars per chunk.
+
+*** NOTE: Ranges before the first stored bar are not backfilled; download
+          them into a fresh store.
+
+VERSION: 0.0.1
+    - ADDED     : Chunked concurrent download, checkpoint/resume, columnar store
+
+KNOWN ISSUES:
+    - Non encountered
+
+
+AUTHOR                      :   Mohammad Odeh
+DATE                        :   Oct. 18th, 2026 Year of Our Lord
+LAST CONTRIBUTION DATE      :   Oct. 18th, 2026 Year of Our Lord
+"""
+
+from    typing                      import  Dict, Iterable, List, Tuple     # Additional type hints
+from    datetime                    import  datetime, timezone              # Request timestamps
+from    glob                        import  glob                            # Find parts
+from    os                          import  path, makedirs, replace, remove # Path manipulation
+import  asyncio                                                             # Asynchronous routines
+import  orjson                                                              # Fast, efficient JSON parser
+import  numpy                       as      np                              # Columns
+
+from    CandleAggregator            import  COLUMNS, DATE                   # Bar layout
+from    CoinbaseAsync               import  AsyncCoinbaseClient             # Concurrent REST calls
+from    OHLCVStore                  import  OHLCVStore, Columns             # Bar storage
+
+GRANULARITIES   : Tuple[int, ...] = ( 60, 300, 900, 3600, 21600, 86400 )    # Served by the endpoint [sec]
+MAX_BARS        : int = 300                                                 # Bars per request
+
+Chunk = Tuple[ int, int ]                                                   # [start, end) [epoch sec]
+
+
+def chunks( start: int, end: int, granularity: int, max_bars: int = MAX_BARS ) -> List[Chunk]:
+    """
+    Split [start, end) into requests of at most max_bars bars.
+
+    :param start: First bar time [epoch sec], rounded down to the granularity.
+    :param end: End of the range [epoch sec] (exclusive), rounded down too,
+                so a bar still in progress is never stored.
+    :param granularity: Bar length [sec].
+    :param max_bars: Bars per chunk.
+    """
+    start = start - start % granularity
+    end   = end   - end   % granularity
+    step  = granularity * max_bars
+    return [ ( t, min( t + step, end ) ) for t in range( start, end, step ) ]
+
+
+def iso( t: int ) -> str:
+    """
+    :return: Epoch seconds as ISO 8601 (UTC).
+    """
+    return datetime.fromtimestamp( t, timezone.utc ).isoformat()
+
+
+def save( file: str, array: np.ndarray ) -> None:
+    """
+    Write an .npy file atomically (readers never see a partial file).
+    """
+    tmp = file + '.tmp'
+    with open( tmp, 'wb' ) as f:
+        np.save( f, array )
+    replace( tmp, file )
+
+
+def merge_ranges( ranges: Iterable[Chunk] ) -> List[Chunk]:
+    """
+    :return: Sorted ranges with overlapping/adjacent ones combined.
+    """
+    merged = []
+    for start, end in sorted( ranges ):
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max( merged[-1][1], end )
+        else:
+            merged.append( [ start, end ] )
+    return [ tuple( r ) for r in merged ]
+
+
+class CandleStore( object ):
+    """
+    Download state of one product at one granularity: staged chunks and the
+    OHLCVStore series they are appended to.
+    """
+    def __init__( self, store: OHLCVStore, product_id: str, granularity: int ) -> None:
+        """
+        :param store: Store receiving the bars.
+        :param product_id: Product such as "BTC-USD".
+        :param granularity: Bar length [sec].
+        """
+        self.path        = path.join( store.directory, '_downloads', product_id, str( granularity ) )
+        self.parts       = path.join( self.path, 'parts' )
+        self.series      = store.series( product_id, granularity, COLUMNS )
+        self.product_id  = product_id
+        self.granularity = granularity
+        makedirs( self.parts, exist_ok = True )
+        self.done        = self._read_done()
+
+    def _read_done( self ) -> List[Chunk]:
+        file = path.join( self.path, 'done.json' )
+        if not path.exists( file ):
+            return []
+        with open( file, 'rb' ) as f:
+            return [ tuple( r ) for r in orjson.loads( f.read() ) ]
+
+    # ---------------------- ___START___: missing -------------------------
+    def missing( self, wanted: List[Chunk] ) -> List[Chunk]:
+        """
+        :return: Chunks of wanted not covered by the checkpoint.
+        """
+        return [ c for c in wanted
+                 if not any( start <= c[0] and c[1] <= end for start, end in self.done ) ]
+
+    # ---------------------- ___START___: add_part ------------------------
+    def add_part( self, chunk: Chunk, bars: np.ndarray ) -> None:
+        """
+        Save a fetched chunk, then checkpoint it.
+
+        :param chunk: Range the bars were fetched for.
+        :param bars: (n, 6) bars, COLUMNS layout.
+        """
+        save( path.join( self.parts, f'{chunk[0]}-{chunk[1]}.npy' ), bars )
+        self.done = merge_ranges( self.done + [ chunk ] )
+        tmp       = path.join( self.path, 'done.json.tmp' )
+        with open( tmp, 'wb' ) as f:
+            f.write( orjson.dumps( self.done ) )
+        replace( tmp, path.join( self.path, 'done.json' ) )
+
+    # ----------------------- ___START___: merge --------------------------
+    def merge( self, start: int ) -> int:
+        """
+        Append the staged chunks of the checkpointed range that runs without
+        a gap from start to the series, newest fetch first where chunks
+        overlap. Chunks past a gap, including one at start itself, wait
+        until it is filled.
+
+        :param start: Start of the first wanted chunk [epoch sec].
+        :return: Number of candles stored
+        """
+        parts = {}
+        for file in glob( path.join( self.parts, '*.npy' ) ):
+            parts[ file ] = tuple( int( t ) for t in path.basename( file )[ :-4 ].split( '-' ) )
+        head  = next( ( r for r in self.done if r[0] <= start < r[1] ), None )
+        if head is None:                                                    # Gap at the head
+            return len( self.series )
+
+        files = sorted( ( f for f, c in parts.items() if head[0] <= c[0] and c[1] <= head[1] ),
+                        key = lambda f: ( parts[f], path.getmtime( f ) ) )  # Fetched last, last
+        if files:
+            data = np.concatenate( [ np.load( f ).reshape( -1, len(COLUMNS) ) for f in files ] )
+            _, newest = np.unique( data[ ::-1, DATE ], return_index = True )  # Sorted, last occurrence
+            self.series.append( dict( zip( COLUMNS, data[ len( data ) - 1 - newest ].T ) ) )
+            for f in files:
+                remove( f )
+        return len( self.series )
+
+
+class CandleDownloader( object ):
+    """
+    Download candle history of many products concurrently.
+    """
+    EXCHANGE_URL    : str = AsyncCoinbaseClient.EXCHANGE_URL
+
+    def __init__( self, client: AsyncCoinbaseClient, store: OHLCVStore, url: str = EXCHANGE_URL ) -> None:
+        """
+        :param client: Client to fetch through; its concurrency bounds the
+                       requests in flight, its rate limiter paces them.
+        :param store: Store receiving the bars.
+        :param url: Exchange API URL.
+        """
+        self.client    = client
+        self.store     = store
+        self.url       = url
+
+    # ------------------------ ___START___: fetch -------------------------
+    async def fetch( self, product_id: str, granularity: int, chunk: Chunk ) -> np.ndarray:
+        """
+        :return: Candles of one chunk, (n, 6) in COLUMNS layout, oldest first
+        """
+        params = { 'granularity': granularity, 'start': iso( chunk[0] ),
+                   'end'        : iso( chunk[1] - granularity ) }           # Both ends are inclusive
+        rows   = await self.client.request( 'GET', f'products/{product_id}/candles',
+                                            params = params, url = self.url, lane = 'market' )
+        bars   = np.array( rows, dtype = 'f8' ).reshape( -1, 6 )            # [time, low, high, open, close, volume]
+        return bars[ ::-1, [0, 2, 1, 3, 4, 5] ]                             # Oldest first, COLUMNS order
+
+    # ----------------------- ___START___: download -----------------------
+    async def download( self, product_id: str, granularity: int, start: int, end: int ) -> Dict[str, int]:
+        """
+        Download [start, end) of one product, skipping what is already stored.
+
+        :param product_id: Product such as "BTC-USD".
+        :param granularity: One of GRANULARITIES [sec].
+        :param start: Start of the range [epoch sec].
+        :param end: End of the range [epoch sec].
+        :return: {'chunks', 'skipped', 'fetched', 'failed', 'candles'}
+        """
+        if granularity not in GRANULARITIES:
+            raise ValueError( f'Granularity {granularity} is not one of {GRANULARITIES}' )
+        store  = CandleStore( self.store, product_id, granularity )
+        wanted = chunks( start, end, granularity )
+        todo   = store.missing( wanted )
+
+        async def one( chunk: Chunk ) -> None:
+            store.add_part( chunk, await self.fetch( product_id, granularity, chunk ) )
+
+        try:
+            results = await asyncio.gather( *( one(c) for c in todo ), return_exceptions = True )
+        finally:                                                            # Also keep what a cancelled run got
+            candles = store.merge( wanted[0][0] ) if wanted else len( store.series )
+        failed = sum( isinstance( r, Exception ) for r in results )
+        return { 'chunks' : len( wanted ), 'skipped': len( wanted ) - len( todo ),
+                 'fetched': len( todo ) - failed, 'failed': failed, 'candles': candles }
+
+    # --------------------- ___START___: download_many --------------------
+    async def download_many( self, product_ids: Iterable[str], granularity: int,
+                             start: int, end: int ) -> Dict[str, Dict[str, int]]:
+        """
+        download() of several products at once.
+
+        :return: Product -> download() summary
+        """
+        product_ids = list( product_ids )
+        results     = await asyncio.gather( *( self.download( p, granularity, start, end )
+                                               for p in product_ids ) )
+        return dict( zip( product_ids, results ) )
+
+    # ------------------------- ___START___: load -------------------------
+    def load( self, product_id: str, granularity: int, start: float = None, end: float = None ) -> Columns:
+        """
+        :return: Stored candles of [start, end), see OHLCVStore.load()
+        """
+        return self.store.load( product_id, granularity, start, end )
+
+
+#%% ----------------- ___START___: Setup script and run -----------------
+
+if __name__ == '__main__':
+    from dotenv     import  dotenv_values                               # Read key-value pairs from a .env file without modifying the environment
+    from dotenv     import  find_dotenv                                 # Search for the .env within the main directory and subdirectories
+    from time       import  time                                        # Get time
+    env_dir         = find_dotenv()                                     # Store absolute path to .env file
+    cb_key          = dotenv_values( env_dir )['cb_key']                # Read key
+    cb_secret       = dotenv_values( env_dir )['cb_secret']             # Read secret
+
+    async def main():
+        async with AsyncCoinbaseClient( cb_key, cb_secret, concurrency = 8 ) as client:
+            downloader = CandleDownloader( client, OHLCVStore( 'candles' ) )
+            end        = int( time() )
+            print( await downloader.download_many( ['BTC-USD', 'ETH-USD'], 3600, end - 365 * 86400, end ) )
+
+    asyncio.run( main() )
+
+#   ----------------- ___ END ___: Setup script and run -----------------
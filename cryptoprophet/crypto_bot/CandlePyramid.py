@@ -0,0 +1,228 @@
+#@formatter:off
+"""
+Multi-resolution candle pyramid over an OHLCVStore.
+
+Coarser levels (hourly ... weekly, monthly) of a base series are built once
+from it and stored as OHLCVStore series of their own, with the same columns
+as the base (data/sample.csv layout: Date, High, Low, Open, Close, Volume,
+and any extra column such as "Adj Close"):
+
+    <store>/<symbol>/<base granularity>/        base series
+    <store>/_pyramid/<symbol>/<base>/<level>/   one series per level, e.g. "1d"
+    <store>/_pyramid/<symbol>/<base>.json       base rows consumed, open bar per level
+
+Levels live under "_pyramid", so they never mix with series stored or
+imported at the same granularity and are not listed by
+OHLCVStore.symbols/granularities or DatasetCatalog.
+
+A level bar is stamped with the start of its interval. Weeks start on
+Monday 00:00 UTC and months on the 1st. High/Low are max/min, Open the first value,
+Volume the sum, and every other column (Close, Adj Close) the last value.
+
+Only complete bars are stored, keeping the series append-only. The bar of
+the interval still in progress is kept in the JSON state and returned with
+queries. refresh() aggregates only the base rows appended since the last
+refresh, so keeping the pyramid current costs O(new rows). Queries read the
+requested level only and never touch finer data.
+
+VERSION: 0.0.1
+    - ADDED     : Hour to month levels, incremental refresh, level picking for charts
+
+KNOWN ISSUES:
+    - Non encountered
+
+
+AUTHOR                      :   Mohammad Odeh
+DATE                        :   Oct. 18th, 2026 Year of Our Lord
+LAST CONTRIBUTION DATE      :   Oct. 18th, 2026 Year of Our Lord
+"""
+
+from    typing                      import  Dict, List, Sequence            # Additional type hints
+from    os                          import  path, makedirs, replace         # Path manipulation
+import  orjson                                                              # Fast, efficient JSON parser
+import  numpy                       as      np                              # Aggregation
+import  pandas                      as      pd                              # Dataframes to facilitate analysis
+
+from    OHLCVStore                  import  OHLCVStore, Series, Columns, DTYPE, INDEX
+
+WEEK    : int = 7 * 86400
+MONTH   : int = 30 * 86400                                                  # Nominal; bars follow calendar months
+MONDAY  : int = 4 * 86400                                                   # 1970-01-05T00:00:00Z, week alignment
+
+LEVELS  : Dict[str, int] = { '1h': 3600, '6h': 21600, '1d': 86400, '1w': WEEK, '1M': MONTH }
+
+FIRST   = ( 'Open', )                                                       # Columns aggregated by first value
+SUMMED  = ( 'Volume', )                                                     # ...                by sum
+
+
+def bucket( t: np.ndarray, granularity: int ) -> np.ndarray:
+    """
+    :param t: Bar times [epoch sec].
+    :param granularity: Level granularity [sec].
+    :return: Start of the level interval of each time [epoch sec]
+    """
+    if granularity == MONTH:
+        months = t.astype( np.int64 ).astype( 'datetime64[s]' ).astype( 'datetime64[M]' )
+        return months.astype( 'datetime64[s]' ).astype( np.int64 ).astype( DTYPE )
+    offset = MONDAY if granularity == WEEK else 0
+    return t - ( t - offset ) % granularity
+
+
+def aggregate( data: Columns, keys: np.ndarray ) -> Columns:
+    """
+    Combine consecutive rows with the same key into one bar.
+
+    :param data: Column -> values, time ordered.
+    :param keys: Interval start of every row, non-decreasing.
+    :return: Column -> value per interval
+    """
+    starts = np.flatnonzero( np.r_[ True, keys[ 1: ] != keys[ :-1 ] ] )
+    ends   = np.r_[ starts[ 1: ], len( keys ) ] - 1
+    out    = {}
+    for name, values in data.items():
+        if   name == INDEX   : out[ name ] = keys[ starts ]
+        elif name == 'High'  : out[ name ] = np.maximum.reduceat( values, starts )
+        elif name == 'Low'   : out[ name ] = np.minimum.reduceat( values, starts )
+        elif name in FIRST   : out[ name ] = values[ starts ]
+        elif name in SUMMED  : out[ name ] = np.add.reduceat( values, starts )
+        else                 : out[ name ] = values[ ends ]
+    return out
+
+
+def combine( bar: Dict[str, float], data: Columns ) -> Columns:
+    """
+    Fold an earlier bar of the same interval into the first row of data.
+    """
+    data = { name: np.array( values ) for name, values in data.items() }   # Do not modify the caller's rows
+    for name, value in bar.items():
+        if   name == INDEX   : continue
+        elif name == 'High'  : data[ name ][ 0 ] = max( value, data[ name ][ 0 ] )
+        elif name == 'Low'   : data[ name ][ 0 ] = min( value, data[ name ][ 0 ] )
+        elif name in FIRST   : data[ name ][ 0 ] = value
+        elif name in SUMMED  : data[ name ][ 0 ] += value
+    return data
+
+
+class CandlePyramid( object ):
+    """
+    Coarser levels of the base series of each symbol.
+    """
+    def __init__( self, store: OHLCVStore, base: int = 60, levels: Dict[str, int] = None ) -> None:
+        """
+        :param store: Store holding the base series.
+        :param base: Granularity of the base series [sec].
+        :param levels: Name -> granularity [sec] (default: LEVELS coarser than base).
+        """
+        self.store  = store
+        self.base   = base
+        self.levels = { name: g for name, g in ( levels or LEVELS ).items()
+                        if g > base and ( g == MONTH and 86400 % base == 0 or g % base == 0 ) }
+
+    def _state_file( self, symbol: str ) -> str:
+        return path.join( self.store.directory, '_pyramid', symbol, f'{self.base}.json' )
+
+    def _level( self, symbol: str, level: str, columns: Sequence[str] = None ) -> Series:
+        return Series( path.join( self.store.directory, '_pyramid', symbol, str( self.base ), level ), columns )
+
+    def _state( self, symbol: str ) -> dict:
+        file = self._state_file( symbol )
+        if not path.exists( file ):
+            return { 'rows': 0, 'open': {} }
+        with open( file, 'rb' ) as f:
+            return orjson.loads( f.read() )
+
+    def _granularity( self, level: str ) -> int:
+        if level not in self.levels:
+            raise KeyError( f'Unknown level "{level}", expected one of {list(self.levels)}' )
+        return self.levels[ level ]
+
+    # ----------------------- ___START___: refresh ------------------------
+    def refresh( self, symbol: str ) -> Dict[str, int]:
+        """
+        Aggregate the base rows appended since the last refresh into every
+        level (all of them the first time).
+
+        :param symbol: Symbol such as "BTC-USD".
+        :return: Level -> complete bars appended
+        """
+        series = self.store.series( symbol, self.base )
+        state  = self._state( symbol )
+        new    = { name: series[ name ][ state[ 'rows' ]: ] for name in series.columns }
+        added  = dict.fromkeys( self.levels, 0 )
+        if len( new[ INDEX ] ) == 0:
+            return added
+
+        for name, granularity in self.levels.items():
+            bars = aggregate( new, bucket( new[ INDEX ], granularity ) )
+            bar  = state[ 'open' ].get( name )                              # Bar in progress
+            if bar is not None and bar[ INDEX ] == bars[ INDEX ][ 0 ]:
+                bars = combine( bar, bars )
+            elif bar is not None:                                           # Its interval ended
+                bars = { c: np.r_[ bar[ c ], bars[ c ] ] for c in bars }
+            level = self._level( symbol, name, series.columns )
+            added[ name ] = level.append( { c: v[ :-1 ] for c, v in bars.items() } )
+            state[ 'open' ][ name ] = { c: float( v[ -1 ] ) for c, v in bars.items() }
+
+        state[ 'rows' ] = len( series )
+        file = self._state_file( symbol )
+        makedirs( path.dirname( file ), exist_ok = True )
+        with open( file + '.tmp', 'wb' ) as f:
+            f.write( orjson.dumps( state ) )
+        replace( file + '.tmp', file )
+        return added
+
+    def append( self, symbol: str, data: Columns ) -> Dict[str, int]:
+        """
+        Append bars to the base series, then refresh the levels.
+
+        :return: Level -> complete bars appended
+        """
+        self.store.series( symbol, self.base ).append( data )
+        return self.refresh( symbol )
+
+    # ------------------------- ___START___: bars -------------------------
+    def bars( self, symbol: str, level: str, start: float = None, end: float = None,
+              partial: bool = True ) -> Columns:
+        """
+        Bars of a level in [start, end), read from that level only.
+
+        :param symbol: Symbol such as "BTC-USD".
+        :param level: Level name, e.g. "1w".
+        :param start: First bar time [epoch sec].
+        :param end: End time [epoch sec], exclusive.
+        :param partial: Include the bar still in progress.
+        :return: Column -> values (views unless the bar in progress is added)
+        """
+        self._granularity( level )                                          # Known level
+        bars        = self._level( symbol, level ).window( start, end )
+        bar         = self._state( symbol )[ 'open' ].get( level ) if partial else None
+        if bar is not None and ( start is None or bar[ INDEX ] >= start ) and ( end is None or bar[ INDEX ] < end ):
+            bars = { c: np.append( v, bar[ c ] ) for c, v in bars.items() }
+        return bars
+
+    def to_frame( self, symbol: str, level: str, start: float = None, end: float = None ) -> pd.DataFrame:
+        """
+        :return: Bars of a level as a DataFrame laid out like data/sample.csv.
+        """
+        df = pd.DataFrame( self.bars( symbol, level, start, end ) )
+        df[ INDEX ] = pd.to_datetime( df[ INDEX ], unit = 's' )
+        return df
+
+    # ----------------------- ___START___: level_for ----------------------
+    def level_for( self, start: float, end: float, max_bars: int = 500 ) -> str:
+        """
+        Finest level showing [start, end) in at most max_bars bars, e.g. for charts.
+
+        :return: Level name (the coarsest one if none is small enough)
+        """
+        names = self.names()
+        for name in names:
+            if ( end - start ) / self.levels[ name ] <= max_bars:
+                return name
+        return names[ -1 ]
+
+    def names( self ) -> List[str]:
+        """
+        :return: Level names, finest first.
+        """
+        return sorted( self.levels, key = self.levels.get )
@@ -2,8 +2,17 @@
 """
 Create a Coinbase Pro client here
 
-VERSION: 0.0.1
+VERSION: 0.0.7
     - ADDED     : Pre-planning stage
+    - ADDED     : Non-blocking consumer loop. Frames are pushed onto a bounded
+                  asyncio.Queue and dispatched to per-channel async handlers
+    - ADDED     : Supervised reconnects with jittered backoff, automatic
+                  resubscription and per product sequence gap resync
+    - ADDED     : Raw frame recording and replay through the handler pipeline
+    - ADDED     : Typed decoding that drops unhandled frames before parsing
+    - ADDED     : Feed metrics (rates, queue depth, lag, handler times, drops)
+                  and queue overflow policies (block/drop_oldest/coalesce)
+    - ADDED     : Redundant connections merged by first arrival
 
 KNOWN ISSUES:
     - Non encountered
@@ -11,44 +20,525 @@ KNOWN ISSUES:
 
 AUTHOR                      :   Mohammad Odeh
 DATE                        :   Jun. 13th, 2022 Year of Our Lord
-LAST CONTRIBUTION DATE      :   Jul. 31st, 2022 Year of Our Lord
+LAST CONTRIBUTION DATE      :   Oct. 18th, 2026 Year of Our Lord
 """
 
+from    typing                      import  Awaitable, Callable, Dict, List # Additional type hints
+from    typing                      import  Iterable, Set, Tuple            # ...
+from    collections                 import  defaultdict, OrderedDict        # Handler registry, dedupe window
+from    time                        import  time, monotonic, perf_counter   # Get time
 import  asyncio                                                             # Asynchronous routines
-import time
+import  random                                                              # Jittered backoff
+import  requests                                                            # REST snapshots
 import  websockets                                                          # Connect to websocket server
 import  orjson                                                              # Fast, efficient JSON parser
 
+from    CoinbaseMessages            import  MessageDecoder                  # Typed decoding
+from    CoinbaseMessages            import  peek_field, peek_int, peek_type # Coalescing/dedupe keys
+from    FeedMetrics                 import  FeedMetrics, Histogram          # Lag and backpressure metrics
+
+Handler = Callable[ [dict], Awaitable[None] ]                               # Async message handler
+
 class Websocket( object ):
-    
-    API_URL         : str = 'wss://ws-feed.exchange.coinbase.com'
-    
-    def __init__( self ) -> None:
-        self.init_run = True                                                # Initial run flag
-        self.URL = self.API_URL                                             # Use default API URL
-        
-        
+    """
+    Coinbase websocket feed consumer.
+
+    Received frames are timestamped and pushed onto a bounded queue by the
+    receiver; a separate consumer decodes them and hands them over to the
+    async handlers registered for the frame's channel. Neither side blocks
+    the event loop.
+
+    Dropped connections are re-established with jittered exponential backoff
+    and the subscription is sent again on every new connection. Per product
+    sequence numbers are tracked so that stale frames are discarded and gaps
+    trigger a REST snapshot resync.
+
+    When handlers fall behind and the queue fills up, the overflow policy
+    decides what happens to new frames:
+        - "block"       : the receiver waits (the socket buffers, then the
+                          exchange eventually disconnects a slow client)
+        - "drop_oldest" : the oldest queued frame is discarded
+        - "coalesce"    : a queued ticker/heartbeat/status frame of the same
+                          product is replaced by the newer one; other frames block
+
+    With redundancy > 1, that many connections carry the same subscription,
+    each supervised on its own. Frames are merged by (type, product_id,
+    sequence), or by their content when unsequenced (e.g. l2update), and only
+    the first copy to arrive is queued. The feed counts as down (resync,
+    recovery time) only while every connection is down.
+    """
+    API_URL         : str   = 'wss://ws-feed.exchange.coinbase.com'
+    REST_URL        : str   = 'https://api.exchange.coinbase.com/'
+    QUEUE_SIZE      : int   = 10_000                                        # Max. frames waiting to be handled
+    BACKOFF_BASE    : float = 0.1                                           # First reconnect delay [sec]
+    BACKOFF_CAP     : float = 5.0                                           # Max. reconnect delay [sec]
+    PING_INTERVAL   : float = 10.0                                          # Keepalive ping interval [sec]
+    PING_TIMEOUT    : float = 10.0                                          # Dead connection timeout [sec]
+
+    # Message types sent over each channel. Handlers can be registered either
+    # by channel name or by message type.
+    CHANNEL_TYPES   : Dict[str, tuple] = { 'ticker'         : ( 'ticker', ),
+                                           'ticker_batch'   : ( 'ticker', ),
+                                           'level2'         : ( 'snapshot', 'l2update' ),
+                                           'level2_batch'   : ( 'snapshot', 'l2update' ),
+                                           'matches'        : ( 'match', 'last_match' ),
+                                           'heartbeat'      : ( 'heartbeat', ),
+                                           'status'         : ( 'status', ) }
+
+    # Message types whose sequence numbers are contiguous per product (full
+    # channel). Ticker and match sequences skip by design, so a jump there is
+    # not a gap; a match only joins the contiguous stream of a product once
+    # one of these has been seen for it, i.e. when it comes from the full
+    # channel.
+    GAP_TYPES       : tuple = ( 'received', 'open', 'done', 'change', 'activate' )
+
+    # Message types where only the latest value per product matters.
+    COALESCE_TYPES  : tuple = ( 'ticker', 'heartbeat', 'status' )
+    OVERFLOW        : tuple = ( 'block', 'drop_oldest', 'coalesce' )
+    DEDUPE_WINDOW   : int   = 100_000                                       # Recent frame keys kept for merging
+
+    def __init__( self, url: str = None, queue_size: int = QUEUE_SIZE,
+                  reconnect: bool = True, gap_types: tuple = GAP_TYPES,
+                  recorder = None, typed: bool = False,
+                  overflow: str = 'block', metrics: bool = True,
+                  redundancy: int = 1 ) -> None:
+        """
+        :param url: Feed URL (default: Coinbase Exchange feed).
+        :param queue_size: Max. number of frames waiting to be handled.
+        :param reconnect: Re-establish dropped connections.
+        :param gap_types: Message types checked for sequence gaps.
+        :param recorder: FeedRecorder.FeedRecorder receiving every raw frame.
+        :param typed: Decode ticker/l2update/match frames into CoinbaseMessages
+                      records and drop frames without handlers unparsed.
+        :param overflow: Policy once the queue is full: "block", "drop_oldest"
+                         or "coalesce".
+        :param metrics: Collect FeedMetrics (costs a few timer calls per frame).
+        :param redundancy: Number of parallel connections with the same subscription.
+        """
+        if overflow not in self.OVERFLOW:
+            raise ValueError( f'Unknown overflow policy "{overflow}", use one of {self.OVERFLOW}' )
+        if redundancy < 1:
+            raise ValueError( f'redundancy must be at least 1, got {redundancy}' )
+
+        self.URL        = url or self.API_URL                               # Use default API URL unless overridden
+        self.queue_size = queue_size                                        # Size of the frame queue
+        self.reconnect  = reconnect                                         # Supervise connection
+        self.gap_types  = frozenset( gap_types )                            # Types checked for gaps
+        self.recorder   = recorder                                          # Raw frame recorder
+        self.replaying  = False                                             # Frames come from a recording
+        self.typed      = typed                                             # Use typed decoding
+        self.decoder    : MessageDecoder = None                             # Created when consuming starts
+        self.overflow   = overflow                                          # Queue overflow policy
+        self.metrics    = FeedMetrics() if metrics else None                # Lag and backpressure metrics
+        self._pending   : Dict[tuple, list] = {}                            # Coalescible frames still queued
+        self.queue      : asyncio.Queue = None                              # Created inside the running loop
+        self.handlers   : Dict[str, List[Handler]] = defaultdict( list )    # Message type -> handlers
+        self.sequences  : Dict[object, int] = {}                            # Last sequence per product (and type)
+        self.contiguous : Set[str] = set()                                  # Products with gap type messages
+        self.product_ids: List[str] = []                                    # Subscribed products
+        self.running    = False                                             # Loop flag
+        self.redundancy = redundancy                                        # Parallel connections
+        self.sockets    : Dict[int, object] = {}                            # Connection index -> open connection
+        self._seen      : OrderedDict = OrderedDict()                       # Frame key -> [winner, t, settled]
+        self._t_drop    : float = None                                      # Time the last connection dropped
+        self._frames    : Dict[int, int] = {}                               # Connection index -> frames received
+        self._resyncing = set()                                             # Products being resynced
+        self.stats      = { 'reconnects': 0, 'gaps'    : 0,                 # Supervisor statistics
+                            'stale'     : 0, 'resyncs' : 0,
+                            'recovery'  : [],
+                            'duplicates': 0,                                # Redundant copies discarded
+                            'wins'      : [ 0 ] * redundancy,               # First arrivals per connection
+                            'margin'    : [ Histogram() for _ in range(redundancy) ] } # Lead over 2nd copy [sec]
+
+    # ------------------- ___START___: register_handler -------------------
+    def register_handler( self, channel: str, handler: Handler ) -> None:
+        """
+        Register an async handler for a channel.
+
+        :param channel: Channel name (e.g. "ticker", "level2_batch"), message
+                        type (e.g. "l2update") or "*" to receive every frame.
+        :param handler: Coroutine function taking the decoded message.
+        """
+        if not asyncio.iscoroutinefunction( handler ):                      # Handlers MUST be async
+            raise TypeError( f'"{handler}" is not a coroutine function' )   #   If not, raise error
+
+        for msg_type in self.CHANNEL_TYPES.get( channel, (channel,) ):      # Expand channel into message types
+            self.handlers[ msg_type ].append( handler )                     #   Register handler
+
+    # ---------------------- ___START___: dispatch ------------------------
+    async def dispatch( self, msg: dict ) -> None:
+        """
+        Hand a decoded message over to its handlers.
+
+        :param msg: Decoded message.
+        """
+        for handler in self.handlers.get( msg.get('type'), () ):            # Type specific handlers
+            await handler( msg )                                            #   ...
+        for handler in self.handlers.get( '*', () ):                        # Catch-all handlers
+            await handler( msg )                                            #   ...
+
+    # ------------------- ___START___: check_sequence ---------------------
+    def check_sequence( self, msg: dict ) -> bool:
+        """
+        Track per product sequence numbers. Gap types (and matches of the
+        full channel) share one sequence stream per product; other types
+        (ticker, matches channel, ...) are tracked per product and type,
+        since a ticker carries its match's sequence.
+
+        :param msg: Decoded message.
+        :return: False if the message is stale and must be discarded.
+        """
+        seq = msg.get( 'sequence' )
+        pid = msg.get( 'product_id' )
+        if seq is None or pid is None:                                      # Not sequenced
+            return True
+
+        if msg.get( 'type' ) == 'snapshot':                                 # Snapshots set a new baseline
+            self.sequences[ pid ] = seq                                     #   ...
+            return True
+
+        kind = msg.get( 'type' )
+        gap  = kind in self.gap_types
+        if gap:
+            self.contiguous.add( pid )
+        elif kind == 'match':                                               # Contiguous on the full channel only
+            gap = pid in self.contiguous
+        key  = pid if gap else ( pid, kind )                                # A ticker repeats its match's sequence
+        last = self.sequences.get( key )
+        if last is not None:
+            if seq <= last:                                                 # Already seen (or older than snapshot)
+                self.stats[ 'stale' ] += 1                                  #   Discard
+                return False
+            if seq != last + 1 and gap:                                     # Missed messages
+                self.stats[ 'gaps' ] += 1                                   #   Resync product
+                self.schedule_resync( pid )
+
+        self.sequences[ key ] = seq
+        return True
+
+    # ------------------- ___START___: schedule_resync --------------------
+    def schedule_resync( self, product_id: str ) -> None:
+        """
+        Resync a product in the background, unless already in progress.
+        Recordings already contain the snapshots fetched while recording.
+        """
+        if self.replaying:
+            return
+        if product_id not in self._resyncing:
+            self._resyncing.add( product_id )
+            asyncio.ensure_future( self.resync( product_id ) )
+
+    # ------------------- ___START___: fetch_snapshot ---------------------
+    def fetch_snapshot( self, product_id: str ) -> dict:
+        """
+        Fetch a level2 order book snapshot over REST (blocking).
+
+        :param product_id: Product such as "BTC-USD".
+        :return: Snapshot in the same layout as the websocket "snapshot" message.
+        """
+        resp = requests.get( f'{self.REST_URL}products/{product_id}/book',
+                             params = {'level': 2}, timeout = 10 )
+        resp.raise_for_status()
+        book = orjson.loads( resp.content )
+        return { 'type'         : 'snapshot',
+                 'product_id'   : product_id,
+                 'sequence'     : book[ 'sequence' ],
+                 'bids'         : [ level[:2] for level in book['bids'] ],
+                 'asks'         : [ level[:2] for level in book['asks'] ] }
+
+    # ----------------------- ___START___: resync -------------------------
+    async def resync( self, product_id: str ) -> None:
+        """
+        Bring a product back in sync after a gap or a reconnect.
+
+        If anyone consumes order book snapshots, a fresh one is fetched and
+        queued behind the live frames; otherwise the sequence baseline is
+        simply reset so the next message is accepted.
+        """
+        try:
+            if self.handlers.get( 'snapshot' ):
+                loop = asyncio.get_event_loop()
+                snapshot = await loop.run_in_executor( None, self.fetch_snapshot, product_id )
+                t = time()
+                if self.recorder is not None:                               # Needed to replay deterministically
+                    self.recorder.write( t, orjson.dumps( snapshot ) )
+                await self.queue.put( (t, snapshot) )                       # Keep ordering with live frames
+            else:
+                self.sequences.pop( product_id, None )
+            self.stats[ 'resyncs' ] += 1
+        except Exception as err:
+            print( "ResyncError", product_id, err )
+        finally:
+            self._resyncing.discard( product_id )
+
+    # ----------------------- ___START___: backoff ------------------------
+    def backoff( self, attempt: int ) -> float:
+        """
+        Full jitter exponential backoff.
+
+        :param attempt: Number of consecutive failed attempts.
+        :return: Delay before the next attempt [sec]
+        """
+        return random.uniform( 0, min( self.BACKOFF_CAP, self.BACKOFF_BASE * 2 ** attempt ) )
+
+    # ---------------------- ___START___: _receive ------------------------
+    async def _receive( self, ws, conn: int = 0 ) -> int:
+        """
+        Push raw frames onto the queue as soon as they arrive.
+        Decoding is left to the consumer so the socket is drained quickly.
+
+        :param conn: Connection index.
+        :return: Number of frames received on this connection.
+        """
+        n = 0
+        recorder  = self.recorder
+        redundant = self.redundancy > 1
+        try:
+            async for frame in ws:                                          # Loop over incoming frames
+                t = time()
+                n += 1
+                if redundant and not self._first_arrival( t, frame, conn ): # Another connection was faster
+                    continue
+                if self._t_drop is not None:                                # First frame after a drop
+                    self.stats[ 'recovery' ].append( t - self._t_drop )     #   Record recovery time
+                    self._t_drop = None                                     #   ...
+                if recorder is not None:                                    # Record raw frame
+                    recorder.write( t, frame )                              #   ...
+                await self._enqueue( t, frame )                             # Queue according to overflow policy
+        finally:                                                            # Also when the connection dies
+            self._frames[ conn ] = n                                        #   ...
+        return n
+
+    # ------------------- ___START___: _first_arrival ---------------------
+    def _first_arrival( self, t: float, frame, conn: int ) -> bool:
+        """
+        Merge redundant connections.
+
+        :param t: Receive time [epoch sec].
+        :param frame: Raw frame.
+        :param conn: Connection index it arrived on.
+        :return: True if this is the first copy of the frame.
+        """
+        seq  = peek_int( frame, 'sequence' )
+        key  = frame if seq is None else ( peek_type(frame), peek_field(frame, 'product_id'), seq )
+        seen = self._seen
+        entry = seen.get( key )
+        if entry is None:                                                   # First copy
+            seen[ key ] = [ conn, t, False ]
+            if len( seen ) > self.DEDUPE_WINDOW:
+                seen.popitem( last = False )
+            return True
+
+        self.stats[ 'duplicates' ] += 1
+        if not entry[ 2 ]:                                                  # Runner-up settles the race
+            winner    = entry[ 0 ]
+            entry[ 2 ] = True
+            self.stats[ 'wins'   ][ winner ] += 1
+            self.stats[ 'margin' ][ winner ].record( t - entry[1] )
+        return False
+
+    # ------------------ ___START___: redundancy_report -------------------
+    def redundancy_report( self ) -> List[dict]:
+        """
+        :return: Per connection: races won, share of races won and the
+                 margin it won by (histogram summary, seconds).
+        """
+        races = sum( self.stats['wins'] ) or 1
+        return [ { 'connection' : conn,
+                   'wins'       : wins,
+                   'share'      : wins / races,
+                   'margin'     : self.stats[ 'margin' ][ conn ].summary() }
+                 for conn, wins in enumerate( self.stats['wins'] ) ]
+
+    # ---------------------- ___START___: _enqueue ------------------------
+    async def _enqueue( self, t: float, frame ) -> None:
+        """
+        Queue a raw frame, applying the overflow policy.
+
+        Coalescible frames are queued as [t, frame, key] lists so that a newer
+        frame of the same type and product can overwrite one still waiting.
+        """
+        queue   = self.queue
+        metrics = self.metrics
+        if metrics is not None:
+            metrics.receive( queue.qsize() )
+
+        if self.overflow == 'coalesce':
+            msg_type = peek_type( frame )
+            if msg_type in self.COALESCE_TYPES:
+                key  = ( msg_type, peek_field( frame, 'product_id' ) )
+                item = self._pending.get( key )
+                if item is not None:                                        # Older one still queued
+                    item[ 0 ], item[ 1 ] = t, frame                         #   Overwrite in place
+                    if metrics is not None:
+                        metrics.dropped[ 'coalesced' ] += 1
+                    return
+                item = self._pending[ key ] = [ t, frame, key ]
+                await queue.put( item )
+                return
+
+        elif self.overflow == 'drop_oldest' and queue.full():
+            queue.get_nowait()                                              # Discard the oldest frame
+            queue.task_done()                                               #   ...
+            if metrics is not None:
+                metrics.dropped[ 'overflow' ] += 1
+
+        await queue.put( (t, frame) )                                       # Wait only if the queue is full
+
+    # ---------------------- ___START___: _consume ------------------------
+    async def _consume( self ) -> None:
+        """
+        Decode queued frames and dispatch them to the registered handlers.
+        """
+        if self.typed:                                                      # Only parse what is handled
+            wanted       = None if '*' in self.handlers else set( self.handlers )
+            self.decoder = MessageDecoder( wanted )
+            decode       = self.decoder.decode
+        else:
+            decode       = orjson.loads
+
+        metrics = self.metrics
+        while True:
+            item     = await self.queue.get()                               # Wait for next frame
+            t, frame = item[ 0 ], item[ 1 ]
+            if len( item ) == 3:                                            # Coalescible, no longer overwritable
+                self._pending.pop( item[2], None )
+            try:
+                msg = frame if isinstance( frame, dict ) else decode( frame )
+                if msg is not None and self.check_sequence( msg ):          #   Drop unwanted/stale frames
+                    if metrics is None:
+                        await self.dispatch( msg )                          #   Dispatch
+                    else:
+                        t0 = perf_counter()
+                        await self.dispatch( msg )                          #   Dispatch (timed)
+                        metrics.observe( msg.get('type'), msg, t, perf_counter() - t0 )
+            except Exception as err:                                        # A faulty handler must not kill the loop
+                print( "HandlerError", err )                                #   [INFO] ...
+            finally:
+                self.queue.task_done()                                      #   Mark as processed
+
+    # ---------------------- ___START___: connect -------------------------
     async def connect( self, payload ) -> None:
         """
-        Perform a GET request.
-        
+        Connect to the feed, subscribe and consume frames until stopped.
+        The subscription is re-sent on every (re)connection.
+
+        :param payload: Subscription request (JSON encoded).
         :return:
         """
-        async with websockets.connect( self.URL ) as ws:
-            if( self.init_run ):
-                await ws.send( payload )
-                self.init_run = False
-                await asyncio.sleep( 0.1 )
-            else:
-                pass
-            
-            while True:
-                msg = await ws.recv()
-                msg_decoded = orjson.loads( msg )
-                print( msg_decoded )
-                time.sleep( 1 )
-    
-    
+        self.product_ids = orjson.loads( payload ).get( 'product_ids', [] ) # Products to resync on reconnect
+        self.queue   = asyncio.Queue( maxsize = self.queue_size )           # Bounded frame queue
+        self.running = True                                                 # Set flag
+        consumer     = asyncio.ensure_future( self._consume() )             # Start consumer
+
+        try:
+            await asyncio.gather( *( self._supervise( payload, conn )       # One supervisor per connection
+                                     for conn in range( self.redundancy ) ) )
+            await self.queue.join()                                         # Drain what is left
+        finally:
+            self.running = False                                            # Clear flag
+            consumer.cancel()                                               # Stop consumer
+
+    # --------------------- ___START___: _supervise -----------------------
+    async def _supervise( self, payload, conn: int ) -> None:
+        """
+        Keep one connection alive until stopped.
+
+        :param payload: Subscription request (JSON encoded).
+        :param conn: Connection index.
+        """
+        attempt = 0                                                         # Consecutive failed attempts
+        while self.running:
+            try:
+                async with websockets.connect( self.URL,
+                                               ping_interval = self.PING_INTERVAL,
+                                               ping_timeout  = self.PING_TIMEOUT ) as ws:
+                    self.sockets[ conn ] = ws
+                    await ws.send( payload )                                # (Re)subscribe
+                    if self._t_drop is not None:                            # Reconnected after an outage
+                        for product_id in self.product_ids:                 #   Whatever we had is stale now
+                            self.schedule_resync( product_id )              #   ...
+                    await self._receive( ws, conn )                         # Receive until connection closes
+            except ( websockets.exceptions.ConnectionClosed,
+                     OSError, asyncio.TimeoutError ) as err:
+                print( "ConnectionError", err )
+            finally:
+                self.sockets.pop( conn, None )
+            if self._frames.pop( conn, 0 ):                                 # Streamed before closing (cleanly or not)
+                attempt = 0                                                 #   Healthy connection, reset backoff
+
+            if not ( self.running and self.reconnect ):                     # Stopped or not supervised
+                break
+
+            if self._t_drop is None and not self.sockets:                   # Mark start of outage
+                self._t_drop = time()                                       #   ...
+            self.stats[ 'reconnects' ] += 1
+            await asyncio.sleep( self.backoff( attempt ) )                  # Back off before retrying
+            attempt += 1
+
+    @property
+    def ws( self ):
+        """
+        :return: An open connection, or None.
+        """
+        return next( iter( self.sockets.values() ), None )
+
+    # ----------------------- ___START___: replay -------------------------
+    async def replay( self, frames: Iterable[Tuple[float, bytes]], speed: float = None ) -> None:
+        """
+        Feed recorded frames through the same pipeline as live ones.
+
+        :param frames: (receive time, raw frame) pairs, e.g. a FeedRecorder.FeedReplayer.
+        :param speed: Replay speed relative to the recording (1.0 is real time,
+                      None is as fast as possible).
+        """
+        self.queue     = asyncio.Queue( maxsize = self.queue_size )         # Bounded frame queue
+        self.running   = True                                               # Set flag
+        self.replaying = True                                               # No REST resyncs
+        consumer       = asyncio.ensure_future( self._consume() )           # Start consumer
+        t0_rec = t0    = None                                               # Recording / wall clock origin
+
+        try:
+            for t, frame in frames:
+                if not self.running:                                        # Stopped by a handler
+                    break
+                if speed:                                                   # Pace frames
+                    if t0_rec is None:
+                        t0_rec, t0 = t, monotonic()
+                    delay = (t - t0_rec) / speed - (monotonic() - t0)
+                    if delay > 0:
+                        await asyncio.sleep( delay )
+                await self.queue.put( (t, frame) )
+            await self.queue.join()                                         # Drain what is left
+        finally:
+            self.running   = False                                          # Clear flags
+            self.replaying = False                                          # ...
+            consumer.cancel()                                               # Stop consumer
+
+    # --------------------- ___START___: feed_metrics ---------------------
+    def feed_metrics( self ) -> dict:
+        """
+        :return: FeedMetrics snapshot, including frames dropped as stale or
+                 unhandled by the sequence tracker and the typed decoder.
+        """
+        if self.metrics is None:
+            raise RuntimeError( 'Metrics are disabled, create the Websocket with metrics=True' )
+        snap = self.metrics.snapshot()
+        snap[ 'dropped' ][ 'stale' ] = self.stats[ 'stale' ]
+        if self.decoder is not None:
+            snap[ 'dropped' ][ 'unhandled' ] = self.decoder.dropped
+        return snap
+
+    # ------------------------ ___START___: stop --------------------------
+    def stop( self ) -> None:
+        """
+        Stop consuming. Frames already queued are still handled.
+        """
+        self.running = False                                                # Clear flag
+        for ws in list( self.sockets.values() ):                            # Close open connections
+            asyncio.ensure_future( ws.close() )                             #   ...
+
+
 #%% ----------------- ___START___: Setup script and run -----------------
 
 if __name__ == '__main__':
@@ -62,6 +552,11 @@ if __name__ == '__main__':
                  "product_ids": [
                          "ETH-USD"],
                  "channels": ["ticker"] }
+
+    async def print_ticker( msg ):
+        print( msg )
+    ws.register_handler( 'ticker', print_ticker )
+
     loop = asyncio.get_event_loop()
     try:
         asyncio.ensure_future( ws.connect(orjson.dumps(req)) )
@@ -71,6 +566,6 @@ if __name__ == '__main__':
     finally:
         print( "Closing loop" )
         loop.close()
-    
+
 
 #   ----------------- ___ END ___: Setup script and run -----------------
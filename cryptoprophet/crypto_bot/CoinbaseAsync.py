@@ -0,0 +1,256 @@
+#@formatter:off
+"""
+Asyncio counterpart of CoinbaseClient for concurrent REST fan-out.
+
+Calls are signed by a regular CoinbaseAuthClient and sent through its
+pooled keep-alive session on a dedicated thread pool, so signing and
+connection reuse are exactly the same as for the blocking clients. At most
+`concurrency` calls are in flight at once; bulk methods fan out over
+asyncio.gather and return their results as one batch.
+
+    > async with AsyncCoinbaseClient( key, secret ) as client:
+    >     prices = await client.get_prices( ['BTC-USD', 'ETH-USD', ...] )
+
+*** NOTE: requests is blocking, so every in-flight call holds a worker
+          thread. Network waits release the GIL, so this scales to the
+          connection pool size, which is plenty for REST rate limits.
+
+VERSION: 0.0.5
+    - ADDED     : Bounded concurrent requests, bulk price/ticker/account calls
+    - ADDED     : Calls go through the shared rate limiter
+    - ADDED     : Optional TTL response cache for slow-changing endpoints
+    - ADDED     : Identical concurrent GETs share one in-flight call
+    - ADDED     : Per-endpoint timeouts, retries and circuit breaker
+
+KNOWN ISSUES:
+    - Non encountered
+
+
+AUTHOR                      :   Mohammad Odeh
+DATE                        :   Oct. 18th, 2026 Year of Our Lord
+LAST CONTRIBUTION DATE      :   Oct. 18th, 2026 Year of Our Lord
+"""
+
+from    typing                      import  Any, Dict, Iterable, List       # Additional type hints
+from    typing                      import  Optional, Tuple, Union          # ...
+from    concurrent.futures          import  ThreadPoolExecutor              # Blocking calls off the loop
+from    functools                   import  partial                         # Bind call arguments
+import  asyncio                                                             # Asynchronous routines
+import  requests                                                            # HTTP GET and POST for API interaction
+import  orjson                                                              # Fast, efficient JSON parser
+
+from    CoinbaseAuth                import  CoinbaseAuthClient              # Request signing
+from    CoinbaseSession             import  PooledSession                   # Pooled keep-alive session
+from    CoinbaseRateLimit           import  RateLimiter, lane_of            # Client-side rate limiting
+from    CoinbaseCache               import  ResponseCache                   # Slow-changing endpoints
+from    CoinbaseSingleFlight        import  SingleFlight                    # Coalesce identical GETs
+from    CoinbasePolicy              import  PolicyEngine                    # Timeouts, retries, breaker
+from    CoinbasePagination          import  with_query                      # Cache keys
+
+Call = Tuple[ str, str ]                                                    # (method, uri)
+
+
+class AsyncCoinbaseClient( object ):
+    """
+    Coinbase REST client for asyncio code.
+    """
+    CONCURRENCY     : int = 16                                              # Max. calls in flight
+    EXCHANGE_URL    : str = 'https://api.exchange.coinbase.com/'
+
+    def __init__( self, key: str, secret: str, url: str = None, concurrency: int = CONCURRENCY,
+                  session: requests.Session = None, limiter: RateLimiter = None,
+                  cache: ResponseCache = None, flight: SingleFlight = None,
+                  policy: PolicyEngine = None, **kwargs: Optional[Union[bool, str]] ) -> None:
+        """
+        :param key: Coinbase API key.
+        :param secret: Coinbase API secret.
+        :param url: API URL (default: the auth client's, i.e. v2 or pro).
+        :param concurrency: Max. number of calls in flight.
+        :param session: Session to send calls through (default: a PooledSession
+                        with one connection per concurrent call).
+        :param limiter: Rate limiter (default: CoinbaseRateLimit.shared_limiter() of the API host).
+        :param cache: Cache for GETs of slow-changing endpoints (default: none).
+        :param flight: Coalesces identical in-flight GETs (default: CoinbaseSingleFlight.shared_flight()).
+        :param policy: Timeouts, retries and circuit breakers (default: CoinbasePolicy.shared_policy()).
+        :param kwargs: CoinbaseAuthClient keywords (pro, api_passphrase).
+        """
+        session          = session or PooledSession( pool_size = concurrency )
+        self.auth_client = CoinbaseAuthClient( key, secret, session, limiter, cache, flight, policy,
+                                               **kwargs )
+        self.session     = session
+        self.URL         = url or self.auth_client.url
+        self.concurrency = concurrency
+        self.executor    = ThreadPoolExecutor( max_workers = concurrency, thread_name_prefix = 'coinbase' )
+        self._semaphore  : asyncio.Semaphore = None                         # Created inside the running loop
+
+    # ----------------------- ___START___: _send --------------------------
+    def _send( self, method: str, url: str, payload: Any, params: dict, timeout: tuple ) -> requests.Response:
+        """
+        Signed blocking attempt (worker thread).
+
+        :return: Response, not checked for errors
+        """
+        resp = self.session.request( method, url, json = payload, params = params, auth = self.auth_client,
+                                     timeout = timeout )
+        self.auth_client.check_rate_limited( resp )
+        return resp
+
+    # ---------------------- ___START___: request -------------------------
+    async def request( self, method: str, uri: str, payload: Any = None,
+                       params: dict = None, url: str = None, lane: str = None ) -> Any:
+        """
+        Perform a signed call without blocking the event loop.
+
+        :param method: "GET", "POST" or "DELETE".
+        :param uri: Path relative to the API URL.
+        :param payload: JSON body.
+        :param params: Query string parameters.
+        :param url: Base URL overriding the client's.
+        :param lane: Rate limiter priority lane (default: inferred, orders first).
+        :return: Decoded JSON response
+        :raises requests.HTTPError: On a 4xx/5xx answer (after retries, see CoinbasePolicy).
+        :raises CoinbasePolicy.CircuitOpen: While the exchange host is considered degraded.
+        """
+        method = method.upper()
+        if method not in CoinbaseAuthClient.VALID_METHODS:                  # Check if method is valid
+            raise TypeError( f'"{method}" is not a valid method' )          #   If not, raise error
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore( self.concurrency )
+
+        url = ( url or self.URL ) + uri
+        if method != 'GET':
+            return await self._call( method, url, payload, params, lane )
+
+        if params:                                                          # Query is part of the keys
+            url, params = with_query( url, **params ), None
+        cache  = self.auth_client.cache
+        policy = cache.policy( method, url ) if cache is not None else None
+        if policy is not None:                                              # Cached endpoint
+            found, value = cache.lookup( url, partial( self._refresh, url ), self.auth_client._CB_KEY )
+            if found:
+                return value
+        value = await self.auth_client.flight.do_async( ( self.auth_client._CB_KEY, url ),
+                                                        partial( self._call, method, url, None, None, lane ) )
+        if policy is not None:
+            cache.store( url, value, policy, self.auth_client._CB_KEY )
+        return value
+
+    async def _call( self, method: str, url: str, payload: Any, params: dict, lane: str ) -> Any:
+        """
+        Send a call under the endpoint's policy. Every attempt waits for the
+        rate limiter and a free slot; backoff between attempts is spent on
+        the event loop, not in a worker thread.
+
+        :return: Decoded JSON response
+        """
+        async def attempt( timeout: tuple ) -> requests.Response:
+            await self.auth_client.rate_limiter( url ).acquire_async( lane or lane_of( method, url ) )
+            async with self._semaphore:                                     # Bound calls in flight
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor( self.executor,
+                                                   partial( self._send, method, url, payload, params, timeout ) )
+
+        resp = await self.auth_client.policy.call_async( method, url, attempt, payload )
+        resp.raise_for_status()
+        return orjson.loads( resp.content )
+
+    def _refresh( self, url: str ) -> Any:
+        """
+        Refetch a stale cache entry (cache worker thread).
+        """
+        return self.auth_client.fetch_page( url )[ 1 ]
+
+    # ----------------------- ___START___: batch --------------------------
+    async def batch( self, calls: Iterable[Call] ) -> List[Any]:
+        """
+        Run calls concurrently.
+
+        :param calls: (method, uri) pairs.
+        :return: Results in call order; a failed call yields its exception.
+        """
+        return await asyncio.gather( *( self.request( method, uri ) for method, uri in calls ),
+                                     return_exceptions = True )
+
+    # --------------------- ___START___: get_price ------------------------
+    async def get_price( self, currency_pair: str ) -> dict:
+        """
+        https://api.coinbase.com/v2/prices/{currency_pair}/spot
+
+        :param currency_pair: Pair such as "BTC-USD"
+        :return: {'base', 'currency', 'amount'}
+        """
+        return ( await self.request( 'GET', f'prices/{currency_pair}/spot' ) )[ 'data' ]
+
+    # --------------------- ___START___: get_prices -----------------------
+    async def get_prices( self, currency_pairs: Iterable[str] ) -> Dict[str, Union[dict, Exception]]:
+        """
+        Spot prices of many pairs at once.
+
+        :param currency_pairs: Pairs such as "BTC-USD"
+        :return: Pair -> {'base', 'currency', 'amount'}, or the exception if its call failed
+        """
+        currency_pairs = list( currency_pairs )
+        results        = await asyncio.gather( *( self.get_price( pair ) for pair in currency_pairs ),
+                                               return_exceptions = True )
+        return dict( zip( currency_pairs, results ) )
+
+    # --------------------- ___START___: get_tickers ----------------------
+    async def get_tickers( self, product_ids: Iterable[str] ) -> Dict[str, Union[dict, Exception]]:
+        """
+        Exchange tickers (products/{product_id}/ticker) of many products at once.
+
+        :param product_ids: Products such as "BTC-USD"
+        :return: Product -> ticker, or the exception if its call failed
+        """
+        product_ids = list( product_ids )
+        results     = await self.batch( ('GET', f'products/{p}/ticker') for p in product_ids )
+        return dict( zip( product_ids, results ) )
+
+    # -------------------- ___START___: get_accounts ----------------------
+    async def get_accounts( self ) -> List[dict]:
+        """
+        https://api.coinbase.com/v2/accounts (or /accounts on pro)
+
+        :return: Accounts
+        """
+        accounts = await self.request( 'GET', 'accounts' )
+        return accounts[ 'data' ] if isinstance( accounts, dict ) else accounts
+
+    # ---------------------- ___START___: get_fees ------------------------
+    async def get_fees( self ) -> dict:
+        """
+        https://api.exchange.coinbase.com/fees
+        """
+        return await self.request( 'GET', 'fees', url = self.EXCHANGE_URL )
+
+    # ------------------------ ___START___: close -------------------------
+    def close( self ) -> None:
+        """
+        Stop the worker threads.
+        """
+        self.executor.shutdown( wait = False )
+
+    async def __aenter__( self ):
+        return self
+
+    async def __aexit__( self, type, value, tb ):
+        self.close()
+
+
+#%% ----------------- ___START___: Setup script and run -----------------
+
+if __name__ == '__main__':
+    from dotenv     import  dotenv_values                               # Read key-value pairs from a .env file without modifying the environment
+    from dotenv     import  find_dotenv                                 # Search for the .env within the main directory and subdirectories
+    env_dir         = find_dotenv()                                     # Store absolute path to .env file
+    cb_key          = dotenv_values( env_dir )['cb_key']                # Read key
+    cb_secret       = dotenv_values( env_dir )['cb_secret']             # Read secret
+
+    async def main():
+        async with AsyncCoinbaseClient( cb_key, cb_secret ) as client:
+            print( await client.get_prices( ['BTC-USD', 'ETH-USD', 'SOL-USD', 'ADA-USD'] ) )
+            print( await client.get_accounts() )
+
+    asyncio.run( main() )
+
+#   ----------------- ___ END ___: Setup script and run -----------------
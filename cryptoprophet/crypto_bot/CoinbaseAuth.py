@@ -2,8 +2,16 @@
 """
 Create a Coinbase Pro client here
 
-VERSION: 0.0.1
+VERSION: 0.0.5
     - ADDED     : Pre-planning stage
+    - ADDED     : Calls go through a pooled keep-alive session
+    - ADDED     : Shared rate limiter with priority lanes
+    - ADDED     : Key material decoded once, pre-keyed HMAC copied per request
+    - ADDED     : Single parse per response, selectable result formats
+    - ADDED     : Lazy cursor pagination (paginate, iter_rows)
+    - ADDED     : Optional TTL response cache for slow-changing endpoints
+    - ADDED     : Identical concurrent GETs share one in-flight call
+    - ADDED     : Per-endpoint timeouts, retries and circuit breaker; errors raise
 
 KNOWN ISSUES:
     - Non encountered
@@ -11,14 +19,14 @@ KNOWN ISSUES:
 
 AUTHOR                      :   Mohammad Odeh
 DATE                        :   Aug.  7th, 2022 Year of Our Lord
-LAST CONTRIBUTION DATE      :   Aug.  7th, 2022 Year of Our Lord
+LAST CONTRIBUTION DATE      :   Oct. 18th, 2026 Year of Our Lord
 """
 
-from    typing                      import  Dict, Optional, Union           # Additional type hints
+from    typing                      import  Any, Dict, Iterator, Optional   # Additional type hints
+from    typing                      import  Tuple, Union                    # ...
 from    re                          import  compile                         # Use regex for validation
 from    time                        import  time                            # Get time
 from    requests.auth               import  AuthBase                        # Base class that all auth implementations derive from
-import  pandas                      as      pd                              # Data manipulation
 import  requests                                                            # HTTP GET and POST for API interaction
 import  hmac                                                                # Keyed-Hashing for Message Authentication
 import  hashlib                                                             # Secure hash and message digest algorithms
@@ -26,6 +34,16 @@ import  orjson                                                              # Fa
 import  json
 import  base64
 
+from    CoinbaseSession             import  shared_session                  # Pooled keep-alive session
+from    CoinbaseRateLimit           import  RateLimiter, lane_of            # Client-side rate limiting
+from    CoinbaseRateLimit           import  shared_limiter                  # ...
+from    CoinbaseResults             import  RESULTS, convert, unwrap        # Response formats
+from    CoinbasePagination          import  PAGE_LIMIT, pages, with_query   # Cursor pagination
+from    CoinbaseCache               import  ResponseCache                   # Slow-changing endpoints
+from    CoinbaseSingleFlight        import  SingleFlight, shared_flight     # Coalesce identical GETs
+from    CoinbasePolicy              import  CircuitOpen, PolicyEngine       # Timeouts, retries, breaker
+from    CoinbasePolicy              import  shared_policy                   # ...
+
 class CoinbaseAuthClient( AuthBase ):
 
     # Add type hints
@@ -38,56 +56,132 @@ class CoinbaseAuthClient( AuthBase ):
     API_URL         : Dict[str, str] = { 'v2' : 'https://api.coinbase.com/v2/',
                                          'pro': 'https://api.pro.coinbase.com/' }
     
-    def __init__( self, api_key: str, api_secret: str, **kwargs: Optional[Union[bool, str]] ):
+    def __init__( self, api_key: str, api_secret: str, session: requests.Session = None,
+                  limiter: RateLimiter = None, cache: ResponseCache = None,
+                  flight: SingleFlight = None, policy: PolicyEngine = None, **kwargs: Optional[Union[bool, str]] ):
         """
         Coinbase authenticated client.
         
         :param api_key: Coinbase API key.
         :param api_secret: Coinbase API key.
+        :param session: Session to send calls through (default: CoinbaseSession.shared_session()).
+        :param limiter: Rate limiter (default: CoinbaseRateLimit.shared_limiter() of the API host).
+        :param cache: Cache for GETs of slow-changing endpoints (default: none).
+        :param flight: Coalesces identical in-flight GETs (default: CoinbaseSingleFlight.shared_flight()).
+        :param policy: Timeouts, retries and circuit breakers (default: CoinbasePolicy.shared_policy()).
         :keyword pro: Use Coinbase Pro instead of Coinbase (default: False).
         :keyword api_passphrase: Coinbase Pro API passphrase.
         """
-        self.url = self.API_URL[ 'v2' ]                                     # Set new API (v2) as default
-        self.pro = False                                                    # Use Coinbase.com as default
+        self.url     = self.API_URL[ 'v2' ]                                 # Set new API (v2) as default
+        self.pro     = False                                                # Use Coinbase.com as default
+        self.session = session or shared_session()                          # Pooled keep-alive connections
+        self.limiter = limiter                                              # None: shared one of the host
+        self.cache   = cache                                                # None: every call hits the API
+        self.flight  = flight or shared_flight()                            # Shared by identical GETs
+        self.policy  = policy or shared_policy()                            # Shared breaker state
         
         if (api_key or api_secret) is None:                                 # Check that API key/secret are given
             raise ValueError( 'No API Key/Secret is provided' )             #   If not, raise error
         else:                                                               # Else, move on
             self.unpack_kwargs( **kwargs )                                  #   Unpack **kwargs
             self.validate_api( api_key, api_secret, self._CB_PASSPHRASE )   #   Validate API entries
+            self._init_signer()                                             #   Precompute key material
     
+    def _init_signer( self ) -> None:
+        """
+        Decode the secret once and key an HMAC with it. Every request then
+        only copies the keyed HMAC state instead of decoding the secret and
+        deriving the inner/outer pads again.
+        """
+        if self.pro:                                                        # Pro secrets are base64
+            key = base64.b64decode( self._CB_SECRET )
+        else:                                                               # v2 secrets are used as is
+            key = self._CB_SECRET.encode( 'UTF-8' )
+        self._hmac    = hmac.new( key, digestmod = hashlib.sha256 )         # Keyed, never updated itself
+        self._headers = { 'CB-ACCESS-KEY'   : self._CB_KEY,                 # Constant headers
+                          'Content-Type'    : 'application/json' }
+        if self.pro:
+            self._headers[ 'CB-ACCESS-PASSPHRASE' ] = self._CB_PASSPHRASE
+
+    def sign( self, timestamp: str, method: str, path_url: str, body: Union[bytes, str] = None ) -> str:
+        """
+        Signature of a request.
+
+        :param timestamp: Request timestamp, as sent in CB-ACCESS-TIMESTAMP.
+        :param method: HTTP method.
+        :param path_url: Path and query string.
+        :param body: Request body.
+        :return: Base64 digest (pro) or hex digest (v2)
+        """
+        h = self._hmac.copy()
+        h.update( f'{timestamp}{method}{path_url}'.encode() )
+        if body:
+            h.update( body if isinstance( body, bytes ) else body.encode() )
+        if self.pro:
+            return base64.b64encode( h.digest() ).decode()
+        return h.hexdigest()
+
     def __call__( self, request ):
-        
-        if( self.pro ):
-            timestamp = str(time())
-            body = (request.body or b"").decode()
-            message = f"{timestamp}{request.method}{request.path_url}{body}"
-            hmac_key = base64.b64decode(self._CB_SECRET)
-            signature = hmac.new(hmac_key, message.encode(), hashlib.sha256)
-            signature_b64 = base64.b64encode(signature.digest()).decode()
-            
-            header = { 'CB-ACCESS-SIGN'      : signature_b64 ,
-                       'CB-ACCESS-TIMESTAMP' : timestamp     ,
-                       'CB-ACCESS-KEY'       : self._CB_KEY  ,
-                       "CB-ACCESS-PASSPHRASE": self._CB_PASSPHRASE,
-                       'Content-Type'        : 'application/json'}
-            
-        else:
-            timestamp   = str( int(time()) )                                    # Get current time as string
-            message     = timestamp + request.method + request.path_url + (request.body or '')
-            b_message   = message.encode( 'UTF-8' )                             # Encode message as bytes
-            b_secret    = (self._CB_SECRET).encode( 'UTF-8' )                   # Encode secret as bytes
-            signature   = hmac.new( b_secret, b_message, hashlib.sha256 ).hexdigest()
-            
-            header = { 'CB-ACCESS-SIGN'      : signature     ,
-                       'CB-ACCESS-TIMESTAMP' : timestamp     ,
-                       'CB-ACCESS-KEY'       : self._CB_KEY  ,
-                       'Content-Type'        : 'application/json'}
-            
-        request.headers.update( header )
-        
+        timestamp = str( time() ) if self.pro else str( int(time()) )       # Get current time as string
+        headers   = request.headers
+        headers.update( self._headers )
+        headers[ 'CB-ACCESS-SIGN'      ] = self.sign( timestamp, request.method, request.path_url, request.body )
+        headers[ 'CB-ACCESS-TIMESTAMP' ] = timestamp
         return request
     
+    def rate_limiter( self, url: str ) -> RateLimiter:
+        """
+        :param url: URL about to be called.
+        :return: Limiter governing it
+        """
+        return self.limiter or shared_limiter( url )
+
+    def throttle( self, method: str, url: str, lane: str = None ) -> float:
+        """
+        Wait for the rate limiter before a call.
+
+        :param method: HTTP method.
+        :param url: URL about to be called.
+        :param lane: Priority lane (default: inferred from method and URL).
+        :return: Time waited [sec]
+        """
+        return self.rate_limiter( url ).acquire( lane or lane_of( method, url ) )
+
+    def send( self, method: str, url: str, payload: Any = None, lane: str = None,
+              headers: Dict[str, str] = None ) -> requests.Response:
+        """
+        Signed call under the endpoint's policy: every attempt waits for the
+        rate limiter and has the rule's timeouts; failed attempts are retried
+        if that is safe.
+
+        :param method: HTTP method.
+        :param url: Absolute URL.
+        :param payload: JSON body (POST).
+        :param lane: Rate limiter priority lane (default: inferred).
+        :param headers: Extra headers of this call (the session may be shared).
+        :return: Last response, not checked for errors
+        :raises CircuitOpen: While the exchange host is considered degraded.
+        """
+        def attempt( timeout: tuple ) -> requests.Response:
+            self.throttle( method, url, lane )
+            resp = self.session.request( method, url, json = payload, headers = headers, auth = self,
+                                         timeout = timeout )
+            self.check_rate_limited( resp )
+            return resp
+
+        return self.policy.call( method, url, attempt, payload )
+
+    def check_rate_limited( self, resp: requests.Response ) -> None:
+        """
+        Pause the limiter when the exchange answered 429 anyway.
+        """
+        if resp.status_code == 429:
+            try:
+                retry_after = float( resp.headers.get( 'Retry-After', 1.0 ) )
+            except ValueError:                                              # HTTP date
+                retry_after = 1.0
+            self.rate_limiter( resp.url ).pause( retry_after )
+
     def unpack_kwargs( self, **kwargs ) -> None:
         """
         Unpack keyword arguments if they exist
@@ -160,13 +254,20 @@ class CoinbaseAuthClient( AuthBase ):
         else:                                                               # Else, if it is correct
             self._CB_SECRET = secret                                        #   Store API secret
             
-    def api_call( self, method: str, uri: str, payload: str = "" ) -> pd.DataFrame:
+    def api_call( self, method: str, uri: str, payload: str = "", lane: str = None,
+                  result: str = 'frame' ) -> Any:
         """
         
         :param method:
         :param uri:
         :param payload:
-        :return:
+        :param lane: Rate limiter priority lane (default: inferred, orders first).
+        :param result: "raw" (parsed JSON), "records" (__slots__ records),
+                       "numpy" (structured array) or "frame" (DataFrame).
+                       See CoinbaseResults; hot paths should avoid "frame".
+        :return: Body of a 2xx response in the result format, None if empty (e.g. 204)
+        :raises requests.RequestException: Printed, then raised (CircuitOpen while
+                                           the exchange is degraded).
         """
         method = method.upper()                                             # Convert input to uppercase
         
@@ -174,36 +275,32 @@ class CoinbaseAuthClient( AuthBase ):
             raise TypeError( f'"{method}" is not a valid method' )          #   If not, raise error
         if isinstance( uri, str ) is not True:                              # Check if uri is string
             raise TypeError( f'"{uri}" is not a string' )                   #   If not, raise error
+        if result not in RESULTS:                                           # Check if result format is valid
+            raise ValueError( f'Unknown result format "{result}", use one of {RESULTS}' )
         
         try:                                                                # Catch connection error
-            if   method == self.VALID_METHODS[ 0 ]:                         #   method == "GET"
-                resp = requests.get( self.url + uri,                        #   ...
-                                     auth = self )                          #   ...
-                print( orjson.loads( resp.content ) )
-            elif method == self.VALID_METHODS[ 1 ]:                         #   method =="POST"
-                resp = requests.post( self.url + uri,                       #   ...
-                                      json = payload,                       #   ...
-                                      auth = self )                         #   ...
+            if method == self.VALID_METHODS[ 0 ]:                           #   method == "GET"
+                data = self.get_json( self.url + uri, lane )
+                return None if data is None else convert( data, result )
+            
+            if   method == self.VALID_METHODS[ 1 ]:                         #   method =="POST"
+                resp = self.send( method, self.url + uri, payload, lane )   #   ...
             elif method == self.VALID_METHODS[ 2 ]:                         #   method == "DELETE"
-                resp = requests.delete( self.url + uri,                     #   ...
-                                        auth = self )                       #   ...
+                resp = self.send( method, self.url + uri, None, lane )      #   ...
             else:
                 resp = None
                 
             resp.raise_for_status()
 
-            if resp.status_code == 200:
-                if isinstance(resp.json(), list):
-                    df = pd.DataFrame.from_dict(resp.json())
-                    return df
-                else:
-                    df = pd.DataFrame(resp.json(), index=[0])
-                    return df
+            data = orjson.loads( resp.content ) if resp.content else None   # Parse once; 204 has no body
+            if 200 <= resp.status_code < 300:
+                return None if data is None else convert( data, result )
             else:
-                if "msg" in resp.json():
-                    resp_message = resp.json()["msg"]
-                elif "message" in resp.json():
-                    resp_message = resp.json()["message"]
+                data = data if isinstance( data, dict ) else {}
+                if "msg" in data:
+                    resp_message = data["msg"]
+                elif "message" in data:
+                    resp_message = data["message"]
                 else:
                     resp_message = ""
     
@@ -213,27 +310,109 @@ class CoinbaseAuthClient( AuthBase ):
                     msg = f"{method} ({resp.status_code}) {self.url}{uri} - {resp_message} (hint: check your system time is using NTP)"
                 else:
                     msg = f"CoinbasePro authAPI Error: {method.upper()} ({resp.status_code}) {self.url}{uri} - {resp_message}"
+                print( msg )
         
+        except CircuitOpen as err:
+            reason, msg = ("CircuitOpen", err)
+            print( reason, msg )
+            raise
+
         except requests.ConnectionError as err:
             reason, msg = ("ConnectionError", err)
             print( reason, msg )
+            raise
 
         except requests.exceptions.HTTPError as err:
             reason, msg = ("HTTPError", err)
             print( reason, msg )
+            raise
             
         except requests.Timeout as err:
             reason, msg = ("TimeoutError", err)
             print( reason, msg )
+            raise
             
         except json.decoder.JSONDecodeError as err:
             reason, msg = ("JSONDecodeError", err)
             print( reason, msg )
+            raise
             
         except Exception as err:
             reason, msg = ("GeneralException", err)
             print( reason, msg )
+            raise
             
+    def fetch_page( self, url: str, lane: str = None,
+                    headers: Dict[str, str] = None ) -> Tuple[requests.Response, Any]:
+        """
+        GET one page (or any single response). Failures raise, so a walk
+        through the pages never silently ends short.
+
+        :param url: Absolute URL of the page.
+        :param lane: Rate limiter priority lane (default: inferred).
+        :param headers: Extra headers of this call.
+        :return: (response, parsed body, None if empty)
+        """
+        resp = self.send( 'GET', url, lane = lane, headers = headers )
+        resp.raise_for_status()
+        return resp, orjson.loads( resp.content ) if resp.content else None  # 204 has no body
+
+    def get_json( self, url: str, lane: str = None, headers: Dict[str, str] = None ) -> Any:
+        """
+        Parsed body of a GET. Cached endpoints are answered from the cache;
+        otherwise a call identical to one already in flight (same URL, same
+        API key) waits for it and shares its result. Every client goes
+        through here (or stores the same parsed JSON), so the cache and the
+        in-flight calls only ever hold one kind of value per URL.
+
+        :param url: Absolute URL, query string included.
+        :param lane: Rate limiter priority lane (default: inferred).
+        :param headers: Extra headers of this call.
+        :return: Parsed JSON (shared, do not mutate)
+        """
+        def fetch() -> Any:
+            return self.flight.do( ( self._CB_KEY, url ), lambda: self.fetch_page( url, lane, headers )[1] )
+
+        policy = self.cache.policy( 'GET', url ) if self.cache is not None else None
+        return fetch() if policy is None else self.cache.get( url, fetch, policy, self._CB_KEY )
+
+    def paginate( self, uri: str, params: dict = None, limit: int = PAGE_LIMIT, result: str = 'raw',
+                  prefetch: bool = False, max_pages: int = None, lane: str = None ) -> Iterator[Any]:
+        """
+        Lazily walk a paginated endpoint, following CB-AFTER (pro) or
+        pagination.next_uri (v2) cursors. Pages are requested as they are
+        consumed; break out of the loop to stop early.
+
+            for page in client.paginate( 'fills', { 'product_id': 'BTC-USD' }, result = 'numpy' ):
+                ...
+
+        :param uri: Endpoint, relative to self.url.
+        :param params: Query parameters of the first page.
+        :param limit: Rows per page.
+        :param result: Format of each page, see api_call.
+        :param prefetch: Fetch the next page while the current one is consumed.
+        :param max_pages: Stop after this many pages (default: all of them).
+        :param lane: Rate limiter priority lane (default: inferred).
+        :return: Generator of pages
+        """
+        if result not in RESULTS:                                           # Check if result format is valid
+            raise ValueError( f'Unknown result format "{result}", use one of {RESULTS}' )
+        url = with_query( self.url + uri, **( params or {} ), limit = limit )
+        for data in pages( lambda u: self.fetch_page( u, lane ), url, prefetch, max_pages ):
+            yield convert( data, result )
+
+    def iter_rows( self, uri: str, params: dict = None, result: str = 'raw', **kwargs ) -> Iterator[Any]:
+        """
+        Rows of a paginated endpoint, one at a time, see paginate().
+
+        :param result: "raw" (dicts) or "records".
+        :return: Generator of rows
+        """
+        if result not in RESULTS[ :2 ]:
+            raise ValueError( f'Rows are only available as {RESULTS[:2]}, not "{result}"' )
+        for page in self.paginate( uri, params, result = result, **kwargs ):
+            yield from unwrap( page )                                       # raw v2 pages keep their envelope
+
 #%% ----------------- ___START___: Setup script and run -----------------
 
 if __name__ == '__main__':
@@ -0,0 +1,220 @@
+#@formatter:off
+"""
+TTL response cache with stale-while-revalidate for slow-changing endpoints.
+
+Currencies, products, fees and the user record hardly ever change but are
+asked for constantly. With a cache attached, a GET to one of the endpoints
+in `ttls` is answered from memory while it is fresh. Once its TTL ran out
+it is still answered from memory during the stale window, while a
+background thread fetches the new version; only entries past the stale
+window (or never seen) cost a blocking request.
+
+    > fresh     : age < ttl                 -> cached value
+    > stale     : ttl <= age < ttl + stale  -> cached value, refreshed in the background
+    > expired   : otherwise                 -> fetched, then cached
+
+Endpoints are matched on their path (v2/ prefix dropped, "*" matches one
+segment); the cache key is the URL, query string included, and the API
+key it was fetched with, so a cache shared by clients of different
+accounts never answers one with another's responses. Anything not listed
+is not cached. Order and account endpoints (BYPASS) are never cached, even
+if listed, and the cache refuses TTLs for them. The cache holds at most
+`max_entries` responses and evicts the least recently used one.
+
+*** NOTE: Cached values are shared between callers; do not mutate them.
+
+*** NOTE: Values are always parsed JSON bodies, whichever client filled
+          the entry (CoinbaseAuthClient.get_json, AsyncCoinbaseClient,
+          CoinbaseClient through get_json), so every reader of a URL gets
+          the same kind of value.
+
+VERSION: 0.0.1
+    - ADDED     : Per-endpoint TTLs, stale-while-revalidate, LRU bound, counters
+
+KNOWN ISSUES:
+    - Non encountered
+
+
+AUTHOR                      :   Mohammad Odeh
+DATE                        :   Oct. 18th, 2026 Year of Our Lord
+LAST CONTRIBUTION DATE      :   Oct. 18th, 2026 Year of Our Lord
+"""
+
+from    typing                      import  Any, Callable, Dict, Optional   # Additional type hints
+from    typing                      import  Tuple                           # ...
+from    collections                 import  OrderedDict                     # LRU order
+from    concurrent.futures          import  ThreadPoolExecutor              # Background refresh
+from    urllib.parse                import  urlsplit                        # Path of a URL
+from    time                        import  monotonic                       # Entry age
+import  threading                                                           # Shared across threads
+
+Policy  = Tuple[ float, float ]                                             # (ttl, stale window) [sec]
+
+TTLS    : Dict[str, Policy] = { 'currencies'    : ( 3600.0, 86400.0 ),
+                                'currencies/*'  : ( 3600.0, 86400.0 ),
+                                'products'      : (   60.0,  3600.0 ),
+                                'products/*'    : (   60.0,  3600.0 ),      # Not .../ticker, .../candles
+                                'fees'          : (   60.0,   600.0 ),
+                                'user'          : (  300.0,  3600.0 ) }
+
+BYPASS  : frozenset = frozenset( ( 'accounts', 'orders', 'fills', 'ledger', 'holds', 'transfers',
+                                   'transactions', 'deposits', 'withdrawals', 'buys', 'sells',
+                                   'payment-methods', 'profiles', 'conversions' ) )
+
+
+def route( url: str ) -> Tuple[str, ...]:
+    """
+    :return: Path segments of a URL, without the v2 prefix.
+    """
+    segments = tuple( urlsplit( url ).path.strip( '/' ).split( '/' ) )
+    return segments[ 1: ] if segments[ :1 ] == ( 'v2', ) else segments
+
+
+class ResponseCache( object ):
+    """
+    Thread-safe LRU cache of GET responses with per-endpoint TTLs.
+    """
+    def __init__( self, ttls: Dict[str, Policy] = None, max_entries: int = 1024, workers: int = 2 ) -> None:
+        """
+        :param ttls: Endpoint pattern -> (ttl, stale window) [sec] (default: TTLS).
+        :param max_entries: Responses kept at most.
+        :param workers: Threads refreshing stale entries.
+        """
+        self.ttls        : Dict[Tuple[str, ...], Policy] = {}
+        for pattern, policy in ( TTLS if ttls is None else ttls ).items():
+            segments = tuple( pattern.strip( '/' ).split( '/' ) )
+            if BYPASS.intersection( segments ):
+                raise ValueError( f'"{pattern}" is order/account sensitive and cannot be cached' )
+            self.ttls[ segments ] = policy
+        self.max_entries = max_entries
+        self.workers     = workers
+        self.counts      = { 'hits': 0, 'stale': 0, 'misses': 0, 'bypassed': 0,
+                             'refreshes': 0, 'errors': 0, 'evictions': 0 }
+        self._entries    : OrderedDict = OrderedDict()                      # (account, URL) -> [value, fresh/stale until, policy]
+        self._refreshing : set = set()
+        self._pool       : ThreadPoolExecutor = None                        # Started on the first refresh
+        self._lock       = threading.Lock()
+
+    def __len__( self ) -> int:
+        return len( self._entries )
+
+    # ------------------------ ___START___: policy ------------------------
+    def policy( self, method: str, url: str ) -> Optional[Policy]:
+        """
+        :return: (ttl, stale window) of a call, None if it must not be cached.
+        """
+        if method != 'GET':
+            return None
+        segments = route( url )
+        if BYPASS.intersection( segments ):                                 # Order/account sensitive
+            with self._lock:
+                self.counts[ 'bypassed' ] += 1
+            return None
+        for pattern, policy in self.ttls.items():
+            if len( pattern ) == len( segments ) and all( p == '*' or p == s for p, s in zip( pattern, segments ) ):
+                return policy
+        return None
+
+    # ------------------------ ___START___: lookup ------------------------
+    def lookup( self, url: str, refresh: Callable[[], Any], account: str = None ) -> Tuple[bool, Any]:
+        """
+        Cached value of a URL, if fresh or stale. A stale one is refreshed
+        in the background by calling refresh() (once at a time per URL).
+
+        :param url: Full URL, query string included.
+        :param refresh: Fetches the value again (blocking, run on a worker thread).
+        :param account: API key the value is fetched with (None: public data).
+        :return: (found, value)
+        """
+        now = monotonic()
+        key = ( account, url )
+        with self._lock:
+            entry = self._entries.get( key )
+            if entry is None or now >= entry[ 2 ]:                          # Never seen or expired
+                self.counts[ 'misses' ] += 1
+                return False, None
+            self._entries.move_to_end( key )
+            if now < entry[ 1 ]:
+                self.counts[ 'hits' ] += 1
+            else:
+                self.counts[ 'stale' ] += 1
+                if key not in self._refreshing:
+                    self._refreshing.add( key )
+                    if self._pool is None:
+                        self._pool = ThreadPoolExecutor( self.workers, thread_name_prefix = 'cache' )
+                    self._pool.submit( self._refresh, url, refresh, entry[ 3 ], account )
+            return True, entry[ 0 ]
+
+    def _refresh( self, url: str, refresh: Callable[[], Any], policy: Policy, account: str ) -> None:
+        try:
+            self.store( url, refresh(), policy, account )
+            with self._lock:
+                self.counts[ 'refreshes' ] += 1
+        except Exception:                                                   # Keep serving the stale value
+            with self._lock:
+                self.counts[ 'errors' ] += 1
+        finally:
+            with self._lock:
+                self._refreshing.discard( ( account, url ) )
+
+    # ------------------------ ___START___: store -------------------------
+    def store( self, url: str, value: Any, policy: Policy, account: str = None ) -> None:
+        """
+        Cache a value.
+
+        :param url: Full URL, query string included.
+        :param value: Parsed JSON body to cache.
+        :param policy: (ttl, stale window) [sec], see policy().
+        :param account: API key the value was fetched with (None: public data).
+        """
+        now = monotonic()
+        key = ( account, url )
+        with self._lock:
+            self._entries[ key ] = [ value, now + policy[0], now + policy[0] + policy[1], policy ]
+            self._entries.move_to_end( key )
+            while len( self._entries ) > self.max_entries:                  # Drop least recently used
+                self._entries.popitem( last = False )
+                self.counts[ 'evictions' ] += 1
+
+    # ------------------------- ___START___: get --------------------------
+    def get( self, url: str, fetch: Callable[[], Any], policy: Policy, account: str = None ) -> Any:
+        """
+        Cached value of a URL, fetched and cached on a miss.
+
+        :param url: Full URL, query string included.
+        :param fetch: Fetches the parsed body (blocking); exceptions are not cached.
+        :param policy: (ttl, stale window) [sec], see policy().
+        :param account: API key the value is fetched with (None: public data).
+        """
+        found, value = self.lookup( url, fetch, account )
+        if not found:
+            value = fetch()
+            self.store( url, value, policy, account )
+        return value
+
+    # ---------------------- ___START___: invalidate ----------------------
+    def invalidate( self, prefix: str = '', account: str = None ) -> int:
+        """
+        Drop cached responses, e.g. after changing account settings.
+
+        :param prefix: Only URLs starting with it (default: everything).
+        :param account: Only responses of this API key (default: of every account).
+        :return: Number of entries dropped
+        """
+        with self._lock:
+            keys = [ key for key in self._entries
+                     if key[ 1 ].startswith( prefix ) and ( account is None or key[ 0 ] == account ) ]
+            for key in keys:
+                del self._entries[ key ]
+        return len( keys )
+
+    # ------------------------ ___START___: stats -------------------------
+    def stats( self ) -> Dict[str, float]:
+        """
+        :return: Counters, entry count and hit ratio (stale answers count as hits).
+        """
+        with self._lock:
+            stats = dict( self.counts, entries = len( self._entries ) )
+        served = stats[ 'hits' ] + stats[ 'stale' ]
+        stats[ 'hit_ratio' ] = served / ( served + stats[ 'misses' ] ) if served + stats[ 'misses' ] else 0.0
+        return stats
@@ -2,8 +2,13 @@
 """
 Create a Coinbase Pro client here
 
-VERSION: 0.0.1
+VERSION: 0.0.6
     - ADDED     : Pre-planning stage
+    - ADDED     : Calls go through a pooled keep-alive session
+    - ADDED     : Calls go through the shared rate limiter
+    - ADDED     : Optional TTL response cache (fees, currencies, user, ...)
+    - ADDED     : Identical concurrent GETs share one in-flight call
+    - ADDED     : Per-endpoint timeouts, retries and circuit breaker
 
 KNOWN ISSUES:
     - Non encountered
@@ -11,7 +16,7 @@ KNOWN ISSUES:
 
 AUTHOR                      :   Mohammad Odeh
 DATE                        :   Jun. 13th, 2022 Year of Our Lord
-LAST CONTRIBUTION DATE      :   Jul. 31st, 2022 Year of Our Lord
+LAST CONTRIBUTION DATE      :   Oct. 18th, 2026 Year of Our Lord
 """
 
 import  pandas                      as      pd                              # Dataframes to facilitate analysis
@@ -25,6 +30,7 @@ import  hmac                                                                # Ke
 import  hashlib                                                             # Secure hash and message digest algorithms
 import  orjson                                                              # Fast, efficient JSON parser
 from    CoinbaseAuth                import  CoinbaseAuthClient
+from    CoinbaseCache               import  ResponseCache
 
 
 class CoinbaseClient( AuthBase ):
@@ -33,39 +39,70 @@ class CoinbaseClient( AuthBase ):
     _cb_key         : str = None
     _cb_secret      : str = None
     API_URL         : str = 'https://api.coinbase.com/v2/'
+    HEADERS         : dict  = { 'Accept'      : 'application/json',         # Sent with every call
+                                'Content-Type': 'application/json',
+                                'User-Agent'  : 'coinbase/python/2.0' }
     
-    def __init__( self, key: str, secret: str, url: str = None ) -> None:
+    def __init__( self, key: str, secret: str, url: str = None, session: requests.Session = None,
+                  limiter = None, cache: ResponseCache = None ) -> None:
+        """
+        :param key: Coinbase API key.
+        :param secret: Coinbase API secret.
+        :param url: API URL (default: Coinbase v2).
+        :param session: Session to send calls through (default: CoinbaseSession.shared_session()).
+        :param limiter: CoinbaseRateLimit.RateLimiter (default: shared one of the API host).
+        :param cache: CoinbaseCache.ResponseCache for slow-changing endpoints (default: none).
+        """
         if url is not None:                                                 # Override API URL if provided
             self.URL = url                                                  #   ...
         else:                                                               # If not
             self.URL = self.API_URL                                         #   Use default API URL
             
-        self.auth_client = CoinbaseAuthClient( key, secret )            # Start authenticated client
-        # self.auth_session = self._start_session()                       # Start authenticated session
+        self.auth_client  = CoinbaseAuthClient( key, secret, session, limiter, cache )   # Start authenticated client
+        self.auth_session = self._start_session()                           # Start authenticated session
         
     def _start_session( self ) -> requests.Session:
         """
-        Create a requests module session to improve performance by persisting
-        cookies across all requests made within the session instance
+        Use the authenticated client's pooled session, so that connections
+        (and their TLS sessions) are reused across calls and clients.
+        The session may be shared, so auth and HEADERS are passed per call
+        instead of being set on the session.
         
-        :return: Authenticated session
+        :return: Pooled session
         """
-        session = requests.session()
-        session.auth = self.auth_client
-        session.headers.update({'Accept': 'application/json',
-                                'Content-Type': 'application/json',
-                                'User-Agent': 'coinbase/python/2.0'})
-        return session
+        return self.auth_client.session
+        
+    def _cached( self, url: str ) -> requests.Response:
+        """
+        Perform a GET request through CoinbaseAuthClient.get_json: answered
+        from the cache when the endpoint is cached, and shared with an
+        identical call already in flight, api_call() included. Only parsed
+        JSON is cached or shared; the response is rebuilt from it (status,
+        URL and body). Error responses are returned as sent, never cached.
         
+        :return:
+        """
+        try:
+            data = self.auth_client.get_json( url, headers = self.HEADERS )  # Throttled, timeouts, retries
+        except requests.HTTPError as err:
+            return err.response
+        
+        get             = requests.Response()
+        get.status_code = 200
+        get.reason      = 'OK'
+        get.url         = url
+        get.encoding    = 'utf-8'
+        get._content    = orjson.dumps( data )
+        get.headers[ 'Content-Type' ] = 'application/json'
+        return get
+    
     def _get( self, url_path: str ) -> requests.Response:
         """
         Perform a GET request.
         
         :return:
         """
-        get = requests.get( self.URL + url_path, auth = self.auth_client )
-        print( get.url )
-        return get
+        return self._cached( self.URL + url_path )
     
     def get_price( self, currency_pair: str ) -> requests.Response:
         """
@@ -82,8 +119,7 @@ class CoinbaseClient( AuthBase ):
 
         :return:
         """
-        get = requests.get( 'https://api.exchange.coinbase.com/fees', auth = self.auth_client )
-        return get              # Get currency pair price
+        return self._cached( 'https://api.exchange.coinbase.com/fees' )     # Get fees
     
     
 #%% ----------------- ___START___: Setup script and run -----------------
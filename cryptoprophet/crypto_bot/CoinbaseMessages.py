@@ -0,0 +1,222 @@
+#@formatter:off
+"""
+Typed, low-allocation decoding of websocket frames.
+
+The "type" field is peeked at before anything is parsed, so frames nobody
+handles (heartbeats, subscriptions, ignored channels) are dropped without
+building a dictionary. The exchange sends "type" as the first key, so the
+common case is a single startswith() against the wanted prefixes. Wanted ticker,
+l2update and match frames are turned into compact __slots__ records whose
+prices and sizes are already floats.
+
+Records answer get(), [] and "in" with the exchange's field names, so the
+existing dictionary based handlers keep working with either representation.
+
+VERSION: 0.0.3
+    - ADDED     : Type peeking, Ticker/L2Update/Match records
+    - ADDED     : Generic field peeking, timestamp parsing moved here
+    - ADDED     : Integer field peeking
+
+KNOWN ISSUES:
+    - Non encountered
+
+
+AUTHOR                      :   Mohammad Odeh
+DATE                        :   Oct. 18th, 2026 Year of Our Lord
+LAST CONTRIBUTION DATE      :   Oct. 18th, 2026 Year of Our Lord
+"""
+
+from    typing                      import  Dict, Iterable, List, Optional  # Additional type hints
+from    typing                      import  Tuple, Union                    # ...
+from    datetime                    import  datetime                        # Parse exchange timestamps
+import  orjson                                                              # Fast, efficient JSON parser
+
+Frame = Union[ bytes, str ]
+
+
+def parse_time( timestamp: str ) -> float:
+    """
+    Convert an exchange ISO 8601 timestamp to epoch seconds.
+    """
+    return datetime.fromisoformat( timestamp.replace( 'Z', '+00:00' ) ).timestamp()
+
+
+def peek_field( frame: Frame, key: str ) -> Optional[str]:
+    """
+    Read a top-level string field of a raw frame without parsing it.
+
+    :return: Field value, or None if the frame has no such field.
+    """
+    if isinstance( frame, bytes ):
+        tag = f'"{key}":"'.encode()
+        i   = frame.find( tag )
+        if i < 0:
+            return None
+        i += len( tag )
+        return frame[ i:frame.find( b'"', i ) ].decode()
+
+    tag = f'"{key}":"'
+    i   = frame.find( tag )
+    if i < 0:
+        return None
+    i += len( tag )
+    return frame[ i:frame.find( '"', i ) ]
+
+
+def peek_int( frame: Frame, key: str ) -> Optional[int]:
+    """
+    Read a top-level integer field (e.g. "sequence") of a raw frame without
+    parsing it.
+
+    :return: Field value, or None if the frame has no such field.
+    """
+    tag, comma, brace = f'"{key}":', ',', '}'
+    if isinstance( frame, bytes ):
+        tag, comma, brace = tag.encode(), b',', b'}'
+    i = frame.find( tag )
+    if i < 0:
+        return None
+    i  += len( tag )
+    end = frame.find( comma, i )
+    if end < 0:                                                             # Last field
+        end = frame.find( brace, i )
+    value = frame[ i:end ].strip()
+    return int( value ) if value.isdigit() else None
+
+
+def peek_type( frame: Frame ) -> Optional[str]:
+    """
+    Read the "type" field of a raw frame without parsing it.
+
+    :return: Message type, or None if the frame has no type.
+    """
+    return peek_field( frame, 'type' )
+
+
+class Record( object ):
+    """
+    Base of the typed messages. Read access mimics the decoded dictionary.
+    """
+    __slots__ = ()
+    type      : str = None
+
+    def get( self, key: str, default = None ):
+        return getattr( self, key, default )
+
+    def __getitem__( self, key: str ):
+        try:
+            return getattr( self, key )
+        except AttributeError:
+            raise KeyError( key ) from None
+
+    def __contains__( self, key: str ) -> bool:
+        return hasattr( self, key )
+
+    def __repr__( self ) -> str:
+        fields = ', '.join( f'{k}={getattr(self, k)!r}' for k in self.__slots__ )
+        return f'{type(self).__name__}({fields})'
+
+    @property
+    def timestamp( self ) -> float:
+        """
+        :return: Exchange time [epoch sec], parsed on demand.
+        """
+        return parse_time( self.time )
+
+
+class Ticker( Record ):
+    __slots__ = ( 'product_id', 'sequence', 'time', 'price', 'best_bid', 'best_ask',
+                  'side', 'last_size', 'trade_id' )
+    type      = 'ticker'
+
+    def __init__( self, msg: dict ) -> None:
+        get             = msg.get
+        self.product_id = msg[ 'product_id' ]
+        self.sequence   = get( 'sequence' )
+        self.time       = get( 'time' )
+        self.price      = float( msg['price'] )
+        self.best_bid   = float( get('best_bid', 'nan') )
+        self.best_ask   = float( get('best_ask', 'nan') )
+        self.side       = get( 'side' )
+        self.last_size  = float( get('last_size', 0.0) )
+        self.trade_id   = get( 'trade_id' )
+
+
+class Match( Record ):
+    __slots__ = ( 'type', 'product_id', 'sequence', 'time', 'price', 'size', 'side', 'trade_id' )
+
+    def __init__( self, msg: dict ) -> None:
+        self.type       = msg[ 'type' ]                                     # "match" or "last_match"
+        self.product_id = msg[ 'product_id' ]
+        self.sequence   = msg.get( 'sequence' )
+        self.time       = msg.get( 'time' )
+        self.price      = float( msg['price'] )
+        self.size       = float( msg['size'] )
+        self.side       = msg.get( 'side' )
+        self.trade_id   = msg.get( 'trade_id' )
+
+
+class L2Update( Record ):
+    __slots__ = ( 'product_id', 'time', 'changes' )
+    type      = 'l2update'
+
+    def __init__( self, msg: dict ) -> None:
+        self.product_id = msg[ 'product_id' ]
+        self.time       = msg.get( 'time' )
+        self.changes    : List[Tuple[str, float, float]] = [ (side, float(price), float(size))
+                                                             for side, price, size in msg['changes'] ]
+
+
+class MessageDecoder( object ):
+    """
+    Decode raw frames, dropping unwanted types before parsing.
+    """
+    RECORDS : Dict[str, type] = { 'ticker'      : Ticker,
+                                  'l2update'    : L2Update,
+                                  'match'       : Match,
+                                  'last_match'  : Match }
+
+    def __init__( self, wanted: Iterable[str] = None ) -> None:
+        """
+        :param wanted: Message types to keep (default: keep everything).
+                       Types without a record class are decoded to a dict.
+        """
+        self.wanted  = None if wanted is None else frozenset( wanted )
+        self.dropped = 0                                                    # Frames dropped unparsed
+
+        prefixes     = tuple( f'{{"type":"{t}"' for t in self.wanted or () )
+        self._prefix = { str  : prefixes,                                   # Fast path prefixes
+                         bytes: tuple( p.encode() for p in prefixes ) }
+        self._first  = { str: '{"type":"', bytes: b'{"type":"' }            # "type" is the first key
+
+    # ------------------------ ___START___: decode ------------------------
+    def decode( self, frame: Frame ) -> Optional[Union[Record, dict]]:
+        """
+        :return: Record, dict, or None if the frame is not wanted.
+        """
+        if self.wanted is not None:
+            kind = frame.__class__
+            if not frame.startswith( self._prefix[kind] ):                  # Not a wanted type up front
+                if frame.startswith( self._first[kind] ) or peek_type( frame ) not in self.wanted:
+                    self.dropped += 1
+                    return None
+        msg = orjson.loads( frame )
+        cls = self.RECORDS.get( msg.get('type') )
+        return msg if cls is None else cls( msg )
+
+
+#%% ----------------- ___START___: Setup script and run -----------------
+
+if __name__ == '__main__':
+    decoder = MessageDecoder( wanted = ('ticker', 'l2update') )
+    frames  = [ '{"type":"heartbeat","last_trade_id":1,"product_id":"BTC-USD","sequence":1}',
+                '{"type":"ticker","sequence":2,"product_id":"BTC-USD","price":"30000.01",'
+                '"best_bid":"30000.00","best_ask":"30000.02","side":"buy","last_size":"0.1",'
+                '"time":"2022-08-01T00:00:00.000000Z","trade_id":7}',
+                '{"type":"l2update","product_id":"BTC-USD","changes":[["buy","29999.99","0.5"]],'
+                '"time":"2022-08-01T00:00:00.000000Z"}' ]
+    for frame in frames:
+        print( decoder.decode( frame ) )
+    print( f'Dropped: {decoder.dropped}' )
+
+#   ----------------- ___ END ___: Setup script and run -----------------
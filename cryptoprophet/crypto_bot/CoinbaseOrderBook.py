@@ -0,0 +1,240 @@
+#@formatter:off
+"""
+In-memory level2 order book fed by the websocket "level2_batch" channel.
+
+Each side keeps its price levels in a sorted array with the best level at
+the END of the array, so the frequent changes near the top of the book only
+shift a handful of elements. Sizes live in a dictionary keyed by price,
+which means updating an existing level never touches the array at all.
+
+    - Change the size of a level        : O(1) (dictionary only)
+    - Add or remove a level             : O(log n) search + O(n - i) shift,
+                                          i = position in the array; the
+                                          shift is a memmove in list.insert/del
+                                          and near the top of the book i ~ n
+    - Best bid/ask, spread, mid         : O(1)
+    - Depth / cumulative size at N      : O(k)
+
+VERSION: 0.0.1
+    - ADDED     : Snapshot and l2update handling, top of book queries
+
+KNOWN ISSUES:
+    - Non encountered
+
+
+AUTHOR                      :   Mohammad Odeh
+DATE                        :   Oct. 18th, 2026 Year of Our Lord
+LAST CONTRIBUTION DATE      :   Oct. 18th, 2026 Year of Our Lord
+"""
+
+from    typing                      import  Dict, List, Optional, Tuple     # Additional type hints
+from    bisect                      import  bisect_left                     # Binary search on sorted arrays
+
+Level = Tuple[ float, float ]                                               # (price, size)
+
+class BookSide( object ):
+    """
+    One side of the book.
+
+    Keys are stored ascending with the best level last. Bids use the price as
+    key, asks use the negated price so that the lowest ask sorts last.
+    """
+    __slots__ = ( 'sign', 'keys', 'sizes' )
+
+    def __init__( self, is_bid: bool ) -> None:
+        self.sign   : float             = 1.0 if is_bid else -1.0           # Price -> key
+        self.keys   : List[float]       = []                                # Sorted keys, best last
+        self.sizes  : Dict[float, float] = {}                               # Key -> size
+
+    def __len__( self ) -> int:
+        return len( self.keys )
+
+    # ------------------------ ___START___: clear -------------------------
+    def clear( self ) -> None:
+        self.keys.clear()
+        self.sizes.clear()
+
+    # ------------------------ ___START___: load --------------------------
+    def load( self, levels: list ) -> None:
+        """
+        Replace the side with a snapshot.
+
+        :param levels: [[price, size], ...] as sent by the exchange.
+        """
+        sign        = self.sign
+        self.sizes  = { sign * float(p): float(s) for p, s, *_ in levels if float(s) }
+        self.keys   = sorted( self.sizes )
+
+    # ------------------------ ___START___: update ------------------------
+    def update( self, price: float, size: float ) -> None:
+        """
+        Set the size at a price level; a size of zero removes the level.
+        """
+        key   = self.sign * price
+        sizes = self.sizes
+        if size:
+            if key not in sizes:                                            # New level
+                keys = self.keys                                            #   Insert in order
+                keys.insert( bisect_left( keys, key ), key )                #   ...
+            sizes[ key ] = size                                             # Set size
+        elif key in sizes:                                                  # Remove level
+            keys = self.keys
+            del keys[ bisect_left( keys, key ) ]
+            del sizes[ key ]
+
+    # ------------------------- ___START___: best -------------------------
+    def best( self ) -> Optional[Level]:
+        """
+        :return: Best (price, size) or None if the side is empty.
+        """
+        if not self.keys:
+            return None
+        key = self.keys[ -1 ]
+        return self.sign * key, self.sizes[ key ]
+
+    # ------------------------ ___START___: depth -------------------------
+    def depth( self, n: int ) -> List[Level]:
+        """
+        :return: Top n levels, best first.
+        """
+        sign, sizes = self.sign, self.sizes
+        return [ (sign * key, sizes[key]) for key in self.keys[ :-n-1:-1 ] ]
+
+    # -------------------- ___START___: cumulative_size -------------------
+    def cumulative_size( self, n: int ) -> float:
+        """
+        :return: Total size resting in the top n levels.
+        """
+        sizes = self.sizes
+        return sum( sizes[key] for key in self.keys[ :-n-1:-1 ] )
+
+    # -------------------- ___START___: size_to_price ---------------------
+    def size_to_price( self, price: float ) -> float:
+        """
+        :return: Total size resting between the top of book and price (inclusive).
+        """
+        keys, sizes = self.keys, self.sizes
+        return sum( sizes[key] for key in keys[ bisect_left( keys, self.sign * price ): ] )
+
+
+class OrderBook( object ):
+    """
+    Level2 order book of a single product.
+    """
+    def __init__( self, product_id: str ) -> None:
+        self.product_id = product_id
+        self.bids       = BookSide( is_bid = True  )
+        self.asks       = BookSide( is_bid = False )
+        self.sequence   : int = None                                        # Sequence of the last snapshot
+        self.time       : str = None                                        # Time of the last update
+        self.ready      = False                                             # Snapshot received
+
+    # ------------------------ ___START___: apply -------------------------
+    def apply( self, msg: dict ) -> None:
+        """
+        Apply a "snapshot" or "l2update" message.
+        """
+        msg_type = msg[ 'type' ]
+        if msg_type == 'l2update':
+            if not self.ready:                                              # Nothing to update yet
+                return
+            bids, asks = self.bids, self.asks
+            for side, price, size in msg[ 'changes' ]:
+                ( bids if side == 'buy' else asks ).update( float(price), float(size) )
+            self.time = msg.get( 'time' )
+        elif msg_type == 'snapshot':
+            self.bids.load( msg['bids'] )
+            self.asks.load( msg['asks'] )
+            self.sequence = msg.get( 'sequence' )
+            self.ready    = True
+
+    # ----------------------- ___START___: queries ------------------------
+    def best_bid( self ) -> Optional[Level]:
+        return self.bids.best()
+
+    def best_ask( self ) -> Optional[Level]:
+        return self.asks.best()
+
+    def spread( self ) -> Optional[float]:
+        bid, ask = self.bids.best(), self.asks.best()
+        return None if bid is None or ask is None else ask[0] - bid[0]
+
+    def mid( self ) -> Optional[float]:
+        bid, ask = self.bids.best(), self.asks.best()
+        return None if bid is None or ask is None else 0.5 * (ask[0] + bid[0])
+
+    def depth( self, n: int ) -> Dict[str, List[Level]]:
+        """
+        :return: Top n levels of each side, best first.
+        """
+        return { 'bids': self.bids.depth( n ), 'asks': self.asks.depth( n ) }
+
+    def cumulative_size( self, n: int ) -> Dict[str, float]:
+        """
+        :return: Total size resting in the top n levels of each side.
+        """
+        return { 'bids': self.bids.cumulative_size( n ), 'asks': self.asks.cumulative_size( n ) }
+
+
+class OrderBooks( object ):
+    """
+    Order books of every product on a websocket, created on first snapshot.
+    """
+    def __init__( self ) -> None:
+        self.books : Dict[str, OrderBook] = {}
+
+    def __getitem__( self, product_id: str ) -> OrderBook:
+        return self.books[ product_id ]
+
+    def __contains__( self, product_id: str ) -> bool:
+        return product_id in self.books
+
+    # ------------------------ ___START___: apply -------------------------
+    def apply( self, msg: dict ) -> None:
+        """
+        Route a level2 message to its product's book.
+        """
+        product_id = msg[ 'product_id' ]
+        book = self.books.get( product_id )
+        if book is None:
+            book = self.books[ product_id ] = OrderBook( product_id )
+        book.apply( msg )
+
+    # ------------------------ ___START___: handle ------------------------
+    async def handle( self, msg: dict ) -> None:
+        """
+        Websocket handler.
+        """
+        self.apply( msg )
+
+    # ------------------------ ___START___: attach ------------------------
+    def attach( self, ws ) -> None:
+        """
+        Consume the level2 channel of a CoinbaseAPI.Websocket.
+        """
+        ws.register_handler( 'level2_batch', self.handle )
+
+
+#%% ----------------- ___START___: Setup script and run -----------------
+
+if __name__ == '__main__':
+    import  asyncio
+    import  orjson
+    from    CoinbaseAPI             import  Websocket
+
+    ws    = Websocket()
+    books = OrderBooks()
+    books.attach( ws )
+
+    async def print_top( msg ):
+        book = books[ msg['product_id'] ]
+        print( book.best_bid(), book.best_ask(), book.spread() )
+    ws.register_handler( 'l2update', print_top )
+
+    req   = { "type": "subscribe", "product_ids": ["BTC-USD"], "channels": ["level2_batch"] }
+    try:
+        asyncio.run( ws.connect( orjson.dumps(req) ) )
+    except KeyboardInterrupt:
+        print( "Interrupt detected" )
+
+#   ----------------- ___ END ___: Setup script and run -----------------
@@ -0,0 +1,98 @@
+#@formatter:off
+"""
+Lazy cursor pagination for list endpoints (accounts, fills, orders, ledger).
+
+Pages are fetched one at a time and handed out by a generator, so only the
+page being consumed (plus, with prefetch, the one behind it) is ever held
+in memory, and the first rows are available as soon as the first page
+lands. Stopping early is just leaving the loop; nothing past the current
+page is requested (or, with prefetch, one page at most).
+
+Both cursor styles are followed:
+
+    > pro/exchange  : "CB-AFTER" response header, sent back as ?after=
+    > v2            : {"pagination": {"next_uri": ...}, "data": [...]}
+
+VERSION: 0.0.1
+    - ADDED     : Lazy page generator with optional one-page prefetch
+
+KNOWN ISSUES:
+    - Non encountered
+
+
+AUTHOR                      :   Mohammad Odeh
+DATE                        :   Oct. 18th, 2026 Year of Our Lord
+LAST CONTRIBUTION DATE      :   Oct. 18th, 2026 Year of Our Lord
+"""
+
+from    typing                      import  Any, Callable, Iterator         # Additional type hints
+from    typing                      import  Optional, Tuple                 # ...
+from    concurrent.futures          import  Future, ThreadPoolExecutor      # Prefetch the next page
+from    urllib.parse                import  urlsplit, urlunsplit, urljoin   # Cursor URLs
+from    urllib.parse                import  parse_qsl, urlencode            # ...
+import  requests                                                            # Responses
+
+from    CoinbaseResults             import  unwrap                          # v2 envelope
+
+PAGE_LIMIT  : int = 100                                                     # Largest page both APIs serve
+
+Fetch = Callable[ [str], Tuple[requests.Response, Any] ]                    # URL -> (response, parsed body)
+
+
+def with_query( url: str, **params: Any ) -> str:
+    """
+    :return: url with params set in its query string (None removes one).
+    """
+    parts = urlsplit( url )
+    query = dict( parse_qsl( parts.query ) )
+    query.update( params )
+    query = { key: value for key, value in query.items() if value is not None }
+    return urlunsplit( parts._replace( query = urlencode( query ) ) )
+
+
+def next_url( url: str, resp: requests.Response, data: Any ) -> Optional[str]:
+    """
+    :param url: URL of the page just fetched.
+    :param resp: Its response.
+    :param data: Its parsed body.
+    :return: URL of the next page, None on the last one.
+    """
+    after = resp.headers.get( 'CB-AFTER' )
+    if after:                                                               # pro/exchange cursor
+        return with_query( url, after = after, before = None )
+    if isinstance( data, dict ):                                            # v2 cursor
+        next_uri = ( data.get( 'pagination' ) or {} ).get( 'next_uri' )
+        if next_uri:
+            return urljoin( url, next_uri )
+    return None
+
+
+def pages( fetch: Fetch, url: str, prefetch: bool = False, max_pages: int = None ) -> Iterator[Any]:
+    """
+    Walk a paginated endpoint.
+
+    :param fetch: Fetches one page.
+    :param url: URL of the first page.
+    :param prefetch: Request the next page while the current one is consumed.
+    :param max_pages: Stop after this many pages (default: all of them).
+    :return: Generator of parsed page bodies, empty pages are not yielded
+    """
+    pool    = ThreadPoolExecutor( 1 ) if prefetch else None
+    pending : Optional[Future] = None
+    n       = 0
+    try:
+        while url is not None and ( max_pages is None or n < max_pages ):
+            resp, data = pending.result() if pending is not None else fetch( url )
+            pending    = None
+            n         += 1
+            if not unwrap( data ):                                          # Ran out of rows
+                return
+            url = next_url( url, resp, data )
+            if pool is not None and url is not None and ( max_pages is None or n < max_pages ):
+                pending = pool.submit( fetch, url )                         # Overlaps with the consumer
+            yield data
+    finally:                                                                # Exhausted, closed or failed
+        if pending is not None:                                             # Not needed anymore
+            pending.cancel()
+        if pool is not None:
+            pool.shutdown( wait = False )                                   # No cancel_futures before 3.9
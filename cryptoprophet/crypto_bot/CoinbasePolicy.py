@@ -0,0 +1,336 @@
+#@formatter:off
+"""
+Timeout, retry and circuit-breaker policies for the REST clients.
+
+Every call goes through PolicyEngine.call (threads) or call_async
+(coroutines), which applies the rule of its endpoint:
+
+    > Timeouts  : (connect, read) per endpoint, and a deadline for the whole
+                  call, retries included, so tail latency stays bounded
+    > Retries   : on 429, 5xx, timeouts and connection errors, with full
+                  jitter exponential backoff, i.e. uniform(0, min(cap,
+                  backoff * 2^attempt)). Only idempotent calls are retried
+                  after the request may have reached the exchange: GET and
+                  DELETE, and POSTs carrying a client_oid/idem key the
+                  exchange dedupes on. Others are only retried when the
+                  request surely was not processed (connect timeout, 429)
+    > Breaker   : per API host. After `failures` consecutive 5xx/timeouts/
+                  connection errors it opens and calls fail fast with
+                  CircuitOpen instead of tying up threads on a degraded
+                  exchange. After `reset` seconds a single probe call is let
+                  through; success closes it, failure opens it again
+
+Rules are looked up by endpoint path (v2/ prefix dropped, "*" matches one
+segment); the longest matching prefix wins and "" is the fallback.
+4xx answers other than 429 are returned as they are (neither retried nor
+counted against the breaker). Responses still failing after the last retry
+are returned too; the caller decides (raise_for_status).
+
+VERSION: 0.0.1
+    - ADDED     : Per-endpoint timeouts, jittered retries, circuit breaker
+
+KNOWN ISSUES:
+    - Non encountered
+
+
+AUTHOR                      :   Mohammad Odeh
+DATE                        :   Oct. 18th, 2026 Year of Our Lord
+LAST CONTRIBUTION DATE      :   Oct. 18th, 2026 Year of Our Lord
+"""
+
+from    typing                      import  Any, Awaitable, Callable, Dict  # Additional type hints
+from    typing                      import  Optional, Tuple                 # ...
+from    urllib.parse                import  urlsplit                        # Host of a URL
+from    time                        import  monotonic, sleep                # Deadlines, backoff
+import  threading                                                           # Shared across threads
+import  asyncio                                                             # Asynchronous routines
+import  random                                                              # Jitter
+import  requests                                                            # Responses and errors
+
+from    CoinbaseCache               import  route                           # Endpoint path segments
+
+RETRY_STATUS    : frozenset = frozenset( ( 429, 500, 502, 503, 504 ) )
+IDEMPOTENT      : frozenset = frozenset( ( 'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE' ) )
+IDEMPOTENCY_KEYS: Tuple[str, ...] = ( 'client_oid', 'idem' )                # Deduped by the exchange
+
+Send = Callable[ [Tuple[float, float]], requests.Response ]                 # timeout -> response
+
+
+class CircuitOpen( requests.RequestException ):
+    """
+    Failed fast, the exchange host is considered degraded.
+    """
+
+
+class Rule( object ):
+    """
+    Timeouts and retries of an endpoint.
+    """
+    __slots__ = ( 'connect', 'read', 'retries', 'backoff', 'cap', 'deadline' )
+
+    def __init__( self, connect: float = 3.05, read: float = 10.0, retries: int = 3,
+                  backoff: float = 0.25, cap: float = 4.0, deadline: float = 30.0 ) -> None:
+        """
+        :param connect: Connect timeout [sec].
+        :param read: Read timeout [sec].
+        :param retries: Retries after the first attempt.
+        :param backoff: First backoff ceiling, doubled every retry [sec].
+        :param cap: Largest backoff ceiling [sec].
+        :param deadline: Time budget of the whole call, retries included [sec].
+        """
+        self.connect, self.read, self.retries = connect, read, retries
+        self.backoff, self.cap , self.deadline = backoff, cap , deadline
+
+    def __repr__( self ) -> str:
+        return 'Rule(' + ', '.join( f'{k}={getattr(self, k)}' for k in self.__slots__ ) + ')'
+
+
+RULES   : Dict[str, Rule] = { ''                    : Rule(),
+                              'orders'              : Rule( read =  5.0, retries = 2, backoff = 0.1, cap = 1.0, deadline = 10.0 ),
+                              'products/*/ticker'   : Rule( read =  3.0, retries = 2, backoff = 0.1, cap = 1.0, deadline =  5.0 ),
+                              'products/*/book'     : Rule( read =  3.0, retries = 2, backoff = 0.1, cap = 1.0, deadline =  5.0 ),
+                              'prices'              : Rule( read =  3.0, retries = 2, backoff = 0.1, cap = 1.0, deadline =  5.0 ),
+                              'products/*/candles'  : Rule( read = 20.0, retries = 5, backoff = 0.5, cap = 8.0, deadline = 90.0 ) }
+
+
+def idempotent( method: str, payload: Any = None ) -> bool:
+    """
+    :return: Whether sending the call twice has the effect of sending it once.
+    """
+    if method in IDEMPOTENT:
+        return True
+    return isinstance( payload, dict ) and any( payload.get( key ) for key in IDEMPOTENCY_KEYS )
+
+
+class CircuitBreaker( object ):
+    """
+    Consecutive failure breaker of one host.
+    """
+    def __init__( self, failures: int = 5, reset: float = 10.0 ) -> None:
+        """
+        :param failures: Consecutive failures opening the breaker.
+        :param reset: Time open before a probe call is let through [sec].
+        """
+        self.failures  = failures
+        self.reset     = reset
+        self.state     = 'closed'                                           # closed, open, half_open
+        self.streak    = 0                                                  # Consecutive failures
+        self.opened    = 0.0
+        self.trips     = 0
+        self._lock     = threading.Lock()
+
+    def allow( self ) -> bool:
+        """
+        :return: Whether a call may be sent now.
+        """
+        with self._lock:
+            if self.state == 'closed':
+                return True
+            if self.state == 'open' and monotonic() - self.opened >= self.reset:
+                self.state = 'half_open'                                    # Let one probe through
+                return True
+            return False
+
+    def record( self, ok: bool ) -> None:
+        """
+        Outcome of a call that was let through.
+        """
+        with self._lock:
+            if ok:
+                self.state, self.streak = 'closed', 0
+                return
+            self.streak += 1
+            if self.state == 'half_open' or ( self.state == 'closed' and self.streak >= self.failures ):
+                self.state, self.opened = 'open', monotonic()
+                self.trips += 1
+
+    def release( self ) -> None:
+        """
+        A call that was let through ended without an outcome (cancelled):
+        a probe is given back, so the next call probes again.
+        """
+        with self._lock:
+            if self.state == 'half_open':
+                self.state = 'open'                                         # Keeps `opened`, reset already elapsed
+
+
+class PolicyEngine( object ):
+    """
+    Apply timeouts, retries and circuit breakers to calls.
+    """
+    def __init__( self, rules: Dict[str, Rule] = None, failures: int = 5, reset: float = 10.0 ) -> None:
+        """
+        :param rules: Endpoint pattern -> Rule (default: RULES); "" is the fallback.
+        :param failures: Consecutive failures opening a host's breaker.
+        :param reset: Time a breaker stays open before a probe [sec].
+        """
+        rules          = dict( RULES if rules is None else rules )
+        rules.setdefault( '', Rule() )
+        self.rules     = { tuple( p.strip( '/' ).split( '/' ) ) if p else (): r for p, r in rules.items() }
+        self.failures  = failures
+        self.reset     = reset
+        self.breakers  : Dict[str, CircuitBreaker] = {}
+        self.counts    = { 'calls': 0, 'retries': 0, 'timeouts': 0, 'errors': 0, 'failed_fast': 0 }
+        self._lock     = threading.Lock()
+
+    # ------------------------- ___START___: rule -------------------------
+    def rule( self, url: str ) -> Rule:
+        """
+        :return: Rule of the longest pattern matching the start of the URL's path.
+        """
+        segments = route( url )
+        best     = ()
+        for pattern in self.rules:
+            if len( pattern ) > len( best ) and len( pattern ) <= len( segments ) and \
+               all( p == '*' or p == s for p, s in zip( pattern, segments ) ):
+                best = pattern
+        return self.rules[ best ]
+
+    def breaker( self, url: str ) -> CircuitBreaker:
+        """
+        :return: Circuit breaker of the URL's host.
+        """
+        host = urlsplit( url ).netloc
+        with self._lock:
+            breaker = self.breakers.get( host )
+            if breaker is None:
+                breaker = self.breakers[ host ] = CircuitBreaker( self.failures, self.reset )
+            return breaker
+
+    def _count( self, key: str ) -> None:
+        with self._lock:
+            self.counts[ key ] += 1
+
+    # ------------------------ ___START___: _start ------------------------
+    def _start( self, url: str ) -> Tuple[Rule, CircuitBreaker, float]:
+        """
+        :return: (rule, breaker, deadline) of a new call
+        :raises CircuitOpen: If the host's breaker is open.
+        """
+        rule, breaker = self.rule( url ), self.breaker( url )
+        self._count( 'calls' )
+        if not breaker.allow():
+            self._count( 'failed_fast' )
+            raise CircuitOpen( f'Circuit open for {urlsplit(url).netloc}, failing fast' )
+        return rule, breaker, monotonic() + rule.deadline
+
+    # ------------------------ ___START___: _next -------------------------
+    def _next( self, rule: Rule, breaker: CircuitBreaker, deadline: float, attempt: int, safe: bool,
+               resp: requests.Response = None, err: Exception = None ) -> Optional[float]:
+        """
+        Record the outcome of an attempt and decide whether to retry.
+
+        :param safe: Call may be repeated even if it reached the exchange.
+        :return: Backoff before the next attempt [sec], None to stop
+        """
+        if err is not None:
+            self._count( 'timeouts' if isinstance( err, requests.Timeout ) else 'errors' )
+            breaker.record( False )
+            retry = isinstance( err, requests.ConnectTimeout ) or (         # Never sent, or transport error
+                    safe and isinstance( err, ( requests.ConnectionError, requests.Timeout ) ) )
+        else:
+            breaker.record( resp.status_code < 500 )
+            retry = resp.status_code in RETRY_STATUS and ( safe or resp.status_code == 429 )
+        if not retry or attempt >= rule.retries:
+            return None
+        delay = random.uniform( 0.0, min( rule.cap, rule.backoff * 2 ** attempt ) )
+        if monotonic() + delay >= deadline or not breaker.allow():          # Out of time, or host degraded
+            return None
+        self._count( 'retries' )
+        return delay
+
+    @staticmethod
+    def _timeout( rule: Rule, deadline: float ) -> Tuple[float, float]:
+        left = max( deadline - monotonic(), 0.001 )
+        return ( min( rule.connect, left ), min( rule.read, left ) )
+
+    # ------------------------- ___START___: call -------------------------
+    def call( self, method: str, url: str, send: Send, payload: Any = None ) -> requests.Response:
+        """
+        Send a call (blocking) under the URL's rule.
+
+        :param method: HTTP method.
+        :param url: Absolute URL.
+        :param send: Sends one attempt with the given (connect, read) timeout.
+        :param payload: JSON body, checked for idempotency keys.
+        :return: Last response
+        :raises CircuitOpen: If the host's breaker is open.
+        :raises requests.RequestException: Error of the last attempt.
+        """
+        rule, breaker, deadline = self._start( url )
+        safe = idempotent( method, payload )
+        for attempt in range( rule.retries + 1 ):
+            try:
+                resp = send( self._timeout( rule, deadline ) )
+            except requests.RequestException as err:
+                delay = self._next( rule, breaker, deadline, attempt, safe, err = err )
+                if delay is None:
+                    raise
+            except Exception:                                               # Bug, unexpected error
+                breaker.record( False )                                     #   never leave a probe half open
+                raise
+            except BaseException:                                           # Cancelled, interrupted: no outcome
+                breaker.release()
+                raise
+            else:
+                delay = self._next( rule, breaker, deadline, attempt, safe, resp = resp )
+                if delay is None:
+                    return resp
+            sleep( delay )
+
+    # ---------------------- ___START___: call_async ----------------------
+    async def call_async( self, method: str, url: str, send: Callable[[Tuple[float, float]], Awaitable],
+                          payload: Any = None ) -> requests.Response:
+        """
+        call() for coroutines: backoff sleeps on the event loop, so no
+        worker thread is held while waiting to retry.
+
+        :param send: Coroutine function sending one attempt with the given timeout.
+        """
+        rule, breaker, deadline = self._start( url )
+        safe = idempotent( method, payload )
+        for attempt in range( rule.retries + 1 ):
+            try:
+                resp = await send( self._timeout( rule, deadline ) )
+            except requests.RequestException as err:
+                delay = self._next( rule, breaker, deadline, attempt, safe, err = err )
+                if delay is None:
+                    raise
+            except Exception:                                               # Bug, unexpected error
+                breaker.record( False )                                     #   never leave a probe half open
+                raise
+            except BaseException:                                           # Cancelled, interrupted: no outcome
+                breaker.release()
+                raise
+            else:
+                delay = self._next( rule, breaker, deadline, attempt, safe, resp = resp )
+                if delay is None:
+                    return resp
+            await asyncio.sleep( delay )
+
+    # ------------------------ ___START___: stats -------------------------
+    def stats( self ) -> Dict[str, Any]:
+        """
+        :return: Counters and breaker state per host.
+        """
+        with self._lock:
+            stats = dict( self.counts )
+            stats[ 'breakers' ] = { host: { 'state': b.state, 'trips': b.trips }
+                                    for host, b in self.breakers.items() }
+        return stats
+
+
+_shared : PolicyEngine = None
+_lock   = threading.Lock()
+
+def shared_policy() -> PolicyEngine:
+    """
+    Process-wide engine used by the clients unless given their own, so all
+    of them see the same breaker state.
+    """
+    global _shared
+    if _shared is None:
+        with _lock:
+            if _shared is None:
+                _shared = PolicyEngine()
+    return _shared
@@ -0,0 +1,221 @@
+#@formatter:off
+"""
+Client-side token-bucket rate limiting with priority lanes for REST calls.
+
+Coinbase enforces per-second request limits per API host. Instead of
+finding them by collecting 429s, every call takes a token from a bucket
+first. Buckets are shared by every client instance and thread in the
+process (one per host, see shared_limiter), and blocked callers are served
+by lane, then in arrival order:
+
+    > order     : order placement and cancels
+    > account   : accounts, fills, ledger, user data
+    > market    : market data polling
+
+so a burst of market data polls queues behind orders instead of in front
+of them. Time spent waiting for a token is recorded per lane.
+
+Callers in threads use acquire(); coroutines use acquire_async(), which
+sleeps on the event loop instead of blocking it.
+
+VERSION: 0.0.1
+    - ADDED     : Shared token buckets, priority lanes, wait time metrics
+
+KNOWN ISSUES:
+    - Non encountered
+
+
+AUTHOR                      :   Mohammad Odeh
+DATE                        :   Oct. 18th, 2026 Year of Our Lord
+LAST CONTRIBUTION DATE      :   Oct. 18th, 2026 Year of Our Lord
+"""
+
+from    typing                      import  Dict, Optional, Tuple           # Additional type hints
+from    heapq                       import  heappush, heappop, heapify      # Waiters by priority
+from    itertools                   import  count                           # Arrival order
+from    urllib.parse                import  urlsplit                        # Host of a URL
+from    time                        import  monotonic                       # Refill clock
+import  threading                                                           # Shared across threads
+import  asyncio                                                             # Asynchronous routines
+
+from    FeedMetrics                 import  Histogram                       # Wait time histograms
+
+LANES       : Tuple[str, ...] = ( 'order', 'account', 'market' )            # Highest priority first
+
+# (requests/sec, burst) per API host; anything else gets DEFAULT_LIMIT
+LIMITS      : Dict[str, Tuple[float, float]] = { 'api.exchange.coinbase.com'   : ( 15.0, 30.0 ),
+                                                 'api.pro.coinbase.com'        : ( 15.0, 30.0 ),
+                                                 'api.coinbase.com'            : ( 10.0, 15.0 ) }
+DEFAULT_LIMIT : Tuple[float, float] = ( 10.0, 15.0 )
+
+ACCOUNT_PATHS : Tuple[str, ...] = ( 'accounts', 'fills', 'orders', 'ledger', 'user', 'fees',
+                                    'payment-methods', 'transfers', 'profiles' )
+
+
+def lane_of( method: str, uri: str ) -> str:
+    """
+    Classify a call.
+
+    :param method: HTTP method.
+    :param uri: Path (relative or absolute URL).
+    :return: One of LANES
+    """
+    path = urlsplit( uri ).path.strip( '/' )
+    if path.startswith( 'v2/' ):
+        path = path[ 3: ]
+    if method != 'GET' and path.startswith( 'orders' ):                     # Place or cancel
+        return 'order'
+    if path.startswith( ACCOUNT_PATHS ):
+        return 'account'
+    return 'market'
+
+
+class RateLimiter( object ):
+    """
+    Token bucket whose waiters are served by lane priority.
+    """
+    def __init__( self, rate: Optional[float] = DEFAULT_LIMIT[0], burst: float = DEFAULT_LIMIT[1] ) -> None:
+        """
+        :param rate: Tokens added per second (None: unlimited).
+        :param burst: Bucket size, i.e. calls allowed back to back.
+        """
+        self.rate         = rate
+        self.burst        = burst
+        self.tokens       = burst
+        self.paused_until = 0.0                                             # Set after a 429
+        self._t           = monotonic()
+        self._cond        = threading.Condition()
+        self._waiting     : list = []                                       # Heap of (priority, ticket)
+        self._ticket      = count()
+        self.wait         : Dict[str, Histogram] = { lane: Histogram() for lane in LANES }
+
+    # ------------------------ ___START___: _take -------------------------
+    def _take( self, entry: tuple ) -> float:
+        """
+        Take a token for a queued waiter (lock held).
+
+        :return: 0 if taken, else how long to wait before trying again
+                 (-1: not first in line, wait to be notified).
+        """
+        if self._waiting[ 0 ] != entry:
+            return -1.0
+        now          = monotonic()
+        self.tokens  = min( self.burst, self.tokens + ( now - self._t ) * self.rate )
+        self._t      = now
+        if now < self.paused_until:
+            return self.paused_until - now
+        if self.tokens < 1.0:
+            return ( 1.0 - self.tokens ) / self.rate
+        self.tokens -= 1.0
+        heappop( self._waiting )
+        self._cond.notify_all()                                             # Next in line may go
+        return 0.0
+
+    def _enter( self, lane: str ) -> tuple:
+        entry = ( LANES.index( lane ), next( self._ticket ) )
+        heappush( self._waiting, entry )
+        return entry
+
+    def _leave( self, entry: tuple ) -> None:
+        """
+        Drop a waiter that gave up (lock held).
+        """
+        if entry in self._waiting:
+            self._waiting.remove( entry )
+            heapify( self._waiting )
+            self._cond.notify_all()
+
+    # ----------------------- ___START___: acquire ------------------------
+    def acquire( self, lane: str = 'market' ) -> float:
+        """
+        Block until a token is available.
+
+        :param lane: One of LANES.
+        :return: Time waited [sec]
+        """
+        if self.rate is None:
+            return 0.0
+        t0 = monotonic()
+        with self._cond:
+            entry = self._enter( lane )
+            try:
+                while True:
+                    delay = self._take( entry )
+                    if delay == 0.0:
+                        break
+                    self._cond.wait( None if delay < 0 else delay )
+            except BaseException:
+                self._leave( entry )
+                raise
+            waited = monotonic() - t0
+            self.wait[ lane ].record( waited )
+        return waited
+
+    # -------------------- ___START___: acquire_async ---------------------
+    async def acquire_async( self, lane: str = 'market' ) -> float:
+        """
+        Wait for a token without blocking the event loop.
+
+        :param lane: One of LANES.
+        :return: Time waited [sec]
+        """
+        if self.rate is None:
+            return 0.0
+        t0 = monotonic()
+        with self._cond:
+            entry = self._enter( lane )
+        try:
+            while True:
+                with self._cond:
+                    delay = self._take( entry )
+                if delay == 0.0:
+                    break
+                await asyncio.sleep( 1.0 / self.rate if delay < 0 else delay )
+        except BaseException:                                               # Cancelled
+            with self._cond:
+                self._leave( entry )
+            raise
+        waited = monotonic() - t0
+        with self._cond:
+            self.wait[ lane ].record( waited )
+        return waited
+
+    # ------------------------ ___START___: pause -------------------------
+    def pause( self, seconds: float ) -> None:
+        """
+        Hand out no tokens for a while, e.g. after a 429 with Retry-After.
+        """
+        with self._cond:
+            self.paused_until = max( self.paused_until, monotonic() + seconds )
+            self.tokens       = 0.0
+            self._cond.notify_all()
+
+    # ------------------------ ___START___: stats -------------------------
+    def stats( self ) -> Dict[str, dict]:
+        """
+        :return: Lane -> wait time summary [sec], plus the current queue length.
+        """
+        with self._cond:
+            stats = { lane: h.summary() for lane, h in self.wait.items() }
+            stats[ 'waiting' ] = len( self._waiting )
+        return stats
+
+
+_limiters   : Dict[str, RateLimiter] = {}
+_lock       = threading.Lock()
+
+def shared_limiter( url: str ) -> RateLimiter:
+    """
+    Process-wide limiter of the API host a URL points to.
+
+    :param url: Any URL on the host.
+    :return: RateLimiter configured from LIMITS
+    """
+    host    = urlsplit( url ).hostname or url
+    limiter = _limiters.get( host )
+    if limiter is None:
+        with _lock:
+            limiter = _limiters.get( host )
+            if limiter is None:
+                limiter = _limiters[ host ] = RateLimiter( *LIMITS.get( host, DEFAULT_LIMIT ) )
+    return limiter
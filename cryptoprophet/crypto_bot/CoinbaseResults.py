@@ -0,0 +1,163 @@
+#@formatter:off
+"""
+Result formats for REST responses.
+
+A response body is parsed once (orjson) and then handed back in the format
+the caller asks for:
+
+    > raw       : the parsed JSON as is (cheapest)
+    > records   : __slots__ records, one per row, numeric fields as floats
+    > numpy     : NumPy structured array, numeric fields as float64
+    > frame     : pandas DataFrame, values as sent
+
+v2 responses wrap their payload in {"data": ...}; every format but raw
+unwraps it. frame used to be built from the envelope itself, i.e. a single
+"data" column; it is now built from the payload. Rows of records/numpy have
+the union of the keys of all rows, missing ones read None (NaN if numeric).
+Rows whose keys are not valid attribute names (e.g. "from") are returned as
+plain dicts by records. Array rows (e.g. candles) are returned as is by
+records and as a 2-D float array by numpy.
+
+Coinbase sends prices and sizes as strings. Fields listed in NUMERIC are
+converted to float for records and numpy; ids and everything else are left
+alone.
+
+VERSION: 0.0.1
+    - ADDED     : raw/records/numpy/frame conversions
+
+KNOWN ISSUES:
+    - Non encountered
+
+
+AUTHOR                      :   Mohammad Odeh
+DATE                        :   Oct. 18th, 2026 Year of Our Lord
+LAST CONTRIBUTION DATE      :   Oct. 18th, 2026 Year of Our Lord
+"""
+
+from    typing                      import  Any, Dict, FrozenSet, List      # Additional type hints
+from    typing                      import  Optional, Tuple, Union          # ...
+import  keyword                                                             # Reserved words
+import  numpy                       as      np                              # Structured arrays
+import  pandas                      as      pd                              # Dataframes to facilitate analysis
+
+from    CoinbaseMessages            import  Record                          # Dict-like __slots__ base
+
+RESULTS : Tuple[str, ...] = ( 'raw', 'records', 'numpy', 'frame' )
+
+NUMERIC : FrozenSet[str]  = frozenset( ( 'price', 'size', 'bid', 'ask', 'volume', 'amount',
+                                         'balance', 'available', 'hold', 'open', 'high', 'low',
+                                         'close', 'funds', 'fee', 'filled_size', 'executed_value',
+                                         'fill_fees', 'specified_funds', 'stop_price', 'usd_volume',
+                                         'maker_fee_rate', 'taker_fee_rate', 'base_min_size',
+                                         'base_max_size', 'quote_increment', 'base_increment',
+                                         'min_market_funds', 'max_market_funds', 'volume_30day' ) )
+
+_types  : Dict[Tuple[str, ...], type] = {}                                  # Field names -> record class
+
+
+def to_float( value: Any ) -> float:
+    """
+    :return: value as float, NaN if missing or not a number.
+    """
+    try:
+        return float( value )
+    except ( TypeError, ValueError ):
+        return float( 'nan' )
+
+
+def unwrap( data: Any ) -> Any:
+    """
+    :return: Payload of a v2 {"data": ...} envelope, or data itself.
+    """
+    if isinstance( data, dict ) and 'data' in data and ( 'pagination' in data or len( data ) == 1 ):
+        return data[ 'data' ]
+    return data
+
+
+def fields_of( rows: List[dict] ) -> Tuple[str, ...]:
+    """
+    :return: Union of the keys of all rows, in order of first appearance.
+    """
+    fields = dict.fromkeys( rows[0] )
+    for row in rows:
+        if row.keys() != fields.keys():
+            fields.update( dict.fromkeys( row ) )
+    return tuple( fields )
+
+
+def record_type( fields: Tuple[str, ...] ) -> Optional[type]:
+    """
+    :return: Record class with these fields (created once per field set),
+             None if they cannot all be attribute names.
+    """
+    if fields in _types:
+        return _types[ fields ]
+    cls = None
+    if all( f.isidentifier() and not keyword.iskeyword( f ) for f in fields ):
+        lines = [ f'    self.{f} = to_float( get({f!r}) )' if f in NUMERIC else f'    self.{f} = get({f!r})'
+                  for f in fields ]
+        source    = 'def __init__( self, row ):\n    get = row.get\n' + '\n'.join( lines or ['    pass'] )
+        namespace = { 'to_float': to_float }
+        exec( source, namespace )                                           # Unrolled, like namedtuple
+        cls = type( 'Row', ( Record, ), { '__slots__': fields, '__init__': namespace['__init__'] } )
+    _types[ fields ] = cls
+    return cls
+
+
+def to_records( data: Any ) -> Union[Record, List[Record]]:
+    """
+    :return: One record, or a list of them for a list response (the dicts
+             themselves if their keys cannot be attribute names).
+    """
+    data = unwrap( data )
+    if isinstance( data, dict ):
+        cls = record_type( tuple( data ) )
+        return data if cls is None else cls( data )
+    if not data or not isinstance( data[0], dict ):                        # Empty, or array rows
+        return data
+    cls = record_type( fields_of( data ) )
+    return data if cls is None else [ cls( row ) for row in data ]
+
+
+def to_numpy( data: Any ) -> np.ndarray:
+    """
+    :return: Structured array with one element per row.
+    """
+    data = unwrap( data )
+    rows = [ data ] if isinstance( data, dict ) else data
+    if not rows:
+        return np.empty( 0 )
+    if not isinstance( rows[0], dict ):                                     # Array rows, e.g. candles
+        return np.asarray( rows, dtype = 'f8' )
+    fields = fields_of( rows )
+    dtype  = [ ( f, 'f8' if f in NUMERIC else 'O' ) for f in fields ]
+    values = [ tuple( to_float( row.get(f) ) if f in NUMERIC else row.get( f ) for f in fields )
+               for row in rows ]
+    return np.array( values, dtype = dtype )
+
+
+def to_frame( data: Any ) -> pd.DataFrame:
+    """
+    :return: DataFrame, one row per element (a single row for an object).
+    """
+    data = unwrap( data )
+    if isinstance( data, list ):
+        return pd.DataFrame.from_dict( data )
+    return pd.DataFrame( data, index = [0] )
+
+
+CONVERTERS = { 'raw'    : lambda data: data,
+               'records': to_records,
+               'numpy'  : to_numpy,
+               'frame'  : to_frame }
+
+
+def convert( data: Any, result: str = 'frame' ) -> Any:
+    """
+    :param data: Parsed JSON response.
+    :param result: One of RESULTS.
+    """
+    converter = CONVERTERS.get( result )
+    if converter is None:
+        raise ValueError( f'Unknown result format "{result}", use one of {RESULTS}' )
+    return converter( data )
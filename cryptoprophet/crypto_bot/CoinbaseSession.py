@@ -0,0 +1,109 @@
+#@formatter:off
+"""
+Pooled keep-alive HTTP sessions for the REST clients.
+
+A bare requests.get() opens (and tears down) a TCP connection and a TLS
+session per call. Routing every call through one requests.Session reuses
+pooled connections, so a burst of calls pays for the handshakes once.
+
+    - Pool size         : connections kept open per host
+    - Keep-alive        : TCP keepalive probes on idle pooled sockets, so a
+                          connection silently dropped by a NAT or load
+                          balancer is detected instead of hanging a call
+    - Default timeout   : (connect, read) applied to every call that does not
+                          pass its own
+
+shared_session() returns one process-wide session that every client uses
+unless given its own. urllib3's pool is thread-safe, so threads can share it.
+
+VERSION: 0.0.1
+    - ADDED     : Pooled session with default timeouts, process-wide instance
+
+KNOWN ISSUES:
+    - Non encountered
+
+
+AUTHOR                      :   Mohammad Odeh
+DATE                        :   Oct. 18th, 2026 Year of Our Lord
+LAST CONTRIBUTION DATE      :   Oct. 18th, 2026 Year of Our Lord
+"""
+
+from    typing                      import  Optional, Tuple, Union          # Additional type hints
+from    requests.adapters           import  HTTPAdapter                     # Connection pool per host
+from    urllib3.connection          import  HTTPConnection                  # Default socket options
+import  threading                                                           # Guard the shared instance
+import  socket                                                              # TCP keepalive options
+import  requests                                                            # HTTP GET and POST for API interaction
+
+Timeout = Union[ float, Tuple[float, float] ]
+
+POOL_SIZE       : int       = 32                                            # Connections kept per host
+KEEP_ALIVE      : int       = 30                                            # Idle seconds before keepalive probes
+TIMEOUT         : Timeout   = ( 3.05, 10.0 )                                # (connect, read) [sec]
+
+
+class KeepAliveAdapter( HTTPAdapter ):
+    """
+    HTTPAdapter whose pooled sockets send TCP keepalive probes.
+    """
+    def __init__( self, keep_alive: Optional[int] = KEEP_ALIVE, **kwargs ) -> None:
+        """
+        :param keep_alive: Idle seconds before the first probe (None: OS default, off).
+        """
+        self.keep_alive = keep_alive
+        super().__init__( **kwargs )
+
+    def init_poolmanager( self, *args, **kwargs ) -> None:
+        if self.keep_alive:
+            options = HTTPConnection.default_socket_options + [ (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) ]
+            if hasattr( socket, 'TCP_KEEPIDLE' ):                           # Linux
+                options += [ (socket.IPPROTO_TCP, socket.TCP_KEEPIDLE , self.keep_alive),
+                             (socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, max(1, self.keep_alive // 3)),
+                             (socket.IPPROTO_TCP, socket.TCP_KEEPCNT  , 3) ]
+            kwargs[ 'socket_options' ] = options
+        super().init_poolmanager( *args, **kwargs )
+
+
+class PooledSession( requests.Session ):
+    """
+    requests.Session with a sized connection pool and a default timeout.
+    """
+    def __init__( self, pool_size: int = POOL_SIZE, keep_alive: Optional[int] = KEEP_ALIVE,
+                  timeout: Timeout = TIMEOUT ) -> None:
+        """
+        :param pool_size: Max. connections kept open per host (also the number
+                          of threads that can have a call in flight at once).
+        :param keep_alive: Idle seconds before TCP keepalive probes (None: off).
+        :param timeout: Default (connect, read) timeout [sec].
+        """
+        super().__init__()
+        self.timeout = timeout
+        adapter      = KeepAliveAdapter( keep_alive, pool_connections = 4, pool_maxsize = pool_size,
+                                         pool_block = False )
+        self.mount( 'https://', adapter )
+        self.mount( 'http://' , adapter )
+        self.headers.update( { 'Accept'    : 'application/json',
+                               'Connection': 'keep-alive' } )
+
+    def request( self, method, url, **kwargs ) -> requests.Response:
+        if kwargs.get( 'timeout' ) is None:
+            kwargs[ 'timeout' ] = self.timeout
+        return super().request( method, url, **kwargs )
+
+
+_shared : PooledSession = None
+_lock   = threading.Lock()
+
+def shared_session( **kwargs ) -> PooledSession:
+    """
+    Process-wide session used by the clients unless given their own.
+
+    :param kwargs: PooledSession arguments, only used by the first call.
+    :return: Shared PooledSession
+    """
+    global _shared
+    if _shared is None:
+        with _lock:
+            if _shared is None:
+                _shared = PooledSession( **kwargs )
+    return _shared
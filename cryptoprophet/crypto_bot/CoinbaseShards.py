@@ -0,0 +1,283 @@
+#@formatter:off
+"""
+Sharded multi-product ingestion.
+
+Product ids are partitioned across several websocket connections, and the
+connections are spread over a configurable number of worker processes.
+Each worker decodes its share of the feed and publishes normalized ticks
+into its own shared-memory channel, so that everything downstream can
+stay in the parent process without paying for the decoding.
+
+*** NOTE: Each channel is a TickStore.TickRing with a consumer tail, used
+          as a single-producer/single-consumer queue. The producer only
+          ever writes the head counter and the consumer only ever writes
+          the tail counter, so no locks are needed.
+
+VERSION: 0.0.1
+    - ADDED     : Product partitioning, worker processes, shared-memory tick channel
+
+KNOWN ISSUES:
+    - Non encountered
+
+
+AUTHOR                      :   Mohammad Odeh
+DATE                        :   Oct. 18th, 2026 Year of Our Lord
+LAST CONTRIBUTION DATE      :   Oct. 18th, 2026 Year of Our Lord
+"""
+
+from    typing                      import  Dict, List                      # Additional type hints
+from    time                        import  time, sleep                     # Get time
+import  multiprocessing                                                     # Worker processes
+import  asyncio                                                             # Asynchronous routines
+import  numpy                       as      np                              # Structured arrays
+import  orjson                                                              # Fast, efficient JSON parser
+
+from    CoinbaseAPI                 import  Websocket
+from    CoinbaseMessages            import  parse_time                      # ISO timestamp -> epoch
+from    TickStore                   import  TickRing                        # Shared-memory tick ring
+
+
+def partition( product_ids: List[str], n: int ) -> List[List[str]]:
+    """
+    Split product ids into n round-robin partitions.
+
+    :param product_ids: Products to split.
+    :param n: Number of partitions.
+    :return: Non-empty partitions.
+    """
+    return [ part for part in ( product_ids[i::n] for i in range(n) ) if part ]
+
+
+class TickChannel( TickRing ):
+    """
+    TickStore.TickRing of normalized ticks with a consumer tail, used as a
+    bounded queue: put() refuses ticks the consumer has not made room for.
+    """
+    COLUMNS = ( ('time'     , 'f8'),                                        # Exchange time [epoch sec]
+                ('recv'     , 'f8'),                                        # Receive time  [epoch sec]
+                ('price'    , 'f8'),
+                ('size'     , 'f8'),
+                ('sequence' , 'i8'),
+                ('product'  , 'i4'),                                        # Index into the product list
+                ('side'     , 'i1') )                                       # +1 buy, -1 sell
+    DTYPE   = np.dtype( list( COLUMNS ) )
+    HEADER  : int = 128                                                     # Head and tail on separate cache lines
+
+    def __init__( self, name: str = None, capacity: int = None ) -> None:
+        """
+        :param name: Shared memory name (None: a unique one, when creating).
+        :param capacity: Create the channel with room for this many ticks;
+                         attach to an existing channel if omitted.
+        """
+        super().__init__( name, capacity if capacity is None else capacity + 1 )
+        self._tail    = np.ndarray( (1,), np.uint64, buffer = self.shm.buf, offset = 64 )
+        self._columns = [ getattr( self, field ) for field, _ in self.COLUMNS ]
+        if self.owner:
+            self._tail[ 0 ] = 0
+
+    def __len__( self ) -> int:
+        return int( self._header[0] - self._tail[0] )
+
+    # ------------------------- ___START___: put --------------------------
+    def put( self, tick: tuple ) -> bool:
+        """
+        Publish a tick (producer side).
+
+        :param tick: Values in COLUMNS order.
+        :return: False if the channel is full.
+        """
+        head = int( self._header[0] )
+        if head - int( self._tail[0] ) >= self.capacity - 1:                # Never lap the consumer
+            return False
+        i = head % self.capacity
+        j = i + self.capacity
+        for column, value in zip( self._columns, tick ):                    # Write record first
+            column[ i ] = column[ j ] = value
+        self._header[ 0 ] = head + 1                                        # Then publish it
+        return True
+
+    # ------------------------- ___START___: get --------------------------
+    def get( self, max_n: int = None ) -> np.ndarray:
+        """
+        Take published ticks (consumer side).
+
+        :param max_n: Max. number of ticks to take.
+        :return: Copy of the ticks, oldest first, with DTYPE fields.
+        """
+        tail = int( self._tail[0] )
+        n    = int( self._header[0] ) - tail
+        if max_n is not None:
+            n = min( n, max_n )
+        s   = self._span( n, tail + n )                                     # Contiguous thanks to the mirror
+        out = np.empty( n, self.DTYPE )
+        for ( field, _ ), column in zip( self.COLUMNS, self._columns ):
+            out[ field ] = column[ s ]
+        self._tail[ 0 ] = tail + n                                          # Free the slots
+        return out
+
+    # ------------------------ ___START___: close -------------------------
+    def close( self ) -> None:
+        """
+        Detach from the channel; the creator also frees it.
+        """
+        del self._tail, self._columns                                       # Release buffer exports
+        super().close()
+
+
+def trade_type( channels: List[str] ) -> str:
+    """
+    Message type the trades are taken from: "match" if the matches channel
+    is subscribed (every trade; not last_match, stale on (re)connect),
+    otherwise "ticker". Never both, which would publish every trade twice.
+
+    :raises ValueError: If neither channel is subscribed.
+    """
+    if 'matches' in channels:
+        return 'match'
+    if 'ticker' in channels:
+        return 'ticker'
+    raise ValueError( f'Channels {channels} carry no trades, subscribe to "matches" or "ticker"' )
+
+
+def _worker( url: str, channel_name: str, connections: List[List[str]],
+             product_index: Dict[str, int], channels: List[str] ) -> None:
+    """
+    Worker process: consume a set of connections and publish normalized ticks.
+    """
+    channel = TickChannel( channel_name )                                   # Attach, see TickStore.attach_shared_memory
+
+    async def on_trade( msg ):
+        tick = ( parse_time( msg['time'] ) if 'time' in msg else 0.0,
+                 time(),
+                 float( msg['price'] ),
+                 float( msg.get('last_size') or msg.get('size') or 0.0 ),
+                 msg.get( 'sequence', -1 ),
+                 product_index[ msg['product_id'] ],
+                 1 if msg.get( 'side' ) == 'buy' else -1 )
+        while not channel.put( tick ):                                      # Backpressure: wait for the reader
+            await asyncio.sleep( 0.001 )
+
+    async def main():
+        sockets = []
+        for product_ids in connections:
+            ws = Websocket( url )
+            ws.register_handler( trade_type( channels ), on_trade )
+            sockets.append( ws.connect( orjson.dumps( { 'type'       : 'subscribe',
+                                                        'product_ids': product_ids,
+                                                        'channels'   : channels } ) ) )
+        await asyncio.gather( *sockets )
+
+    try:
+        asyncio.run( main() )
+    except KeyboardInterrupt:
+        pass
+    finally:
+        channel.close()
+
+
+class ShardedFeed( object ):
+    """
+    Ingest many products over several connections and worker processes.
+    """
+    PRODUCTS_PER_CONNECTION : int = 50                                      # Products per websocket connection
+
+    def __init__( self, product_ids: List[str], n_workers: int = 2,
+                  n_connections: int = None, channels: List[str] = None,
+                  url: str = None, capacity: int = 1 << 16 ) -> None:
+        """
+        :param product_ids: Products to subscribe to.
+        :param n_workers: Number of worker processes.
+        :param n_connections: Number of connections (default: one per PRODUCTS_PER_CONNECTION products).
+        :param channels: Channels to subscribe to (default: ticker); trades
+                         are taken from one of them, see trade_type().
+        :param url: Feed URL (default: Coinbase Exchange feed).
+        :param capacity: Ticks each worker channel can buffer.
+        """
+        if n_connections is None:
+            n_connections = -( -len(product_ids) // self.PRODUCTS_PER_CONNECTION )
+
+        self.product_ids    = list( product_ids )                           # Index -> product id
+        self.product_index  = { p: i for i, p in enumerate( self.product_ids ) }
+        self.connections    = partition( self.product_ids, n_connections )  # Products per connection
+        self.shards         = partition( self.connections, n_workers )      # Connections per worker
+        self.channels       = channels or [ 'ticker' ]
+        trade_type( self.channels )                                         # Fail here, not in the workers
+        self.url            = url or Websocket.API_URL
+        self.capacity       = capacity
+        self.queues         : List[TickChannel] = []
+        self.workers        : List[multiprocessing.Process] = []
+
+    # ------------------------ ___START___: start -------------------------
+    def start( self ) -> None:
+        """
+        Create the channels and launch the workers.
+        """
+        for shard in self.shards:
+            queue  = TickChannel( capacity = self.capacity )
+            worker = multiprocessing.Process( target = _worker,
+                                              args   = ( self.url, queue.name, shard,
+                                                         self.product_index, self.channels ),
+                                              daemon = True )
+            worker.start()
+            self.queues.append( queue )
+            self.workers.append( worker )
+
+    # ------------------------- ___START___: read -------------------------
+    def read( self, max_n: int = None ) -> np.ndarray:
+        """
+        Collect the ticks published by every worker since the last call.
+
+        :return: Structured array with TickChannel.DTYPE fields.
+        """
+        ticks = [ q.get( max_n ) for q in self.queues ]
+        return np.concatenate( ticks ) if ticks else np.empty( 0, TickChannel.DTYPE )
+
+    # ------------------------ ___START___: stream ------------------------
+    def stream( self, interval: float = 0.001 ):
+        """
+        Yield batches of ticks as they arrive.
+
+        :param interval: Sleep between empty polls [sec].
+        """
+        while True:
+            ticks = self.read()
+            if len( ticks ):
+                yield ticks
+            else:
+                sleep( interval )
+
+    # ------------------------- ___START___: stop -------------------------
+    def stop( self ) -> None:
+        """
+        Stop the workers and free the channels.
+        """
+        for worker in self.workers:
+            worker.terminate()
+        for worker in self.workers:
+            worker.join()
+        for queue in self.queues:
+            queue.close()
+        self.workers.clear()
+        self.queues.clear()
+
+    def __enter__( self ):
+        self.start()
+        return self
+
+    def __exit__( self, type, value, tb ):
+        self.stop()
+
+
+#%% ----------------- ___START___: Setup script and run -----------------
+
+if __name__ == '__main__':
+    products = [ 'BTC-USD', 'ETH-USD', 'LTC-USD', 'SOL-USD', 'ADA-USD', 'DOGE-USD' ]
+    with ShardedFeed( products, n_workers = 2, n_connections = 2 ) as feed:
+        try:
+            for batch in feed.stream():
+                for tick in batch:
+                    print( feed.product_ids[ tick['product'] ], tick['price'], tick['size'] )
+        except KeyboardInterrupt:
+            print( "Interrupt detected" )
+
+#   ----------------- ___ END ___: Setup script and run -----------------
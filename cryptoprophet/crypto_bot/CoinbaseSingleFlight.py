@@ -0,0 +1,137 @@
+#@formatter:off
+"""
+Single-flight coalescing of identical in-flight GET requests.
+
+When the scanner, the Telegram bot and the strategy ask for the same URL at
+the same moment, only the first caller (the leader) sends the request;
+callers arriving while it is in flight wait for it and get the same result,
+or the same exception. Nothing is kept once the call finished, so this is
+not a cache (see CoinbaseCache for that).
+
+Works for threads (do) and for coroutines (do_async). Keys are chosen by
+the caller and must include everything that makes responses differ, i.e.
+the URL and the API key it is signed with. One process-wide instance is
+shared by the clients unless they are given their own (see shared_flight).
+
+*** NOTE: Coalesced callers share the result object; do not mutate it.
+
+VERSION: 0.0.1
+    - ADDED     : Thread and asyncio single-flight, coalesced call counter
+
+KNOWN ISSUES:
+    - Non encountered
+
+
+AUTHOR                      :   Mohammad Odeh
+DATE                        :   Oct. 18th, 2026 Year of Our Lord
+LAST CONTRIBUTION DATE      :   Oct. 18th, 2026 Year of Our Lord
+"""
+
+from    typing                      import  Any, Awaitable, Callable, Dict  # Additional type hints
+from    typing                      import  Hashable                        # ...
+import  threading                                                           # Shared across threads
+import  asyncio                                                             # Asynchronous routines
+
+
+class _Call( object ):
+    """
+    One in-flight call of a thread leader.
+    """
+    __slots__ = ( 'done', 'result', 'error' )
+
+    def __init__( self ) -> None:
+        self.done   = threading.Event()
+        self.result = None
+        self.error  : BaseException = None
+
+
+class SingleFlight( object ):
+    """
+    Share one in-flight call between concurrent identical callers.
+    """
+    def __init__( self ) -> None:
+        self.counts = { 'calls': 0, 'coalesced': 0 }                        # Leaders, followers
+        self._calls : Dict[Hashable, _Call] = {}
+        self._tasks : Dict[tuple, asyncio.Future] = {}                      # (loop, key) -> leader's task
+        self._lock  = threading.Lock()
+
+    # -------------------------- ___START___: do --------------------------
+    def do( self, key: Hashable, fn: Callable[[], Any] ) -> Any:
+        """
+        Call fn(), unless a call with the same key is in flight; then wait
+        for that one instead.
+
+        :param key: Identity of the call.
+        :param fn: Performs the call (blocking).
+        :return: Result of fn() (raises its exception)
+        """
+        with self._lock:
+            call   = self._calls.get( key )
+            leader = call is None
+            if leader:
+                self.counts[ 'calls' ] += 1
+                call = self._calls[ key ] = _Call()
+            else:
+                self.counts[ 'coalesced' ] += 1
+        if not leader:                                                      # Wait for the leader
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as err:
+            call.error = err
+            raise
+        finally:
+            with self._lock:
+                del self._calls[ key ]
+            call.done.set()
+
+    # ----------------------- ___START___: do_async -----------------------
+    async def do_async( self, key: Hashable, fn: Callable[[], Awaitable[Any]] ) -> Any:
+        """
+        Await fn(), unless a call with the same key is in flight on this
+        event loop; then await that one instead. A cancelled caller does
+        not cancel the call for the others.
+
+        :param key: Identity of the call.
+        :param fn: Returns the coroutine performing the call.
+        :return: Result of the call (raises its exception)
+        """
+        key  = ( asyncio.get_running_loop(), key )
+        task = self._tasks.get( key )
+        if task is None:                                                    # Leader
+            task = self._tasks[ key ] = asyncio.ensure_future( fn() )
+            task.add_done_callback( lambda _: self._tasks.pop( key, None ) )
+            with self._lock:
+                self.counts[ 'calls' ] += 1
+        else:                                                               # Follower
+            with self._lock:
+                self.counts[ 'coalesced' ] += 1
+        return await asyncio.shield( task )
+
+    # ------------------------ ___START___: stats -------------------------
+    def stats( self ) -> Dict[str, int]:
+        """
+        :return: Calls sent, calls coalesced into them, calls in flight.
+        """
+        with self._lock:
+            return dict( self.counts, in_flight = len( self._calls ) + len( self._tasks ) )
+
+
+_shared : SingleFlight = None
+_lock   = threading.Lock()
+
+def shared_flight() -> SingleFlight:
+    """
+    Process-wide instance used by the clients unless given their own.
+    """
+    global _shared
+    if _shared is None:
+        with _lock:
+            if _shared is None:
+                _shared = SingleFlight()
+    return _shared
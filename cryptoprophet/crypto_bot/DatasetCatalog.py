@@ -0,0 +1,218 @@
+#@formatter:off
+"""
+Catalog of the series of an OHLCVStore with cross-symbol time alignment.
+
+Answers "Close/Volume of these 50 symbols between T0 and T1" with one 2-D
+(time x symbol) NumPy block per column, without joining frames per query.
+For every granularity the catalog keeps, next to the store:
+
+    <store>/_catalog/<granularity>/
+        > meta.json     : {"rows": n, "symbols": {symbol: indexed rows, ...}}
+        > index.f8      : union time index, the sorted unique Date of all symbols
+        > <symbol>.i8   : position of every row of the symbol in the union index
+
+The positions are sorted like the rows, so a query finds the union rows of
+[T0, T1) and, for each symbol, its rows in that range by binary search, then
+scatters the values straight into the block (O(log n + rows)).
+
+refresh() brings the catalog up to date with the store. Bars newer than the
+whole union index (the usual append) extend the files; bars that fall inside
+it (e.g. a backfilled symbol) rebuild them. Queries see the rows indexed by
+the last refresh.
+
+VERSION: 0.0.1
+    - ADDED     : Union time index, row positions, aligned block queries
+
+KNOWN ISSUES:
+    - Non encountered
+
+
+AUTHOR                      :   Mohammad Odeh
+DATE                        :   Oct. 18th, 2026 Year of Our Lord
+LAST CONTRIBUTION DATE      :   Oct. 18th, 2026 Year of Our Lord
+"""
+
+from    typing                      import  Dict, List, Sequence, Tuple     # Additional type hints
+from    os                          import  path, makedirs, replace         # Path manipulation
+import  orjson                                                              # Fast, efficient JSON parser
+import  numpy                       as      np                              # Index, blocks
+
+from    OHLCVStore                  import  OHLCVStore, Series, DTYPE, INDEX
+
+POSITION = np.dtype( '<i8' )
+
+
+class _Index( object ):
+    """
+    Union time index and row positions of one granularity.
+    """
+    def __init__( self, directory: str ) -> None:
+        self.path = directory
+        makedirs( directory, exist_ok = True )
+        self.load()
+
+    def _file( self, name: str ) -> str:
+        return path.join( self.path, name )
+
+    def load( self ) -> None:
+        meta = self._file( 'meta.json' )
+        if path.exists( meta ):
+            with open( meta, 'rb' ) as f:
+                meta = orjson.loads( f.read() )
+        else:
+            meta = { 'rows': 0, 'symbols': {} }
+        self.rows     : int = meta[ 'rows' ]
+        self.symbols  : Dict[str, int] = meta[ 'symbols' ]
+        self.times    = self._map( 'index.f8', DTYPE, self.rows )
+        self.position = { s: self._map( f'{s}.i8', POSITION, n ) for s, n in self.symbols.items() }
+
+    def _map( self, name: str, dtype: np.dtype, n: int ) -> np.ndarray:
+        if n == 0:                                                          # Zero-length files cannot be mapped
+            return np.empty( 0, dtype )
+        return np.memmap( self._file( name ), dtype, mode = 'r', shape = ( n, ) )
+
+    def write( self, name: str, values: np.ndarray, offset: int ) -> None:
+        """
+        Write values from item offset on; a whole file (offset 0) is
+        replaced, so mappings of the previous one stay valid.
+        """
+        file = self._file( name )
+        if offset == 0:
+            with open( file + '.tmp', 'wb' ) as f:
+                f.write( values.tobytes() )
+            replace( file + '.tmp', file )
+        else:
+            with open( file, 'r+b' ) as f:
+                f.seek( offset * values.itemsize )
+                f.write( values.tobytes() )
+                f.truncate()
+
+    def commit( self, rows: int, symbols: Dict[str, int] ) -> None:
+        with open( self._file( 'meta.json.tmp' ), 'wb' ) as f:
+            f.write( orjson.dumps( { 'rows': rows, 'symbols': symbols } ) )
+        replace( self._file( 'meta.json.tmp' ), self._file( 'meta.json' ) )
+        self.load()
+
+
+class DatasetCatalog( object ):
+    """
+    Aligned multi-symbol queries over an OHLCVStore.
+    """
+    def __init__( self, store: OHLCVStore ) -> None:
+        """
+        :param store: Store holding the series.
+        """
+        self.store   = store
+        self.counts  = { 'appends': 0, 'rebuilds': 0 }                      # Index updates by kind
+        self._index  : Dict[int, _Index] = {}
+        self._series : Dict[int, Dict[str, Series]] = {}
+
+    def _directory( self, granularity: int ) -> str:
+        return path.join( self.store.directory, '_catalog', str( granularity ) )
+
+    # ----------------------- ___START___: entries ------------------------
+    def entries( self ) -> List[dict]:
+        """
+        :return: Symbol, granularity, rows, first and last time of every stored series.
+        """
+        out = []
+        for symbol in self.store.symbols():
+            for granularity in self.store.granularities( symbol ):
+                series = self.store.series( symbol, granularity )
+                out.append( { 'symbol': symbol, 'granularity': granularity, 'rows': len( series ),
+                              'first': series.first, 'last': series.last } )
+        return out
+
+    def symbols( self, granularity: int ) -> List[str]:
+        """
+        :return: Symbols indexed at a granularity.
+        """
+        return sorted( self.index( granularity ).symbols )
+
+    # ----------------------- ___START___: refresh ------------------------
+    def refresh( self, granularity: int = None ) -> None:
+        """
+        Index the rows appended to the store since the last refresh.
+
+        :param granularity: Granularity [sec] to refresh (default: all stored ones).
+        """
+        if granularity is None:
+            for g in sorted( { e[ 'granularity' ] for e in self.entries() } ):
+                self.refresh( g )
+            return
+
+        index  = self._index.get( granularity ) or _Index( self._directory( granularity ) )
+        series = { s: self.store.series( s, granularity ) for s in self.store.symbols()
+                   if granularity in self.store.granularities( s ) }
+        new    = { s: se[ INDEX ][ index.symbols.get( s, 0 ): ] for s, se in series.items() }
+        times  = np.concatenate( list( new.values() ) + [ np.empty( 0, DTYPE ) ] )
+
+        if len( times ) and index.rows and times.min() > index.times[ -1 ]:   # Past the union: extend
+            extra = np.unique( times )
+            index.write( 'index.f8', extra, index.rows )
+            for s, t in new.items():
+                if len( t ):
+                    position = index.rows + np.searchsorted( extra, t ).astype( POSITION )
+                    index.write( f'{s}.i8', position, index.symbols.get( s, 0 ) )
+            index.commit( index.rows + len( extra ), { s: len( se ) for s, se in series.items() } )
+            self.counts[ 'appends' ] += 1
+        elif len( times ):                                                  # Inside the union: rebuild
+            union = np.unique( np.concatenate( [ se[ INDEX ] for se in series.values() ] ) )
+            index.write( 'index.f8', union, 0 )
+            for s, se in series.items():
+                index.write( f'{s}.i8', np.searchsorted( union, se[ INDEX ] ).astype( POSITION ), 0 )
+            index.commit( len( union ), { s: len( se ) for s, se in series.items() } )
+            self.counts[ 'rebuilds' ] += 1
+
+        self._index[ granularity ]  = index
+        self._series[ granularity ] = series
+
+    def index( self, granularity: int ) -> _Index:
+        """
+        :return: Index of a granularity, built on first use.
+        """
+        if granularity not in self._index:
+            self.refresh( granularity )
+        return self._index[ granularity ]
+
+    # ------------------------ ___START___: block -------------------------
+    def block( self, symbols: Sequence[str], granularity: int, start: float = None, end: float = None,
+               columns: Sequence[str] = ( 'Close', 'Volume' ),
+               ffill: bool = False ) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """
+        Values of several symbols on the union time index of [start, end).
+
+        :param symbols: Symbols, one block column each.
+        :param granularity: Bar length [sec].
+        :param start: First time [epoch sec] (default: first indexed bar).
+        :param end: End time [epoch sec], exclusive (default: past the last indexed bar).
+        :param columns: Columns to return.
+        :param ffill: Carry the last known value (also from before start) into gaps
+                      instead of leaving NaN.
+        :return: (times, column -> (time x symbol) block)
+        :raises KeyError: If a symbol is not indexed at this granularity.
+        """
+        index  = self.index( granularity )
+        u0     = 0          if start is None else int( np.searchsorted( index.times, start, 'left' ) )
+        u1     = index.rows if end   is None else int( np.searchsorted( index.times, end  , 'left' ) )
+        u1     = max( u0, u1 )
+        blocks = { c: np.full( ( len( symbols ), u1 - u0 ), np.nan ) for c in columns }   # Symbol rows are contiguous
+
+        for j, symbol in enumerate( symbols ):
+            position = index.position[ symbol ]
+            series   = self._series[ granularity ][ symbol ]
+            i0       = int( np.searchsorted( position, u0, 'left' ) )
+            i1       = int( np.searchsorted( position, u1, 'left' ) )
+            at       = position[ i0:i1 ] - u0
+            if ffill:                                                       # Latest row at or before each time
+                rows       = np.full( u1 - u0, i0 - 1 )
+                rows[ at ] = np.arange( i0, i1 )
+                np.maximum.accumulate( rows, out = rows )
+                at   = rows >= 0
+                for c in columns:
+                    blocks[ c ][ j, at ] = series[ c ][ rows[ at ] ]
+            else:
+                for c in columns:
+                    blocks[ c ][ j, at ] = series[ c ][ i0:i1 ]
+
+        return np.array( index.times[ u0:u1 ] ), { c: b.T for c, b in blocks.items() }
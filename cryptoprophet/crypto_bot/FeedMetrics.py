@@ -0,0 +1,168 @@
+#@formatter:off
+"""
+Feed lag and backpressure instrumentation for the websocket pipeline.
+
+Collected by CoinbaseAPI.Websocket while it consumes frames:
+    - Message counts and rates per message type
+    - Queue depth (current and high-water mark)
+    - Server-time-to-receive lag, from the "time" field of ticker messages
+    - Handler processing time histograms per message type
+    - Dropped message counts per reason
+
+Histograms use fixed logarithmic buckets, so recording a value is O(log b)
+in the (small) number of buckets and memory does not grow with traffic.
+
+VERSION: 0.0.1
+    - ADDED     : Counters, gauges and histograms
+
+KNOWN ISSUES:
+    - Lag includes any clock offset between the exchange and this machine
+
+
+AUTHOR                      :   Mohammad Odeh
+DATE                        :   Oct. 18th, 2026 Year of Our Lord
+LAST CONTRIBUTION DATE      :   Oct. 18th, 2026 Year of Our Lord
+"""
+
+from    typing                      import  Dict, List                      # Additional type hints
+from    collections                 import  defaultdict                     # Per type metrics
+from    bisect                      import  bisect_left                     # Bucket lookup
+from    time                        import  monotonic                       # Rate intervals
+
+from    CoinbaseMessages            import  parse_time                      # ISO timestamp -> epoch
+
+
+class Histogram( object ):
+    """
+    Histogram with logarithmically spaced bucket bounds.
+    """
+    __slots__ = ( 'bounds', 'counts', 'n', 'total', 'max' )
+
+    def __init__( self, lo: float = 1e-6, hi: float = 60.0, factor: float = 1.25 ) -> None:
+        """
+        :param lo: Upper bound of the first bucket.
+        :param hi: Values above this fall in the overflow bucket.
+        :param factor: Ratio between consecutive bucket bounds.
+        """
+        bounds = [ lo ]
+        while bounds[ -1 ] < hi:
+            bounds.append( bounds[-1] * factor )
+        self.bounds : List[float] = bounds
+        self.counts : List[int]   = [ 0 ] * ( len(bounds) + 1 )
+        self.n      = 0
+        self.total  = 0.0
+        self.max    = 0.0
+
+    def record( self, value: float ) -> None:
+        self.counts[ bisect_left( self.bounds, value ) ] += 1
+        self.n     += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def percentile( self, q: float ) -> float:
+        """
+        :param q: Percentile in [0, 100].
+        :return: Upper bound of the bucket holding the q-th percentile.
+        """
+        if not self.n:
+            return 0.0
+        rank, seen = q / 100.0 * self.n, 0
+        for i, count in enumerate( self.counts ):
+            seen += count
+            if seen >= rank and count:
+                return min( self.bounds[i], self.max ) if i < len( self.bounds ) else self.max
+        return self.max
+
+    def summary( self ) -> Dict[str, float]:
+        return { 'n'    : self.n,
+                 'mean' : self.total / self.n if self.n else 0.0,
+                 'p50'  : self.percentile( 50 ),
+                 'p90'  : self.percentile( 90 ),
+                 'p99'  : self.percentile( 99 ),
+                 'max'  : self.max }
+
+
+class FeedMetrics( object ):
+    """
+    Metrics of one websocket pipeline.
+    """
+    def __init__( self ) -> None:
+        self.counts     : Dict[str, int]        = defaultdict( int )        # Messages handled per type
+        self.dropped    : Dict[str, int]        = defaultdict( int )        # Reason -> count
+        self.handler    : Dict[str, Histogram]  = defaultdict( Histogram )  # Handler time per type [sec]
+        self.lag        = Histogram()                                       # Exchange -> receive [sec]
+        self.lag_min    = float( 'inf' )                                    # Negative means clock offset
+        self.depth      = 0                                                 # Queue depth at last receive
+        self.depth_max  = 0                                                 # High-water mark
+        self._last      : Dict[str, int] = {}                               # Counts at last rates() call
+        self._last_t    = monotonic()
+
+    # ----------------------- ___START___: receive ------------------------
+    def receive( self, depth: int ) -> None:
+        """
+        Sample the queue depth as a frame arrives.
+        """
+        self.depth = depth
+        if depth > self.depth_max:
+            self.depth_max = depth
+
+    # ----------------------- ___START___: observe ------------------------
+    def observe( self, msg_type: str, msg, t_recv: float, elapsed: float ) -> None:
+        """
+        Account for a handled message.
+
+        :param msg_type: Message type.
+        :param msg: Decoded message.
+        :param t_recv: Receive time [epoch sec].
+        :param elapsed: Time spent in its handlers [sec].
+        """
+        self.counts[ msg_type ] += 1
+        self.handler[ msg_type ].record( elapsed )
+        if msg_type == 'ticker':
+            timestamp = msg.get( 'time' )
+            if timestamp:
+                lag = t_recv - parse_time( timestamp )
+                if lag < self.lag_min:
+                    self.lag_min = lag
+                self.lag.record( max( lag, 0.0 ) )
+
+    # ------------------------ ___START___: rates -------------------------
+    def rates( self ) -> Dict[str, float]:
+        """
+        :return: Messages per second per type since the previous call.
+        """
+        now, elapsed = monotonic(), monotonic() - self._last_t
+        rates        = { k: (v - self._last.get(k, 0)) / elapsed for k, v in self.counts.items() }
+        self._last, self._last_t = dict( self.counts ), now
+        return rates
+
+    # ----------------------- ___START___: snapshot -----------------------
+    def snapshot( self ) -> dict:
+        """
+        :return: Every metric as plain Python types.
+        """
+        return { 'rates'    : self.rates(),
+                 'counts'   : dict( self.counts ),
+                 'queue'    : { 'depth': self.depth, 'depth_max': self.depth_max },
+                 'lag'      : dict( self.lag.summary(), min = self.lag_min if self.lag.n else 0.0 ),
+                 'handler'  : { k: h.summary() for k, h in self.handler.items() },
+                 'dropped'  : dict( self.dropped ) }
+
+    # ------------------------ ___START___: report ------------------------
+    def report( self, snap: dict = None ) -> str:
+        """
+        :param snap: Snapshot to format (default: take one now).
+        :return: Human readable summary (times in milliseconds).
+        """
+        snap  = snap or self.snapshot()
+        lines = [ f'queue depth {snap["queue"]["depth"]} (max {snap["queue"]["depth_max"]}), '
+                  f'dropped {snap["dropped"]}' ]
+        lag   = snap[ 'lag' ]
+        lines.append( f'lag ms: p50={1e3*lag["p50"]:.1f} p99={1e3*lag["p99"]:.1f} '
+                      f'max={1e3*lag["max"]:.1f} min={1e3*lag["min"]:.1f}' )
+        for msg_type, rate in sorted( snap['rates'].items() ):
+            h = snap[ 'handler' ][ msg_type ]
+            lines.append( f'{msg_type:<12} {rate:>9.1f} msg/s  handler ms: '
+                          f'p50={1e3*h["p50"]:.3f} p99={1e3*h["p99"]:.3f} max={1e3*h["max"]:.3f}' )
+        return '\n'.join( lines )
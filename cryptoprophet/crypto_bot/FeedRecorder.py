@@ -0,0 +1,239 @@
+#@formatter:off
+"""
+Raw market-data recorder and replayer.
+
+The recorder appends every raw websocket frame, together with its receive
+timestamp, to a compressed append-only log split into segments. Recording
+on the receive path only costs a struct pack and a buffer append; the
+buffer is compressed and written by a background thread (zlib releases the
+GIL while compressing) once it holds flush_bytes, or flush_interval seconds
+after the previous flush, so a quiet feed is on disk within about
+flush_interval too.
+
+On-disk format:
+    - Segments are plain gzip files named <prefix>-<YYYYmmddTHHMMSS>-<n>.log.gz
+      and are rotated once they hold segment_bytes of uncompressed data.
+    - Each record is a little-endian header (float64 receive time,
+      uint32 frame length) followed by the frame bytes.
+
+A truncated last segment (e.g. after a crash) is read up to the last
+complete record.
+
+VERSION: 0.0.1
+    - ADDED     : Segment-rotated recorder, replayer
+
+KNOWN ISSUES:
+    - Non encountered
+
+
+AUTHOR                      :   Mohammad Odeh
+DATE                        :   Oct. 18th, 2026 Year of Our Lord
+LAST CONTRIBUTION DATE      :   Oct. 18th, 2026 Year of Our Lord
+"""
+
+from    typing                      import  Iterator, List, Tuple, Union    # Additional type hints
+from    datetime                    import  datetime, timezone              # Segment names
+from    glob                        import  glob                            # Find segments
+from    os                          import  path, makedirs                  # Path manipulation
+from    time                        import  time                            # Flush deadlines
+import  threading                                                           # Background writer
+import  queue                                                               # Hand buffers to the writer
+import  struct                                                              # Record headers
+import  gzip                                                                # Segment compression
+import  zlib                                                                # Streaming decompression
+
+HEADER  = struct.Struct( '<dI' )                                            # (receive time, frame length)
+Record  = Tuple[ float, bytes ]
+
+
+class FeedRecorder( object ):
+    """
+    Append raw frames to a compressed, segment-rotated log.
+    """
+    def __init__( self, directory: str, prefix: str = 'feed',
+                  segment_bytes: int = 256 << 20, flush_bytes: int = 1 << 20,
+                  flush_interval: float = 1.0, compresslevel: int = 1 ) -> None:
+        """
+        :param directory: Directory holding the segments.
+        :param prefix: Segment file name prefix.
+        :param segment_bytes: Rotate after this much uncompressed data.
+        :param flush_bytes: Hand the buffer to the writer once this large.
+        :param flush_interval: ... or once this old [sec].
+        :param compresslevel: gzip level (1 is fastest).
+        """
+        if path.exists( directory ) is False:                               # If directory does NOT exist
+            makedirs( directory )                                           #   Create directory
+
+        self.directory      = directory
+        self.prefix         = prefix
+        self.segment_bytes  = segment_bytes
+        self.flush_bytes    = flush_bytes
+        self.flush_interval = flush_interval
+        self.compresslevel  = compresslevel
+        self.buffer         = bytearray()                                   # Pending records
+        self._due           = time() + flush_interval                       # Next time-based flush [epoch sec]
+        self._lock          = threading.Lock()                              # Guards buffer, see _write_loop
+        self.n_records      = 0
+        self.n_segments     = 0
+        self._file          : gzip.GzipFile = None                          # Current segment
+        self._written       = 0                                             # Uncompressed bytes in current segment
+        self._queue         = queue.Queue()                                 # Buffers waiting to be written
+        self._writer        = threading.Thread( target = self._write_loop, daemon = True )
+        self._writer.start()
+
+    # ------------------------ ___START___: write -------------------------
+    def write( self, t: float, frame: Union[bytes, str] ) -> None:
+        """
+        Record a frame.
+
+        :param t: Receive time [epoch sec].
+        :param frame: Raw frame as received.
+        """
+        if isinstance( frame, str ):
+            frame = frame.encode()
+        with self._lock:
+            buffer = self.buffer
+            buffer += HEADER.pack( t, len(frame) )
+            buffer += frame
+            self.n_records += 1
+        if len( buffer ) >= self.flush_bytes or t >= self._due:
+            self.flush()
+
+    # ------------------------ ___START___: flush -------------------------
+    def flush( self ) -> None:
+        """
+        Hand the pending records over to the writer thread.
+        """
+        with self._lock:
+            if self.buffer:
+                self._queue.put( self.buffer )
+                self.buffer = bytearray()
+            self._due = time() + self.flush_interval
+
+    # ---------------------- ___START___: _write_loop ---------------------
+    def _write_loop( self ) -> None:
+        """
+        Writer thread: compress buffers into segments, rotating as needed.
+        Also flushes records of a feed gone quiet, hence the lock in write().
+        """
+        while True:
+            try:
+                chunk = self._queue.get( timeout = self.flush_interval )
+            except queue.Empty:                                             # No write() is due to flush
+                if time() >= self._due:
+                    self.flush()
+                continue
+            if chunk is None:                                               # Closing
+                break
+            if self._file is None or self._written >= self.segment_bytes:
+                self._rotate()
+            self._file.write( chunk )
+            self._written += len( chunk )
+            if self._queue.empty():                                         # Caught up, push it to disk
+                self._file.flush()
+        if self._file is not None:
+            self._file.close()
+
+    # ------------------------ ___START___: _rotate -----------------------
+    def _rotate( self ) -> None:
+        """
+        Close the current segment and open the next one.
+        """
+        if self._file is not None:
+            self._file.close()
+        name = f'{self.prefix}-{datetime.now( timezone.utc ):%Y%m%dT%H%M%S}-{self.n_segments:06d}.log.gz'
+        self._file        = gzip.open( path.join( self.directory, name ), 'wb',
+                                       compresslevel = self.compresslevel )
+        self._written     = 0
+        self.n_segments  += 1
+
+    # ------------------------ ___START___: close -------------------------
+    def close( self ) -> None:
+        """
+        Write everything that is pending and close the log.
+        """
+        self.flush()
+        self._queue.put( None )
+        self._writer.join()
+
+    def __enter__( self ):
+        return self
+
+    def __exit__( self, type, value, tb ):
+        self.close()
+
+
+class FeedReplayer( object ):
+    """
+    Read frames back from a recorder log, oldest first.
+    """
+    CHUNK : int = 1 << 20                                                   # Compressed bytes read at a time
+
+    def __init__( self, directory: str, prefix: str = 'feed' ) -> None:
+        """
+        :param directory: Directory holding the segments.
+        :param prefix: Segment file name prefix.
+        """
+        self.segments : List[str] = sorted( glob( path.join( directory, f'{prefix}-*.log.gz' ) ) )
+
+    # ----------------------- ___START___: _records -----------------------
+    def _records( self, segment: str ) -> Iterator[Record]:
+        """
+        Yield the records of one segment, stopping at a truncated tail.
+        """
+        decompressor = zlib.decompressobj( wbits = 31 )                     # gzip container
+        data, pos    = b'', 0
+        with open( segment, 'rb' ) as f:
+            while True:
+                chunk = f.read( self.CHUNK )
+                if not chunk:
+                    break
+                try:
+                    data = data[ pos: ] + decompressor.decompress( chunk )
+                except zlib.error:                                          # Corrupt tail
+                    break
+                pos = 0
+                while pos + HEADER.size <= len( data ):
+                    t, n = HEADER.unpack_from( data, pos )
+                    end  = pos + HEADER.size + n
+                    if end > len( data ):                                   # Record continues in next chunk
+                        break
+                    yield t, data[ pos + HEADER.size:end ]
+                    pos = end
+
+    def __iter__( self ) -> Iterator[Record]:
+        for segment in self.segments:
+            yield from self._records( segment )
+
+
+#%% ----------------- ___START___: Setup script and run -----------------
+
+if __name__ == '__main__':
+    import  asyncio
+    import  orjson
+    import  sys
+    from    CoinbaseAPI             import  Websocket
+
+    # Record:   python FeedRecorder.py record <directory>
+    # Replay:   python FeedRecorder.py replay <directory> [speed]
+    mode, directory = sys.argv[ 1 ], sys.argv[ 2 ]
+
+    async def print_msg( msg ):
+        print( msg )
+
+    if mode == 'record':
+        with FeedRecorder( directory ) as recorder:
+            ws  = Websocket( recorder = recorder )
+            req = { "type": "subscribe", "product_ids": ["BTC-USD", "ETH-USD"],
+                    "channels": ["ticker", "level2_batch", "matches"] }
+            try:
+                asyncio.run( ws.connect( orjson.dumps(req) ) )
+            except KeyboardInterrupt:
+                print( "Interrupt detected" )
+    else:
+        speed = float( sys.argv[3] ) if len( sys.argv ) > 3 else None
+        ws    = Websocket()
+        ws.register_handler( '*', print_msg )
+        asyncio.run( ws.replay( FeedReplayer( directory ), speed = speed ) )
+
+#   ----------------- ___ END ___: Setup script and run -----------------
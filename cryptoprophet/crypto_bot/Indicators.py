@@ -0,0 +1,416 @@
+#@formatter:off
+"""
+Streaming technical indicators, O(1) per bar.
+
+pandas-ta recomputes an indicator over the whole DataFrame for every new bar.
+The indicators here keep just enough state to fold in one closed bar at a
+time, and reproduce the pandas-ta (0.3.14b) definitions, defaults, column
+names and NaN warm-up:
+
+    > SMA( 10 )             : rolling mean
+    > EMA( 10 )             : SMA seeded, then alpha = 2 / (length + 1)
+    > RSI( 14 )             : Wilder (RMA) averages of gains and losses
+    > MACD( 12, 26, 9 )     : MACD, histogram, signal
+    > ATR( 14 )             : RMA of the true range
+    > BBands( 5, 2 )        : lower, mid, upper, bandwidth, percent
+    > VWAP( 'D' )           : typical price VWAP, reset every anchor period
+
+Bars use the CandleAggregator layout (Date, High, Low, Open, Close, Volume).
+Indicators are seeded from history by calling update() on the old bars
+(seed()), then kept current with update(bar). IndicatorEngine holds the
+indicators of many product x granularity pairs and follows a
+CandleAggregator's closed bars.
+
+*** NOTE: RMA follows pandas' ewm(adjust=True) like pandas-ta, so early
+          values differ slightly from a plain recursive Wilder average.
+
+VERSION: 0.0.1
+    - ADDED     : SMA, EMA, RSI, MACD, ATR, BBands, VWAP, IndicatorEngine
+
+KNOWN ISSUES:
+    - Non encountered
+
+
+AUTHOR                      :   Mohammad Odeh
+DATE                        :   Oct. 18th, 2026 Year of Our Lord
+LAST CONTRIBUTION DATE      :   Oct. 18th, 2026 Year of Our Lord
+"""
+
+from    typing                      import  Callable, Dict, List, Sequence  # Additional type hints
+from    typing                      import  Tuple, Union                    # ...
+from    math                        import  sqrt, nan                       # Scalar math
+import  numpy                       as      np                              # History
+
+from    CandleAggregator            import  CandleAggregator, Bar           # Live bars
+from    CandleAggregator            import  DATE, HIGH, LOW, CLOSE, VOLUME  # Column indices
+from    CandlePyramid               import  bucket, WEEK, MONTH             # VWAP anchor periods
+
+Value   = Union[ float, Tuple[float, ...] ]
+
+ANCHORS : Dict[str, int] = { 'H': 3600, 'D': 86400, 'W': WEEK, 'M': MONTH } # VWAP anchor -> period
+
+
+class Indicator( object ):
+    """
+    Stateful indicator fed one closed bar at a time.
+    """
+    __slots__ = ( 'names', 'value' )
+
+    def update( self, bar: Bar ) -> Value:
+        """
+        :param bar: Closed bar in CandleAggregator.COLUMNS order.
+        :return: Value after the bar, NaN while warming up
+        """
+        raise NotImplementedError
+
+    def seed( self, bars: np.ndarray ) -> Value:
+        """
+        Feed history, oldest first.
+
+        :param bars: (n, 6) array in CandleAggregator.COLUMNS order.
+        :return: Value after the last bar
+        """
+        for bar in np.asarray( bars ).tolist():
+            self.update( bar )
+        return self.value
+
+
+class _Window( object ):
+    """
+    Sum and sum of squares of the last n values (n >= 1). Sums are
+    re-added every n updates, around a recent value, so rounding neither
+    accumulates nor cancels on large prices.
+    """
+    __slots__ = ( 'n', 'values', 'i', 'count', 'shift', 's1', 's2' )
+
+    def __init__( self, n: int ) -> None:
+        self.n      = n
+        self.values = [ 0.0 ] * n
+        self.i      = 0                                                     # Oldest slot
+        self.count  = 0
+        self.shift  = None
+        self.s1     = 0.0
+        self.s2     = 0.0
+
+    def push( self, x: float ) -> bool:
+        """
+        :return: True once the window is full
+        """
+        if self.shift is None:
+            self.shift = x
+        old = self.values[ self.i ] - self.shift
+        self.values[ self.i ] = x
+        self.i = ( self.i + 1 ) % self.n
+        self.count += 1
+        d = x - self.shift
+        if self.count > self.n:
+            self.s1 += d - old
+            self.s2 += d * d - old * old
+        else:
+            self.s1 += d
+            self.s2 += d * d
+        if self.i == 0 and self.count >= self.n:                            # Re-add the sums
+            self.shift = x
+            self.s1    = sum( v - x for v in self.values )
+            self.s2    = sum( ( v - x )**2 for v in self.values )
+        return self.count >= self.n
+
+    def mean( self ) -> float:
+        return self.shift + self.s1 / self.n
+
+    def var( self, ddof: int = 0 ) -> float:
+        return max( self.s2 - self.s1 * self.s1 / self.n, 0.0 ) / ( self.n - ddof )
+
+
+class _RMA( object ):
+    """
+    pandas ewm( alpha = 1 / length, min_periods = length, adjust = True ).mean(), as pandas-ta's rma().
+    """
+    __slots__ = ( 'length', 'decay', 'num', 'den', 'count' )
+
+    def __init__( self, length: int ) -> None:
+        self.length = length
+        self.decay  = 1.0 - 1.0 / length
+        self.num    = 0.0
+        self.den    = 0.0
+        self.count  = 0
+
+    def push( self, x: float ) -> float:
+        self.num    = x + self.decay * self.num
+        self.den    = 1.0 + self.decay * self.den
+        self.count += 1
+        return self.num / self.den if self.count >= self.length else nan
+
+
+class _EMA( object ):
+    """
+    pandas-ta ema(): mean of the first length values, then alpha = 2 / (length + 1).
+    """
+    __slots__ = ( 'length', 'alpha', 'value', 'count' )
+
+    def __init__( self, length: int ) -> None:
+        self.length = length
+        self.alpha  = 2.0 / ( length + 1 )
+        self.value  = 0.0
+        self.count  = 0
+
+    def push( self, x: float ) -> float:
+        self.count += 1
+        if self.count < self.length:                                        # Sum the seed
+            self.value += x
+            return nan
+        if self.count == self.length:
+            self.value = ( self.value + x ) / self.length
+        else:
+            self.value += self.alpha * ( x - self.value )
+        return self.value
+
+
+# ------------------------- ___START___: SMA --------------------------
+class SMA( Indicator ):
+    """
+    Simple moving average of Close.
+    """
+    __slots__ = ( 'window', )
+
+    def __init__( self, length: int = 10 ) -> None:
+        self.names  = ( f'SMA_{length}', )
+        self.window = _Window( length )
+        self.value  = nan
+
+    def update( self, bar: Bar ) -> float:
+        self.value = self.window.mean() if self.window.push( bar[ CLOSE ] ) else nan
+        return self.value
+
+
+# ------------------------- ___START___: EMA --------------------------
+class EMA( Indicator ):
+    """
+    Exponential moving average of Close.
+    """
+    __slots__ = ( 'ema', )
+
+    def __init__( self, length: int = 10 ) -> None:
+        self.names  = ( f'EMA_{length}', )
+        self.ema    = _EMA( length )
+        self.value  = nan
+
+    def update( self, bar: Bar ) -> float:
+        self.value = self.ema.push( bar[ CLOSE ] )
+        return self.value
+
+
+# ------------------------- ___START___: RSI --------------------------
+class RSI( Indicator ):
+    """
+    Relative strength index of Close [0, 100].
+    """
+    __slots__ = ( 'gain', 'loss', 'prev' )
+
+    def __init__( self, length: int = 14 ) -> None:
+        self.names  = ( f'RSI_{length}', )
+        self.gain   = _RMA( length )
+        self.loss   = _RMA( length )
+        self.prev   = None
+        self.value  = nan
+
+    def update( self, bar: Bar ) -> float:
+        close = bar[ CLOSE ]
+        if self.prev is not None:                                           # First bar has no change
+            change = close - self.prev
+            gain   = self.gain.push(  change if change > 0 else 0.0 )
+            loss   = self.loss.push( -change if change < 0 else 0.0 )
+            total  = gain + loss
+            self.value = 100.0 * gain / total if total else nan
+        self.prev = close
+        return self.value
+
+
+# ------------------------- ___START___: MACD -------------------------
+class MACD( Indicator ):
+    """
+    MACD line, histogram and signal line of Close.
+    """
+    __slots__ = ( 'fast', 'slow', 'signal' )
+
+    def __init__( self, fast: int = 12, slow: int = 26, signal: int = 9 ) -> None:
+        if slow < fast:
+            fast, slow = slow, fast
+        suffix      = f'{fast}_{slow}_{signal}'
+        self.names  = ( f'MACD_{suffix}', f'MACDh_{suffix}', f'MACDs_{suffix}' )
+        self.fast   = _EMA( fast )
+        self.slow   = _EMA( slow )
+        self.signal = _EMA( signal )
+        self.value  = ( nan, nan, nan )
+
+    def update( self, bar: Bar ) -> Tuple[float, float, float]:
+        fast = self.fast.push( bar[ CLOSE ] )
+        slow = self.slow.push( bar[ CLOSE ] )
+        if slow == slow:                                                    # Signal starts with the first MACD
+            macd       = fast - slow
+            signal     = self.signal.push( macd )
+            self.value = ( macd, macd - signal, signal )
+        return self.value
+
+
+# ------------------------- ___START___: ATR --------------------------
+class ATR( Indicator ):
+    """
+    Average true range (Wilder/RMA).
+    """
+    __slots__ = ( 'rma', 'prev' )
+
+    def __init__( self, length: int = 14 ) -> None:
+        self.names  = ( f'ATRr_{length}', )
+        self.rma    = _RMA( length )
+        self.prev   = None
+        self.value  = nan
+
+    def update( self, bar: Bar ) -> float:
+        high, low, close = bar[ HIGH ], bar[ LOW ], bar[ CLOSE ]
+        if self.prev is not None:                                           # First bar has no true range
+            self.value = self.rma.push( max( high - low, abs( high - self.prev ), abs( self.prev - low ) ) )
+        self.prev = close
+        return self.value
+
+
+# ------------------------ ___START___: BBands ------------------------
+class BBands( Indicator ):
+    """
+    Bollinger bands of Close: lower, mid, upper, bandwidth [%] and %B.
+    """
+    __slots__ = ( 'window', 'std', 'ddof' )
+
+    def __init__( self, length: int = 5, std: float = 2.0, ddof: int = 0 ) -> None:
+        suffix      = f'{length}_{float(std)}'
+        self.names  = tuple( f'BB{c}_{suffix}' for c in 'LMUBP' )
+        self.window = _Window( length )
+        self.std    = std
+        self.ddof   = ddof if 0 <= ddof < length else 1
+        self.value  = ( nan, ) * 5
+
+    def update( self, bar: Bar ) -> Tuple[float, ...]:
+        close = bar[ CLOSE ]
+        if self.window.push( close ):
+            mid   = self.window.mean()
+            width = self.std * sqrt( self.window.var( self.ddof ) )
+            lower, upper = mid - width, mid + width
+            self.value = ( lower, mid, upper,
+                           100.0 * ( upper - lower ) / mid if mid else nan,
+                           ( close - lower ) / ( upper - lower ) if upper != lower else nan )
+        return self.value
+
+
+# ------------------------- ___START___: VWAP -------------------------
+class VWAP( Indicator ):
+    """
+    Volume weighted average of the typical price (H + L + C) / 3 since the
+    start of the anchor period (hour, day, week or month, UTC).
+    """
+    __slots__ = ( 'period', 'end', 'pv', 'volume' )
+
+    def __init__( self, anchor: str = 'D' ) -> None:
+        self.names  = ( f'VWAP_{anchor}', )
+        self.period = ANCHORS[ anchor ]
+        self.end    = -np.inf                                               # End of the current period
+        self.pv     = 0.0
+        self.volume = 0.0
+        self.value  = nan
+
+    def update( self, bar: Bar ) -> float:
+        if bar[ DATE ] >= self.end:                                         # New period
+            start    = float( bucket( np.array( [ bar[ DATE ] ] ), self.period )[ 0 ] )
+            self.end = float( bucket( np.array( [ start + 32 * 86400 ] ), MONTH )[ 0 ] ) \
+                       if self.period == MONTH else start + self.period
+            self.pv, self.volume = 0.0, 0.0
+        volume       = bar[ VOLUME ]
+        self.pv     += ( bar[ HIGH ] + bar[ LOW ] + bar[ CLOSE ] ) / 3.0 * volume
+        self.volume += volume
+        self.value   = self.pv / self.volume if self.volume else nan
+        return self.value
+
+
+DEFAULT : Tuple[Callable[[], Indicator], ...] = ( SMA, EMA, RSI, MACD, ATR, BBands, VWAP )
+Listener = Callable[ [str, str, Dict[str, float]], None ]                   # (product_id, granularity, values)
+
+
+class IndicatorEngine( object ):
+    """
+    Indicators of many product x granularity pairs, fed by closed bars.
+    """
+    def __init__( self, indicators: Sequence[Callable[[], Indicator]] = DEFAULT ) -> None:
+        """
+        :param indicators: Factories creating the indicator set of each pair,
+                           e.g. ( partial( SMA, 50 ), RSI ).
+        """
+        self.factories   = list( indicators )
+        self.indicators  : Dict[Tuple[str, str], List[Indicator]] = {}
+        self.subscribers : List[Listener] = []
+        self.history     : Callable[[str, str], np.ndarray] = None
+
+    def _pair( self, product_id: str, granularity: str ) -> List[Indicator]:
+        key = ( product_id, granularity )
+        if key not in self.indicators:
+            self.indicators[ key ] = [ factory() for factory in self.factories ]
+        return self.indicators[ key ]
+
+    # ------------------------- ___START___: seed -------------------------
+    def seed( self, product_id: str, granularity: str, bars: np.ndarray ) -> Dict[str, float]:
+        """
+        (Re)start the indicators of a pair from history.
+
+        :param bars: (n, 6) array in CandleAggregator.COLUMNS order, oldest first.
+        :return: Indicator values after the last bar
+        """
+        self.indicators.pop( ( product_id, granularity ), None )
+        for indicator in self._pair( product_id, granularity ):
+            indicator.seed( bars )
+        return self.values( product_id, granularity )
+
+    # ------------------------ ___START___: on_bar ------------------------
+    def on_bar( self, product_id: str, granularity: str, bar: Bar ) -> Dict[str, float]:
+        """
+        Fold a closed bar into the indicators of its pair. The first bar of
+        a pair seeds it from self.history( product_id, granularity ) when
+        set (see attach); the history must end with that bar.
+
+        :return: Indicator values
+        """
+        if ( product_id, granularity ) not in self.indicators and self.history is not None:
+            values = self.seed( product_id, granularity, self.history( product_id, granularity ) )
+        else:
+            for indicator in self._pair( product_id, granularity ):
+                indicator.update( bar )
+            values = self.values( product_id, granularity )
+        for callback in self.subscribers:
+            callback( product_id, granularity, values )
+        return values
+
+    # ----------------------- ___START___: attach -------------------------
+    def attach( self, aggregator: CandleAggregator ) -> None:
+        """
+        Follow the closed bars of an aggregator, seeding each pair from the
+        bars the aggregator kept.
+        """
+        self.history = aggregator.bars
+        aggregator.subscribe( self.on_bar )
+
+    def subscribe( self, callback: Listener ) -> None:
+        """
+        Call callback( product_id, granularity, values ) after every bar.
+        """
+        self.subscribers.append( callback )
+
+    # ------------------------ ___START___: values ------------------------
+    def values( self, product_id: str, granularity: str ) -> Dict[str, float]:
+        """
+        :return: Column name (pandas-ta style) -> latest value
+        """
+        out = {}
+        for indicator in self.indicators.get( ( product_id, granularity ), () ):
+            value = indicator.value
+            if len( indicator.names ) == 1:
+                out[ indicator.names[ 0 ] ] = value
+            else:
+                out.update( zip( indicator.names, value ) )
+        return out
@@ -0,0 +1,253 @@
+#@formatter:off
+"""
+Memory-mapped, append-only columnar OHLCV store.
+
+Historical bars are kept as one raw float64 file per column, per symbol and
+granularity, next to a small JSON header:
+
+    <directory>/<symbol>/<granularity>/
+        > meta.json     : {"columns": [...], "rows": n}
+        > <column>.f8   : n little-endian float64 values, Date first
+
+Opening a series maps the files (np.memmap) without reading them, so it
+takes about the same time for ten years of 1-minute bars as for a week, and
+pages only become resident once they are touched. The Date column (epoch
+seconds) is kept sorted and unique; it is the time index, so a time range
+is found with two binary searches (O(log n), touching O(log n) pages) and
+returned as zero-copy views.
+
+Appends only ever add rows newer than the last one. Values are written
+past the committed rows first and meta.json is replaced (atomically)
+afterwards, so a crash mid-append leaves the previous rows intact and
+readers never see a partial row.
+
+Data gets in by:
+    > OHLCVStore.import_csv     : conversion of CSV files such as data/sample.csv
+    > CandleDownloader          : exchange history, written straight into a store
+    > Series.append             : e.g. CandleAggregator.bars, (n, 6) rows
+
+VERSION: 0.0.1
+    - ADDED     : Memmapped column files, sorted time index, append-only writes
+
+KNOWN ISSUES:
+    - Non encountered
+
+
+AUTHOR                      :   Mohammad Odeh
+DATE                        :   Oct. 18th, 2026 Year of Our Lord
+LAST CONTRIBUTION DATE      :   Oct. 18th, 2026 Year of Our Lord
+"""
+
+from    typing                      import  Dict, List, Sequence, Tuple     # Additional type hints
+from    typing                      import  Union                           # ...
+from    os                          import  path, makedirs, replace, listdir# Path manipulation
+import  orjson                                                              # Fast, efficient JSON parser
+import  numpy                       as      np                              # Columns
+import  pandas                      as      pd                              # CSV conversion, frames
+
+from    CandleAggregator            import  COLUMNS                         # Bar layout
+
+DTYPE   = np.dtype( '<f8' )
+INDEX   : str = COLUMNS[ 0 ]                                                # Time index column ("Date")
+
+Columns = Dict[ str, np.ndarray ]
+
+
+class Series( object ):
+    """
+    Bars of one symbol at one granularity.
+    """
+    def __init__( self, directory: str, columns: Sequence[str] = None ) -> None:
+        """
+        :param directory: Directory of the series.
+        :param columns: Create the series with these columns (Date first);
+                        open the existing one if omitted.
+        """
+        self.path = directory
+        if columns is not None and not path.exists( self._file( 'meta.json' ) ):
+            if not columns or columns[ 0 ] != INDEX:
+                raise ValueError( f'The first column must be "{INDEX}", got {list(columns)}' )
+            makedirs( directory, exist_ok = True )
+            for name in columns:
+                open( self._file( f'{name}.f8' ), 'ab' ).close()
+            self._commit( list( columns ), 0 )
+        self.refresh()
+
+    def _file( self, name: str ) -> str:
+        return path.join( self.path, name )
+
+    def _commit( self, columns: List[str], rows: int ) -> None:
+        tmp = self._file( 'meta.json.tmp' )
+        with open( tmp, 'wb' ) as f:
+            f.write( orjson.dumps( { 'columns': columns, 'rows': rows } ) )
+        replace( tmp, self._file( 'meta.json' ) )
+
+    # ----------------------- ___START___: refresh ------------------------
+    def refresh( self ) -> int:
+        """
+        (Re)map the committed rows, e.g. to see rows appended by another process.
+
+        :return: Number of rows
+        """
+        with open( self._file( 'meta.json' ), 'rb' ) as f:
+            meta = orjson.loads( f.read() )
+        self.columns : Tuple[str, ...] = tuple( meta[ 'columns' ] )
+        self.rows    : int = meta[ 'rows' ]
+        self._data   : Columns = { name: self._map( name ) for name in self.columns }
+        return self.rows
+
+    def _map( self, name: str ) -> np.ndarray:
+        if self.rows == 0:                                                  # Zero-length files cannot be mapped
+            return np.empty( 0, DTYPE )
+        return np.memmap( self._file( f'{name}.f8' ), DTYPE, mode = 'r', shape = ( self.rows, ) )
+
+    def __len__( self ) -> int:
+        return self.rows
+
+    def __getitem__( self, column: str ) -> np.ndarray:
+        """
+        :return: Read-only view of a whole column.
+        """
+        return self._data[ column ]
+
+    @property
+    def first( self ) -> float:
+        return float( self._data[ INDEX ][ 0 ] ) if self.rows else float( 'nan' )
+
+    @property
+    def last( self ) -> float:
+        return float( self._data[ INDEX ][ -1 ] ) if self.rows else float( 'nan' )
+
+    # ----------------------- ___START___: locate -------------------------
+    def locate( self, start: float = None, end: float = None ) -> Tuple[int, int]:
+        """
+        Rows of a time range, by binary search on the time index.
+
+        :param start: First time [epoch sec] (default: first row).
+        :param end: End time [epoch sec], exclusive (default: past the last row).
+        :return: (first row, end row)
+        """
+        index = self._data[ INDEX ]
+        i0    = 0         if start is None else int( np.searchsorted( index, start, 'left' ) )
+        i1    = self.rows if end   is None else int( np.searchsorted( index, end  , 'left' ) )
+        return i0, max( i0, i1 )
+
+    # ----------------------- ___START___: window -------------------------
+    def window( self, start: float = None, end: float = None, columns: Sequence[str] = None ) -> Columns:
+        """
+        Bars of [start, end) as zero-copy views.
+
+        :param columns: Columns to return (default: all).
+        :return: Column -> view
+        """
+        i0, i1 = self.locate( start, end )
+        return { name: self._data[ name ][ i0:i1 ] for name in ( columns or self.columns ) }
+
+    def to_frame( self, start: float = None, end: float = None ) -> pd.DataFrame:
+        """
+        :return: Bars of [start, end) as a DataFrame laid out like data/sample.csv (copies).
+        """
+        df = pd.DataFrame( self.window( start, end ) )
+        df[ INDEX ] = pd.to_datetime( df[ INDEX ], unit = 's' )
+        return df
+
+    # ----------------------- ___START___: append -------------------------
+    def append( self, data: Union[Columns, np.ndarray] ) -> int:
+        """
+        Append bars newer than the last stored one. Input is sorted by time
+        first; rows not newer than the last stored row, and repeated times,
+        are dropped.
+
+        :param data: Column -> values, or a (n, len(columns)) array in column order.
+        :return: Rows appended
+        """
+        if isinstance( data, np.ndarray ):
+            data = { name: data[ :, i ] for i, name in enumerate( self.columns ) }
+        missing = set( self.columns ).difference( data )
+        if missing:
+            raise ValueError( f'Missing columns {sorted(missing)}' )
+
+        time  = np.asarray( data[ INDEX ], DTYPE )
+        order = np.argsort( time, kind = 'stable' )
+        time  = time[ order ]
+        keep  = np.ones( len( time ), bool )
+        keep[ 1: ] = time[ 1: ] != time[ :-1 ]                              # Repeated times: keep the first
+        if self.rows:
+            keep &= time > self.last
+        rows  = order[ keep ]
+        if len( rows ) == 0:
+            return 0
+
+        offset = self.rows * DTYPE.itemsize
+        for name in self.columns:                                           # Past the committed rows
+            values = np.asarray( data[ name ], DTYPE )[ rows ]
+            with open( self._file( f'{name}.f8' ), 'r+b' ) as f:
+                f.seek( offset )
+                f.write( values.tobytes() )
+                f.truncate()                                                # Leftovers of a torn append
+        self._commit( list( self.columns ), self.rows + len( rows ) )
+        self.refresh()
+        return len( rows )
+
+
+class OHLCVStore( object ):
+    """
+    Per-symbol, per-granularity bar series under one directory.
+    """
+    def __init__( self, directory: str ) -> None:
+        """
+        :param directory: Root directory of the store.
+        """
+        self.directory = directory
+        makedirs( directory, exist_ok = True )
+
+    def symbols( self ) -> List[str]:
+        """
+        :return: Stored symbols (directories starting with "_" hold derived data, e.g. DatasetCatalog)
+        """
+        return sorted( d for d in listdir( self.directory )
+                       if not d.startswith( '_' ) and path.isdir( path.join( self.directory, d ) ) )
+
+    def granularities( self, symbol: str ) -> List[int]:
+        """
+        :return: Stored granularities of a symbol [sec].
+        """
+        directory = path.join( self.directory, symbol )
+        return sorted( int( g ) for g in listdir( directory ) if g.isdigit() ) if path.isdir( directory ) else []
+
+    # ----------------------- ___START___: series -------------------------
+    def series( self, symbol: str, granularity: int, columns: Sequence[str] = None ) -> Series:
+        """
+        :param symbol: Symbol such as "BTC-USD".
+        :param granularity: Bar length [sec].
+        :param columns: Create the series with these columns if it does not exist.
+        :raises FileNotFoundError: If the series does not exist and no columns are given.
+        """
+        return Series( path.join( self.directory, symbol, str( granularity ) ), columns )
+
+    def load( self, symbol: str, granularity: int, start: float = None, end: float = None ) -> Columns:
+        """
+        :return: Bars of [start, end) as zero-copy column views.
+        """
+        return self.series( symbol, granularity ).window( start, end )
+
+    # --------------------- ___START___: import_csv -----------------------
+    def import_csv( self, file: str, symbol: str, granularity: int, date_column: str = INDEX ) -> int:
+        """
+        Convert a CSV file (e.g. data/sample.csv) into a series, appending
+        to it if it exists. Every column but the date has to be numeric.
+
+        :param file: CSV file with a header row.
+        :param symbol: Symbol such as "BTC-USD".
+        :param granularity: Bar length [sec].
+        :param date_column: Column holding the bar times (dates or ISO timestamps, UTC).
+        :return: Rows appended
+        """
+        df   = pd.read_csv( file )
+        date = pd.to_datetime( df.pop( date_column ), utc = True ).dt.tz_localize( None )
+        data = { INDEX: date.to_numpy().astype( 'datetime64[s]' ).astype( DTYPE ) }
+        for name in df.columns:
+            if not pd.api.types.is_numeric_dtype( df[ name ] ):
+                raise ValueError( f'Column "{name}" of {file} is not numeric' )
+            data[ name ] = df[ name ].to_numpy( DTYPE )
+        return self.series( symbol, granularity, list( data ) ).append( data )
@@ -0,0 +1,317 @@
+#@formatter:off
+"""
+Shared-memory ring-buffer time-series store, one ring per product.
+
+Each ring holds the last `capacity` ticks (timestamp, price, size, side) as
+NumPy columns in multiprocessing.shared_memory, so memory use is fixed no
+matter how long the bot runs. There is a single writer per ring and any
+number of reader processes (indicator engine, Telegram bot, recorder...).
+
+Every tick is written twice, at slot i and slot i + capacity, into columns
+of length 2 * capacity. Any window of up to `capacity - 1` ticks is
+therefore a contiguous slice and readers get zero-copy views of it; the
+oldest held tick is left out, its slot is the next one written.
+
+Reads take no locks. The writer fills a slot before it bumps the head
+counter; a reader records the head its window ends at and can check
+afterwards whether the writer has lapped the window in the meantime
+(TickRing.is_valid), or use TickRing.read which copies and retries.
+
+Memory layout of a ring:
+    [ header: head (uint64), capacity (uint64) | time f8[2c] | price f8[2c] | size f8[2c] | side i1[2c] ]
+
+VERSION: 0.0.1
+    - ADDED     : Per-product shared-memory rings, zero-copy windows
+
+KNOWN ISSUES:
+    - Non encountered
+
+
+AUTHOR                      :   Mohammad Odeh
+DATE                        :   Oct. 18th, 2026 Year of Our Lord
+LAST CONTRIBUTION DATE      :   Oct. 18th, 2026 Year of Our Lord
+"""
+
+from    typing                      import  Dict, Iterable, List, NamedTuple # Additional type hints
+from    multiprocessing             import  shared_memory                   # Memory shared across processes
+from    multiprocessing             import  resource_tracker                # Shared memory bookkeeping
+import  sys                                                                 # Python version
+import  numpy                       as      np                              # Columns
+
+from    CoinbaseMessages            import  parse_time                      # ISO timestamp -> epoch
+
+
+def attach_shared_memory( name: str ) -> shared_memory.SharedMemory:
+    """
+    Attach to an existing segment without taking ownership of it.
+
+    Before Python 3.13, attaching registers the segment with the process'
+    resource tracker, which unlinks it when an unrelated reader exits. Child
+    processes share their parent's tracker and must leave it alone.
+    """
+    if sys.version_info >= ( 3, 13 ):
+        return shared_memory.SharedMemory( name, track = False )
+
+    shared = resource_tracker._resource_tracker._fd is not None             # Tracker inherited from the creator
+    shm    = shared_memory.SharedMemory( name )
+    if not shared:
+        resource_tracker.unregister( shm._name, 'shared_memory' )
+    return shm
+
+
+class Window( NamedTuple ):
+    """
+    Ticks [head - n, head) of a ring.
+    """
+    time    : np.ndarray
+    price   : np.ndarray
+    size    : np.ndarray
+    side    : np.ndarray
+    head    : int
+
+
+class TickRing( object ):
+    """
+    Fixed-capacity tick ring of one product.
+    """
+    HEADER  : int = 64
+    COLUMNS = ( ('time', 'f8'), ('price', 'f8'), ('size', 'f8'), ('side', 'i1') )
+
+    def __init__( self, name: str, capacity: int = None ) -> None:
+        """
+        :param name: Shared memory name (None: a unique one, when creating).
+        :param capacity: Create the ring with this many ticks; attach to an
+                         existing ring if omitted.
+        """
+        self.owner = capacity is not None
+        if self.owner:
+            size     = self.HEADER + 2 * capacity * sum( np.dtype(t).itemsize for _, t in self.COLUMNS )
+            self.shm = shared_memory.SharedMemory( name, create = True, size = size )
+        else:
+            self.shm = attach_shared_memory( name )
+
+        header = np.ndarray( (2,), np.uint64, buffer = self.shm.buf )
+        if self.owner:
+            header[:] = ( 0, capacity )
+        self._header  = header
+        self.name     = self.shm.name
+        self.capacity = int( header[1] )
+
+        offset = self.HEADER
+        for field, dtype in self.COLUMNS:                                   # Map the columns
+            column = np.ndarray( (2 * self.capacity,), dtype, buffer = self.shm.buf, offset = offset )
+            setattr( self, field, column )
+            offset += column.nbytes
+
+    @property
+    def head( self ) -> int:
+        """
+        :return: Number of ticks ever written.
+        """
+        return int( self._header[0] )
+
+    def __len__( self ) -> int:
+        return min( self.head, self.capacity )
+
+    # ----------------------- ___START___: append -------------------------
+    def append( self, t: float, price: float, size: float, side: int ) -> None:
+        """
+        Write one tick (writer side).
+        """
+        head = int( self._header[0] )
+        i    = head % self.capacity
+        j    = i + self.capacity
+        self.time [ i ] = self.time [ j ] = t
+        self.price[ i ] = self.price[ j ] = price
+        self.size [ i ] = self.size [ j ] = size
+        self.side [ i ] = self.side [ j ] = side
+        self._header[ 0 ] = head + 1                                        # Publish
+
+    # ----------------------- ___START___: extend -------------------------
+    def extend( self, t: np.ndarray, price: np.ndarray, size: np.ndarray, side: np.ndarray ) -> None:
+        """
+        Write a batch of ticks (writer side), oldest first.
+        """
+        n    = len( t )
+        head = int( self._header[0] )
+        if n > self.capacity:                                               # Only the newest ones fit
+            c = self.capacity
+            t, price, size, side = t[-c:], price[-c:], size[-c:], side[-c:]
+            head += n - c
+            n     = c
+        i    = ( head + np.arange(n) ) % self.capacity
+        j    = i + self.capacity
+        for column, values in ( (self.time, t), (self.price, price), (self.size, size), (self.side, side) ):
+            column[ i ] = values
+            column[ j ] = values
+        self._header[ 0 ] = head + n                                        # Publish
+
+    # ----------------------- ___START___: window -------------------------
+    def window( self, n: int = None, head: int = None ) -> Window:
+        """
+        Zero-copy views of the newest ticks (reader side).
+
+        :param n: Number of ticks (default and max: capacity - 1).
+        :param head: End the window here instead of at the current head.
+        :return: Window; check is_valid() once done with it.
+        """
+        head = self.head if head is None else head
+        s    = self._span( n, head )
+        return Window( self.time[s], self.price[s], self.size[s], self.side[s], head )
+
+    def _span( self, n: int, head: int ) -> slice:
+        """
+        :return: Contiguous column slice of up to n ticks ending at head.
+        """
+        n    = min( head, self.capacity - 1 ) if n is None else min( n, head, self.capacity - 1 )
+        end  = head % self.capacity
+        if end < n:                                                         # Use the mirrored half
+            end += self.capacity
+        return slice( end - n, end )
+
+    # ----------------------- ___START___: since --------------------------
+    def since( self, head: int ) -> Window:
+        """
+        Zero-copy views of the ticks written after a previous window's head.
+        """
+        now = self.head
+        return self.window( now - head, now )
+
+    # ---------------------- ___START___: is_valid ------------------------
+    def is_valid( self, window: Window ) -> bool:
+        """
+        :return: True if the writer has not overwritten any part of window.
+        """
+        start = window.head - len( window.time )
+        return self.head - start < self.capacity                            # Slot being written is excluded
+
+    # ------------------------ ___START___: read --------------------------
+    def read( self, n: int = None, retries: int = 10 ) -> Window:
+        """
+        Consistent copy of the newest ticks.
+        """
+        for _ in range( retries ):
+            w = self.window( n )
+            copy = Window( w.time.copy(), w.price.copy(), w.size.copy(), w.side.copy(), w.head )
+            if self.is_valid( w ):
+                return copy
+        raise RuntimeError( f'Writer kept lapping the reader of "{self.name}"' )
+
+    # ------------------------ ___START___: close -------------------------
+    def close( self ) -> None:
+        """
+        Detach from the ring; the creator also frees it.
+        """
+        for field, _ in self.COLUMNS:                                       # Release buffer exports
+            delattr( self, field )
+        del self._header
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+class TickStore( object ):
+    """
+    Tick rings of a set of products, sharing a name prefix.
+    """
+    def __init__( self, product_ids: Iterable[str], capacity: int = None, prefix: str = 'cpticks' ) -> None:
+        """
+        :param product_ids: Products to hold.
+        :param capacity: Create rings with this many ticks each (writer);
+                         attach to existing rings if omitted (reader).
+        :param prefix: Shared memory name prefix.
+        """
+        self.prefix = prefix
+        self.rings  : Dict[str, TickRing] = { p: TickRing( f'{prefix}_{p}', capacity ) for p in product_ids }
+
+    def __getitem__( self, product_id: str ) -> TickRing:
+        return self.rings[ product_id ]
+
+    @property
+    def nbytes( self ) -> int:
+        """
+        :return: Shared memory held by the store.
+        """
+        return sum( ring.shm.size for ring in self.rings.values() )
+
+    # ------------------------ ___START___: handle -------------------------
+    async def handle( self, msg: dict ) -> None:
+        """
+        Websocket handler for "ticker" and "match" messages.
+        """
+        size = msg.get( 'last_size' ) or msg.get( 'size' )
+        ring = self.rings.get( msg['product_id'] )
+        if ring is None or size is None or 'time' not in msg:
+            return
+        ring.append( parse_time( msg['time'] ), float( msg['price'] ), float( size ),
+                     1 if msg.get( 'side' ) == 'buy' else -1 )
+
+    # ------------------------ ___START___: attach -------------------------
+    def attach( self, ws, channel: str = 'matches' ) -> None:
+        """
+        Store trades from a CoinbaseAPI.Websocket.
+
+        :param channel: "matches" or "ticker" (subscribe to one, not both).
+        """
+        if channel == 'matches':                                            # Not last_match: replayed on (re)subscribe
+            channel = 'match'
+        ws.register_handler( channel, self.handle )
+
+    # ----------------------- ___START___: consume -------------------------
+    def consume( self, ticks: np.ndarray, product_ids: List[str] ) -> None:
+        """
+        Store a batch of normalized ticks from CoinbaseShards.ShardedFeed.
+
+        :param ticks: Structured array with TickChannel.DTYPE fields.
+        :param product_ids: Product index -> product id.
+        """
+        for product in np.unique( ticks['product'] ):
+            ring = self.rings.get( product_ids[product] )
+            if ring is not None:
+                sel = ticks[ ticks['product'] == product ]
+                ring.extend( sel['time'], sel['price'], sel['size'], sel['side'] )
+
+    # ------------------------ ___START___: close --------------------------
+    def close( self ) -> None:
+        for ring in self.rings.values():
+            ring.close()
+
+    def __enter__( self ):
+        return self
+
+    def __exit__( self, type, value, tb ):
+        self.close()
+
+
+#%% ----------------- ___START___: Setup script and run -----------------
+
+if __name__ == '__main__':
+    import  asyncio
+    import  orjson
+    import  multiprocessing
+    from    time                    import  sleep
+    from    CoinbaseAPI             import  Websocket
+
+    products = [ 'BTC-USD', 'ETH-USD' ]
+
+    def reader():
+        store = TickStore( products )                                       # Attach
+        while True:
+            w = store[ 'BTC-USD' ].window( 100 )
+            if len( w.price ):
+                vwap = ( w.price * w.size ).sum() / w.size.sum()
+                if store[ 'BTC-USD' ].is_valid( w ):
+                    print( f'BTC-USD last 100 ticks VWAP: {vwap:.2f}' )
+            sleep( 1 )
+
+    with TickStore( products, capacity = 100_000 ) as store:
+        ws = Websocket()
+        store.attach( ws, 'matches' )
+        multiprocessing.Process( target = reader, daemon = True ).start()
+        req = { "type": "subscribe", "product_ids": products, "channels": ["matches"] }
+        try:
+            asyncio.run( ws.connect( orjson.dumps(req) ) )
+        except KeyboardInterrupt:
+            print( "Interrupt detected" )
+
+#   ----------------- ___ END ___: Setup script and run -----------------